@@ -0,0 +1,189 @@
+"""Choix automatique d'un algorithme de tri selon la forme des données.
+
+Un seul passage linéaire mesure le pré-tri de l'entrée : nombre de suites
+monotones (croissantes ou décroissantes, une égalité prolonge la suite en
+cours), proportion d'inversions (estimée sur un échantillon de paires) et
+étendue des clés. La décision suit alors des règles simples :
+1. entiers de faible étendue : tri par dénombrement ;
+2. entiers d'étendue modérée : tri par base ;
+3. peu de suites longues (entrée triée, inversée, en « tuyau d'orgue »...) :
+   fusion naturelle avec galop, linéaire sur des suites déjà en ordre ;
+4. sinon : introsort.
+
+Les tris d'entiers vectorisés battent la fusion naturelle (en Python) dès
+qu'il y a plus d'une suite : pour des entiers, elle n'est retenue que pour
+une liste déjà triée (un seul passage), ou si les clés sont trop étendues
+pour le tri par base. L'étendue suffit alors le plus souvent à décider, et
+les suites ne sont mesurées qu'au-delà.
+
+Le tri est toujours confié à l'algorithme choisi dans ALGORITHMS : les
+durées d'Auto se comparent donc directement à celles des autres
+algorithmes. Pour des entiers, les mesures sont vectorisées sur leurs clés
+NumPy.
+"""
+import random
+
+import numpy as np
+
+from sorting_algorithms import COUNTING_SORT_MAX_RANGE, RADIX_BITS
+
+# En dessous, la mesure coûterait plus que le tri : insertion puis fusion directement
+AUTO_SMALL = 64
+
+# Longueur moyenne des suites à partir de laquelle la fusion naturelle l'emporte (algorithmes Python)
+AUTO_RUN_LENGTH = 64
+
+# Nombre maximal de passes du tri par base (étendue des clés < 2 ** (RADIX_BITS * passes))
+AUTO_RADIX_MAX_PASSES = 4
+
+# Étendue des clés jusqu'à laquelle le tri par dénombrement l'emporte : AUTO_COUNTING_RANGE
+# valeurs par élément, au moins AUTO_COUNTING_MIN_RANGE (au plus COUNTING_SORT_MAX_RANGE)
+AUTO_COUNTING_RANGE = 8
+AUTO_COUNTING_MIN_RANGE = 1 << 16
+
+# Paires tirées pour estimer la proportion d'inversions
+SAMPLE_PAIRS = 1024
+
+MERGE, RADIX, COUNTING, INTROSORT = "Natural Merge Sort", "Radix Sort", "Counting Sort", "Quick Sort"
+
+# Nom de l'algorithme automatique dans ALGORITHMS
+AUTO = "Auto"
+
+
+def integer_keys(arr):
+    """Clés NumPy des entiers de arr (tableau d'entiers ou liste d'int), None sinon"""
+    if isinstance(arr, np.ndarray):
+        return arr if arr.dtype.kind in "iu" else None
+    if not len(arr) or type(arr[0]) is not int:
+        return None
+    try:
+        keys = np.asarray(arr)
+    except (OverflowError, ValueError):
+        return None
+    # Un seul élément non entier (flottant, grand entier, objet) change le type du tableau
+    return keys if keys.dtype.kind == "i" else None
+
+
+# Tirages fixes (entre 0 et 1) des paires échantillonnées : créer un générateur à chaque mesure coûterait
+# autant que la mesure elle-même sur quelques milliers d'éléments
+_PAIR_DRAWS = np.random.default_rng(0).random((2, SAMPLE_PAIRS))
+
+
+def _sample_pairs(n):
+    """Indices (i, j), i < j, d'au plus SAMPLE_PAIRS paires tirées de façon reproductible"""
+    first, second = (_PAIR_DRAWS[:, :min(SAMPLE_PAIRS, n)] * n).astype(np.intp)
+    keep = first != second
+    return np.minimum(first, second)[keep], np.maximum(first, second)[keep]
+
+
+def _count_runs(descending, ascending):
+    """Nombre de suites monotones découpées de gauche à droite (comme _profile_generic).
+
+    descending[i] / ascending[i] : la paire (i, i + 1) descend / monte. Une
+    égalité prolonge la suite en cours ; la paire qui rompt une suite ne fait
+    partie d'aucune, et la suite suivante prend le sens de la paire d'après.
+    """
+    rising = ascending[descending | ascending]
+    if not len(rising):
+        return 1
+    # Segments de paires de même sens : chacun ouvre une suite, sauf un segment
+    # d'une seule paire qui sert de rupture (un sur deux dans une série de tels segments)
+    starts = np.flatnonzero(np.concatenate(([True], rising[1:] != rising[:-1])))
+    single = np.diff(np.append(starts, len(rising))) == 1
+    index = np.arange(len(single), dtype=np.int32)
+    series = np.maximum.accumulate(np.where(single & ~np.concatenate(([False], single[:-1])), index, 0))
+    breaking = single & ((((index - series) & 1) == 0) != (series == 0))
+    breaking[-1] = False
+    return len(single) - int(np.count_nonzero(breaking))
+
+
+def _profile_keys(keys):
+    """Mesures vectorisées sur des clés entières NumPy"""
+    descending = keys[1:] < keys[:-1]
+    first, second = _sample_pairs(len(keys))
+    return {"runs": _count_runs(descending, keys[1:] > keys[:-1]),
+            "inversions": float(np.mean(keys[first] > keys[second])) if len(first) else 0.0,
+            "integers": True, "key_range": int(keys.max()) - int(keys.min()) + 1}
+
+
+def _profile_generic(arr):
+    """Mesures par un passage Python, pour des éléments quelconques (flottants, chaînes, objets)"""
+    n = len(arr)
+    runs, direction = 1, 0
+    previous = arr[0]
+    for value in arr[1:]:
+        step = -1 if value < previous else 1 if previous < value else 0
+        if step and not direction:
+            direction = step
+        elif step and step != direction:
+            # Rupture : la suite suivante commence à value, son sens reste à déterminer
+            runs += 1
+            direction = 0
+        previous = value
+    rng = random.Random(0)
+    pairs = [sorted(rng.sample(range(n), 2)) for _ in range(SAMPLE_PAIRS)]
+    return {"runs": runs,
+            "inversions": sum(arr[j] < arr[i] for i, j in pairs) / len(pairs),
+            "integers": False, "key_range": None}
+
+
+def profile(arr, keys=None):
+    """Mesures du pré-tri de arr : taille, suites, inversions, étendue des clés"""
+    n = len(arr)
+    if n < 2:
+        measures = {"runs": n, "inversions": 0.0, "integers": keys is not None, "key_range": None}
+    elif keys is not None:
+        measures = _profile_keys(keys)
+    else:
+        measures = _profile_generic(arr)
+    measures["size"] = n
+    return measures
+
+
+def _choose_integers(n, key_range):
+    """Tri sans comparaison adapté à n entiers d'étendue key_range : (nom, raison), None si aucun"""
+    if key_range <= min(COUNTING_SORT_MAX_RANGE, max(AUTO_COUNTING_MIN_RANGE, AUTO_COUNTING_RANGE * n)):
+        return COUNTING, f"entiers d'étendue {key_range} pour {n} éléments"
+    passes = max(1, -(-(key_range - 1).bit_length() // RADIX_BITS))
+    if passes <= AUTO_RADIX_MAX_PASSES:
+        return RADIX, f"entiers d'étendue {key_range} ({passes} passe(s) de {RADIX_BITS} bits)"
+    return None
+
+
+def choose(measures):
+    """Renvoie (nom de l'algorithme, raison) pour des mesures données par profile()"""
+    n = measures["size"]
+    runs = measures["runs"]
+    choice = measures["integers"] and _choose_integers(n, measures["key_range"])
+    if choice:
+        return choice
+    if runs * AUTO_RUN_LENGTH <= n:
+        return MERGE, f"{runs} suite(s) monotone(s), longueur moyenne {n // runs}"
+    return INTROSORT, f"{runs} suites, {measures['inversions']:.0%} d'inversions estimées : pas de structure exploitable"
+
+
+def decide(arr, keys=None):
+    """Mesure arr et choisit l'algorithme ; renvoie {"algorithm", "reason", "measures"}.
+
+    keys : clés entières de arr déjà calculées par integer_keys (calculées ici sinon).
+    """
+    n = len(arr)
+    if n <= AUTO_SMALL:
+        measures = {"size": n}
+        algorithm, reason = MERGE, f"petite entrée ({n} éléments) : insertion puis fusion"
+    else:
+        keys = integer_keys(arr) if keys is None else keys
+        key_range = None if keys is None else int(keys.max()) - int(keys.min()) + 1
+        choice = key_range and _choose_integers(n, key_range)
+        if choice and isinstance(arr, list) and not (keys[1:] < keys[:-1]).any():
+            # Liste déjà triée : un seul passage de la fusion naturelle, sans conversion ni écriture
+            measures = {"size": n, "integers": True, "key_range": key_range, "runs": 1}
+            choice = MERGE, "liste d'entiers déjà triée : un seul passage"
+        elif choice:
+            # L'étendue des clés suffit : inutile de compter les suites
+            measures = {"size": n, "integers": True, "key_range": key_range}
+        else:
+            measures = profile(arr, keys)
+            choice = choose(measures)
+        algorithm, reason = choice
+    return {"algorithm": algorithm, "reason": reason, "measures": measures}
@@ -0,0 +1,123 @@
+"""Exécution des tâches longues (tris, benchmarks) sur un fil d'exécution secondaire.
+
+La tâche tourne hors de la boucle de l'interface, qui reste libre d'afficher
+ses images à cadence fixe. La communication passe par une file : la tâche y
+dépose ses événements (progression, opérations, résultats partiels) et
+l'interface les relit à chaque image. Pause et annulation sont des
+drapeaux que la tâche consulte à ses points de contrôle (checkpoint) : entre
+deux travaux, ou régulièrement depuis un crochet draw_swap.
+"""
+import queue
+import threading
+
+# Nombre d'opérations entre deux points de contrôle d'un crochet checked_swap
+CHECK_INTERVAL = 4096
+
+DONE = "done"
+
+
+class TaskCancelled(Exception):
+    """Levée dans la tâche, à un point de contrôle, quand elle a été annulée"""
+
+
+class BackgroundTask:
+    """Tâche function(task, *args, **kwargs) exécutée sur un fil secondaire.
+
+    Côté tâche : report(kind, value) pour envoyer un événement, checkpoint()
+    pour attendre pendant une pause ou s'arrêter en cas d'annulation.
+    Côté interface : poll(), pause(), resume(), cancel(), puis result,
+    error et cancelled une fois la tâche terminée.
+    """
+
+    def __init__(self, function, *args, **kwargs):
+        self.events = queue.Queue()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.finished = False
+        self._running = threading.Event()
+        self._running.set()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(function, args, kwargs), daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self, function, args, kwargs):
+        try:
+            self.result = function(self, *args, **kwargs)
+        except TaskCancelled:
+            self.cancelled = True
+        except Exception as error:  # relancée dans le fil de l'interface par poll()
+            self.error = error
+        finally:
+            self.events.put((DONE, None))
+
+    # Côté tâche
+
+    def report(self, kind, value=None):
+        self.events.put((kind, value))
+
+    def checkpoint(self):
+        """Attend tant que la tâche est en pause ; lève TaskCancelled si elle a été annulée"""
+        self._running.wait()
+        if self._cancel.is_set():
+            raise TaskCancelled
+
+    def keep_going(self):
+        """Variante de checkpoint() pour les fonctions idle : renvoie False si la tâche est annulée"""
+        try:
+            self.checkpoint()
+        except TaskCancelled:
+            return False
+        return True
+
+    def checked_swap(self, interval=CHECK_INTERVAL):
+        """Crochet draw_swap qui échange normalement et passe un point de contrôle toutes les interval opérations.
+
+        Le nombre d'opérations déjà effectuées est envoyé avec l'événement "operations".
+        """
+        count = 0
+
+        def hook(arr, i, j):
+            nonlocal count
+            if i != j:
+                arr[i], arr[j] = arr[j], arr[i]
+            count += 1
+            if count % interval == 0:
+                self.report("operations", count)
+                self.checkpoint()
+        return hook
+
+    # Côté interface
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def cancel(self):
+        self._cancel.set()
+        self._running.set()  # une tâche en pause doit se réveiller pour s'arrêter
+
+    def poll(self):
+        """Renvoie les événements en attente, sans bloquer ; relance l'erreur de la tâche à la fin"""
+        events = []
+        while True:
+            try:
+                kind, value = self.events.get_nowait()
+            except queue.Empty:
+                return events
+            if kind == DONE:
+                self._thread.join()
+                self.finished = True
+                if self.error is not None:
+                    raise self.error
+            else:
+                events.append((kind, value))
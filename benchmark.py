@@ -0,0 +1,561 @@
+"""Moteur de benchmark sans affichage pour les algorithmes de tri.
+
+Ce module ne dépend ni de pygame ni de matplotlib : il peut tourner sur une
+machine sans écran (serveur de build, CI...).
+"""
+import gc
+import heapq
+import json
+import math
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from bisect import insort
+
+import numpy as np
+
+from adaptive import AUTO, decide
+from distributions import generate, generate_array
+from instrumentation import count_operations
+from networks import bitonic, odd_even_transposition
+from parallel_sort import parallel_merge_sort, sample_sort
+from selection import SELECTION_RATIOS, SELECTIONS
+from sorting_algorithms import ALGORITHMS
+from storage import bytes_per_element, copy_storage, make_storage
+from streaming import SortedContainer, kway_merge
+
+# Nombre de points (les plus grandes tailles) utilisés pour ajuster la pente de croissance
+FIT_POINTS = 4
+
+# Mesures de démarrage : code exécuté dans un interpréteur neuf, chronométré de bout en bout
+STARTUP_PROBES = {
+    "import sorting_algorithms": "import sorting_algorithms",
+    "import benchmark": "import benchmark",
+    "import visualizer": "import visualizer",
+    "première image": "from visualizer import SortVisualizer; SortVisualizer(headless=True).draw_menu()",
+}
+HEAVY_MODULES = ("numpy", "pygame", "matplotlib")
+
+# Moteurs parallèles comparés par scaling_benchmark (tableaux NumPy, nombre de processus)
+PARALLEL_ENGINES = {
+    "Parallel Merge Sort": parallel_merge_sort,
+    "Sample Sort": sample_sort,
+}
+
+
+def generate_input(size, seed=None, max_value=1000000, distribution="uniform"):
+    """Génère une liste reproductible d'entiers (voir distributions.DISTRIBUTIONS)"""
+    return generate(distribution, size, seed, max_value)
+
+
+def percentile(values, q):
+    """Percentile q (entre 0 et 100) par interpolation linéaire"""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile() d'une liste vide")
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def summarize(times_ns):
+    """Calcule les statistiques d'une série de mesures (en nanosecondes)"""
+    return {
+        "runs": len(times_ns),
+        "min": min(times_ns),
+        "median": statistics.median(times_ns),
+        "p95": percentile(times_ns, 95),
+        "stddev": statistics.stdev(times_ns) if len(times_ns) > 1 else 0.0,
+    }
+
+
+def time_sort(sorting_function, data):
+    """Mesure une seule exécution du tri sur une copie de data (même stockage), en nanosecondes"""
+    arr = copy_storage(data)
+    gc_was_enabled = gc.isenabled()
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter_ns()
+        sorting_function(arr)
+        elapsed = time.perf_counter_ns() - start
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return elapsed, arr
+
+
+def _null_sort(arr, draw_swap=None):
+    """Tri vide : sert à mesurer le bruit du harnais et de l'interpréteur"""
+    return None
+
+
+def _traced_peak(sorting_function, data):
+    """Pic et mémoire retenue (en octets) au-dessus de la mémoire tracée avant le tri"""
+    arr = copy_storage(data)  # la copie des données n'est pas comptée
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    sorting_function(arr)
+    current, peak = tracemalloc.get_traced_memory()
+    return peak - before, current - before
+
+
+def measure_memory(sorting_function, data):
+    """Passe mémoire, distincte de la passe de chronométrage.
+
+    Renvoie un dictionnaire (valeurs en octets) :
+    - peak : pic d'allocation pendant le tri
+    - noise : pic mesuré pour un tri vide (appel, harnais, interpréteur)
+    - auxiliary : allocations propres à l'algorithme, peak - noise
+      (par exemple les tranches left/right de merge_sort)
+    - retained : mémoire encore allouée une fois le tri terminé
+    - bytes_per_element : taille des données elles-mêmes, par élément,
+      dans leur stockage (voir storage.py)
+    """
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    try:
+        noise = _traced_peak(_null_sort, data)[0]
+        peak, retained = _traced_peak(sorting_function, data)
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+    return {
+        "peak": peak,
+        "noise": noise,
+        "auxiliary": max(0, peak - noise),
+        "retained": max(0, retained),
+        "bytes_per_element": bytes_per_element(data),
+    }
+
+
+def benchmark_algorithm(sorting_function, data, repeats=5, warmup=1):
+    """Exécute warmup tours non mesurés puis repeats tours mesurés.
+
+    Le résultat du premier tour est vérifié : une erreur est levée si la
+    liste obtenue n'est pas triée.
+    """
+    if repeats < 1:
+        raise ValueError("repeats doit être au moins égal à 1")
+    expected = sorted(data)
+    for _ in range(warmup):
+        time_sort(sorting_function, data)
+    times_ns = []
+    for run in range(repeats):
+        elapsed, result = time_sort(sorting_function, data)
+        if run == 0 and list(result) != expected:
+            raise RuntimeError(f"{sorting_function.__name__} n'a pas trié les données")
+        times_ns.append(elapsed)
+    stats = summarize(times_ns)
+    stats["times_ns"] = times_ns
+    return stats
+
+
+def fit_power_law(sizes, times):
+    """Ajuste times ≈ coefficient * size ** exponent par moindres carrés en log-log.
+
+    Renvoie (exponent, coefficient) ; exponent est la pente empirique de
+    croissance (1 pour un tri linéaire, 2 pour un tri quadratique...).
+    """
+    if len(sizes) < 2:
+        raise ValueError("il faut au moins deux points pour ajuster une pente")
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in times]
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        raise ValueError("les tailles doivent être distinctes")
+    exponent = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+    return exponent, math.exp(mean_y - exponent * mean_x)
+
+
+def adaptive_sweep(sorting_function, budget=2.0, start_size=64, growth=2.0, max_size=10 ** 7,
+                   repeats=3, warmup=1, seed=0, fit_points=FIT_POINTS, on_point=None,
+                   distribution="uniform", cached=None):
+    """Fait croître la taille géométriquement tant que le budget de temps (s) le permet.
+
+    Avant chaque nouvelle taille, le coût est prévu à partir de la pente
+    log-log des derniers points (2 tant qu'il n'y en a qu'un) : les tris
+    quadratiques s'arrêtent donc bien plus tôt que les tris en n log n.
+    Renvoie {"points": [...], "exponent": ..., "coefficient": ...} où chaque
+    point est le résumé de benchmark_algorithm complété par "size" et
+    "elapsed" (durée de la mesure, s).
+
+    cached : {taille: point} déjà mesurés (voir benchmark_cache). Ces tailles
+    ne sont pas remesurées ; leur point est repris, marqué "cached", et sa
+    durée compte dans le budget comme si elle venait d'être mesurée : le
+    balayage s'arrête donc aux mêmes tailles.
+    """
+    points = []
+    spent = 0.0
+    size = start_size
+    while size <= max_size:
+        if cached and size in cached:
+            stats = dict(cached[size], cached=True)
+            elapsed = stats["elapsed"]
+        else:
+            data = generate_input(size, seed, distribution=distribution)
+            started = time.perf_counter()
+            stats = benchmark_algorithm(sorting_function, data, repeats, warmup)
+            elapsed = time.perf_counter() - started
+            stats["size"] = size
+            stats["elapsed"] = elapsed
+        spent += elapsed
+        points.append(stats)
+        if on_point:
+            on_point(stats)
+
+        next_size = max(size + 1, int(size * growth))
+        recent = points[-fit_points:]
+        if len(recent) >= 2:
+            exponent = fit_power_law([p["size"] for p in recent], [p["median"] for p in recent])[0]
+            exponent = max(exponent, 1.0)  # les petites tailles sous-estiment la croissance
+        else:
+            exponent = 2.0
+        if spent + elapsed * (next_size / size) ** exponent > budget:
+            break
+        size = next_size
+
+    sweep = {"points": points, "distribution": distribution, "exponent": None, "coefficient": None}
+    if len(points) >= 2:
+        recent = points[-fit_points:]
+        sweep["exponent"], sweep["coefficient"] = fit_power_law(
+            [p["size"] for p in recent], [p["median"] / 1e9 for p in recent])
+    return sweep
+
+
+def run_benchmark(algorithm_names=None, sizes=(100, 1000), repeats=5, warmup=1, seed=0, progress=None,
+                  memory=False, count=False, distributions=("uniform",), storages=("list",)):
+    """Exécute le benchmark pour chaque combinaison (algorithme, taille, distribution, stockage).
+
+    Tous les algorithmes reçoivent exactement les mêmes données pour une
+    taille et une distribution données, copiées dans chaque stockage de
+    storages (voir storage.STORAGES). Avec memory=True (resp. count=True),
+    une passe mémoire (resp. de comptage des opérations) séparée est ajoutée
+    après le chronométrage. Renvoie une liste de dictionnaires, un par
+    combinaison.
+    """
+    algorithm_names = list(algorithm_names or ALGORITHMS)
+    results = []
+    for size in sizes:
+        for distribution in distributions:
+            values = generate_input(size, seed, distribution=distribution)
+            for storage in storages:
+                data = make_storage(values, storage)
+                for name in algorithm_names:
+                    if progress:
+                        progress(name, size)
+                    stats = benchmark_algorithm(ALGORITHMS[name], data, repeats, warmup)
+                    if memory:
+                        stats["memory"] = measure_memory(ALGORITHMS[name], data)
+                    if count:
+                        stats["counts"] = count_operations(ALGORITHMS[name], data)[1].as_dict()
+                    stats["algorithm"] = name
+                    stats["size"] = size
+                    stats["distribution"] = distribution
+                    stats["storage"] = storage
+                    if name == AUTO:
+                        stats["decision"] = decide(data)
+                    results.append(stats)
+    return results
+
+
+def auto_margins(results):
+    """Écart entre Auto et le meilleur des autres algorithmes, pour chaque triplet (taille, distribution, stockage).
+
+    results : résumés de run_benchmark. Renvoie une liste de dictionnaires :
+    taille, distribution, stockage, meilleur algorithme, médianes, rapport Auto /
+    meilleur et décision prise par Auto.
+    """
+    groups = {}
+    for stats in results:
+        groups.setdefault((stats["size"], stats["distribution"], stats.get("storage", "list")), []).append(stats)
+    margins = []
+    for (size, distribution, storage), group in groups.items():
+        auto = [stats for stats in group if stats["algorithm"] == AUTO]
+        others = [stats for stats in group if stats["algorithm"] != AUTO]
+        if not auto or not others:
+            continue
+        best = min(others, key=lambda stats: stats["median"])
+        margins.append({
+            "size": size,
+            "distribution": distribution,
+            "storage": storage,
+            "best": best["algorithm"],
+            "best_median": best["median"],
+            "auto_median": auto[0]["median"],
+            "ratio": auto[0]["median"] / best["median"],
+            "decision": auto[0].get("decision"),
+        })
+    return margins
+
+
+def _startup_probe(code):
+    """Exécute code dans un nouvel interpréteur ; renvoie sa durée (ns) et les gros modules chargés"""
+    script = (
+        "import time\n"
+        "start = time.perf_counter_ns()\n"
+        f"{code}\n"
+        "elapsed = time.perf_counter_ns() - start\n"
+        "import json, sys\n"
+        f"print(json.dumps([elapsed, [m for m in {HEAVY_MODULES!r} if m in sys.modules]]))\n"
+    )
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT="1", SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    output = subprocess.run([sys.executable, "-c", script], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=env, capture_output=True, text=True, check=True).stdout
+    elapsed, modules = json.loads(output.strip().splitlines()[-1])
+    return elapsed, modules
+
+
+def startup_metrics(repeats=5, probes=None):
+    """Temps d'import des modules et temps jusqu'à la première image (mode sans fenêtre).
+
+    Chaque mesure se fait dans un interpréteur neuf (caches d'import froids
+    côté Python, mais fichiers .pyc déjà compilés). Renvoie une liste de
+    dictionnaires : statistiques des durées et gros modules chargés.
+    """
+    results = []
+    for label, code in (probes or STARTUP_PROBES).items():
+        times_ns = []
+        for _ in range(repeats):
+            elapsed, modules = _startup_probe(code)
+            times_ns.append(elapsed)
+        stats = summarize(times_ns)
+        stats["times_ns"] = times_ns
+        stats["probe"] = label
+        stats["modules"] = modules
+        results.append(stats)
+    return results
+
+
+def worker_ladder(max_workers=None):
+    """Nombres de processus essayés : puissances de 2, puis le nombre de cœurs"""
+    max_workers = max_workers or os.cpu_count() or 1
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def _time_engine(engine, data, workers, repeats):
+    times_ns = []
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter_ns()
+        engine(data, workers)
+        times_ns.append(time.perf_counter_ns() - start)
+    return times_ns
+
+
+def scaling_benchmark(size=10 ** 7, worker_counts=None, repeats=3, seed=0, distribution="uniform"):
+    """Accélération et efficacité des tris parallèles selon le nombre de processus.
+
+    La référence est le tri par fusion sur un seul cœur : parallel_merge_sort
+    avec un processus, exécuté dans le processus courant (les mêmes
+    primitives NumPy, sans mémoire partagée ni pool). Les temps sont pris
+    sur des tableaux NumPy, sans conversion depuis une liste, et incluent le
+    démarrage du pool. accélération = référence / temps, efficacité =
+    accélération / processus.
+    """
+    data = generate_array(distribution, size, seed)
+    baseline = summarize(_time_engine(parallel_merge_sort, data, 1, repeats))["median"]
+    results = []
+    for name, engine in PARALLEL_ENGINES.items():
+        for workers in worker_counts or worker_ladder():
+            times_ns = _time_engine(engine, data, workers, repeats)
+            stats = summarize(times_ns)
+            speedup = baseline / stats["median"]
+            stats.update(algorithm=name, size=size, distribution=distribution, workers=workers, times_ns=times_ns,
+                         baseline=baseline, speedup=speedup, efficiency=speedup / workers)
+            results.append(stats)
+    return results
+
+
+def selection_benchmark(size=10 ** 5, ratios=SELECTION_RATIOS, repeats=5, warmup=1, seed=0, distribution="uniform",
+                        baseline="Quick Sort"):
+    """Sélections (nth_element, top_k, partial_sort) comparées à un tri complet, selon k / n.
+
+    La référence est un tri complet par baseline (même langage, mêmes
+    données). accélération = médiane du tri complet / médiane de la
+    sélection. Le résultat du premier tour de chaque sélection est vérifié.
+    """
+    data = generate_input(size, seed, distribution=distribution)
+    expected = sorted(data)
+    full = benchmark_algorithm(ALGORITHMS[baseline], data, repeats, warmup)["median"]
+    results = []
+    for ratio in ratios:
+        k = min(size, max(1, round(ratio * size)))
+        for name, select in SELECTIONS.items():
+            # nth_element attend un rang : celui du k-ième plus petit élément
+            rank = k - 1 if name == "nth_element" else k
+            wanted = expected[rank:rank + 1] if name == "nth_element" else expected[:k]
+
+            def run(arr):
+                select(arr, rank)
+            for _ in range(warmup):
+                time_sort(run, data)
+            times_ns = []
+            for repeat in range(repeats):
+                elapsed, arr = time_sort(run, data)
+                got = arr[rank:rank + 1] if name == "nth_element" else arr[:k]
+                if repeat == 0 and got != wanted:
+                    raise RuntimeError(f"{name} n'a pas sélectionné les {k} plus petits éléments")
+                times_ns.append(elapsed)
+            stats = summarize(times_ns)
+            stats.update(operation=name, size=size, distribution=distribution, k=k, ratio=k / size,
+                         times_ns=times_ns, baseline=baseline, full_sort=full, speedup=full / stats["median"])
+            results.append(stats)
+    return results
+
+
+def _sort_everything(shards):
+    """Référence des fusions : tout lire puis tout trier avant de produire le premier élément"""
+    yield from sorted(value for shard in shards for value in shard)
+
+
+def _sorted_list_insert(batches):
+    """Référence des conteneurs : une seule liste Python, insertion par bisect.insort"""
+    values = []
+    for batch in batches:
+        for value in batch:
+            insort(values, value)
+        yield values
+
+
+def _container_add(batches):
+    container = SortedContainer()
+    for batch in batches:
+        for value in batch:
+            container.add(value)
+        yield container
+
+
+def _container_update(batches):
+    container = SortedContainer()
+    for batch in batches:
+        container.update(batch)
+        yield container
+
+
+# Moteurs de streaming_benchmark : fusion de suites triées, puis insertion continue d'éléments
+MERGE_ENGINES = {
+    "kway_merge": lambda shards: kway_merge(*shards),
+    "heapq.merge": lambda shards: heapq.merge(*shards),
+    "sorted (tout d'abord)": lambda shards: _sort_everything(shards),
+}
+INSERT_ENGINES = {
+    "SortedContainer.update": _container_update,
+    "SortedContainer.add": _container_add,
+    "liste + insort": _sorted_list_insert,
+}
+
+
+def _time_stream(stream, size):
+    """Temps (ns) jusqu'au premier élément disponible et jusqu'au dernier, sur un itérateur de size éléments"""
+    gc.collect()
+    start = time.perf_counter_ns()
+    first = next(stream)
+    first_ns = time.perf_counter_ns() - start
+    count = 1
+    for _ in stream:
+        count += 1
+    total_ns = time.perf_counter_ns() - start
+    if count != size:
+        raise RuntimeError(f"{count} éléments produits au lieu de {size}")
+    return first_ns, total_ns, first
+
+
+def streaming_benchmark(size=10 ** 5, shards=16, batch=1000, repeats=5, seed=0, distribution="uniform"):
+    """Débit (éléments / s) et latence jusqu'au premier élément des moteurs de tri en flux.
+
+    Fusion : size éléments répartis en shards suites triées, lues par des
+    générateurs. Insertion : les mêmes éléments arrivent par lots de batch ;
+    le premier élément est disponible quand le premier lot est inséré.
+    """
+    data = generate_input(size, seed, distribution=distribution)
+    bounds = [size * k // shards for k in range(shards + 1)]
+    sorted_shards = [sorted(data[low:high]) for low, high in zip(bounds, bounds[1:])]
+    batches = [data[start:start + batch] for start in range(0, size, batch)]
+    expected = sorted(data)
+    results = []
+    for kind, engines in (("fusion", MERGE_ENGINES), ("insertion", INSERT_ENGINES)):
+        for name, engine in engines.items():
+            firsts, totals = [], []
+            for run in range(repeats):
+                if kind == "fusion":
+                    stream = engine([iter(shard) for shard in sorted_shards])
+                    first_ns, total_ns, first = _time_stream(stream, size)
+                    if run == 0 and first != expected[0]:
+                        raise RuntimeError(f"{name} : premier élément incorrect")
+                else:
+                    first_ns, total_ns, container = _time_stream(engine(batches), len(batches))
+                    if run == 0 and list(container) != expected:
+                        raise RuntimeError(f"{name} n'a pas gardé les éléments triés")
+                firsts.append(first_ns)
+                totals.append(total_ns)
+            stats = summarize(totals)
+            stats.update(engine=name, kind=kind, size=size, distribution=distribution,
+                         shards=shards if kind == "fusion" else None, batch=batch if kind == "insertion" else None,
+                         times_ns=totals, first_item=statistics.median(firsts),
+                         throughput=size / (stats["median"] / 1e9))
+            results.append(stats)
+    return results
+
+
+def _sort_rows_with(sorting_function):
+    """Tri ligne par ligne d'un lot, par un algorithme scalaire de SortingAlgorithms"""
+    def sort_rows(batch):
+        for row in batch:
+            sorting_function(row)
+    return sort_rows
+
+
+# Moteurs de network_benchmark : tri d'un lot 2-D (une ligne par petit tableau indépendant)
+BATCH_ENGINES = {
+    "odd_even_transposition (lot)": lambda batch: odd_even_transposition(batch),
+    "bitonic (lot)": lambda batch: bitonic(batch),
+    "np.sort(axis=1)": lambda batch: batch.sort(axis=1),
+    "Bubble Sort (ligne par ligne)": _sort_rows_with(ALGORITHMS["Bubble Sort"]),
+    "Comb Sort (ligne par ligne)": _sort_rows_with(ALGORITHMS["Comb Sort"]),
+}
+
+
+def network_benchmark(rows=10000, width=16, repeats=5, seed=0, engines=None):
+    """Tri de rows petits tableaux de width entiers : réseaux vectorisés en un appel contre boucles scalaires.
+
+    Les boucles scalaires reçoivent des listes (leur stockage habituel), les
+    autres moteurs un tableau NumPy 2-D. accélération = médiane de
+    Bubble Sort ligne par ligne / médiane du moteur.
+    """
+    batch = generate_array("uniform", rows * width, seed).reshape(rows, width)
+    expected = np.sort(batch, axis=1)
+    results = []
+    for name, engine in (engines or BATCH_ENGINES).items():
+        scalar = "ligne par ligne" in name
+        times_ns = []
+        for run in range(repeats):
+            data = batch.tolist() if scalar else batch.copy()
+            gc.collect()
+            start = time.perf_counter_ns()
+            engine(data)
+            times_ns.append(time.perf_counter_ns() - start)
+            if run == 0 and not np.array_equal(np.asarray(data), expected):
+                raise RuntimeError(f"{name} n'a pas trié toutes les lignes")
+        stats = summarize(times_ns)
+        stats.update(engine=name, rows=rows, width=width, times_ns=times_ns, per_row=stats["median"] / rows)
+        results.append(stats)
+    reference = next((r["median"] for r in results if r["engine"].startswith("Bubble Sort")), None)
+    for stats in results:
+        stats["speedup"] = reference / stats["median"] if reference else None
+    return results
@@ -0,0 +1,175 @@
+"""Cache des mesures de benchmark : seules les combinaisons périmées sont relancées.
+
+Une mesure (un point de balayage : toutes ses répétitions et leur résumé)
+est rangée sous une clé formée de l'empreinte du code de l'algorithme, de la
+taille, de la distribution, de la graine, du protocole (répétitions et
+échauffements), de la version de Python et de la machine. L'empreinte
+couvre le bytecode de la fonction de tri, celui des fonctions et méthodes
+qu'elle nomme, les constantes globales qu'elle lit et le source des modules
+du projet qu'elle importe : modifier un algorithme ne périme que ses propres
+mesures (et celles des algorithmes qui l'utilisent).
+
+Le cache ne remplace pas le stockage des résultats (results_store) : un
+point repris du cache n'y figure que si l'exécution qui l'a mesuré l'y a
+ajouté.
+
+Le fichier est un objet JSON dont les entrées sont rangées de la moins
+récemment utilisée à la plus récente ; au-delà de max_entries, les plus
+anciennes sont évincées à l'enregistrement.
+"""
+import hashlib
+import json
+import os
+import types
+
+from results_store import machine_fingerprint, python_version
+
+DEFAULT_CACHE_PATH = "cache_benchmarks.json"
+
+# Nombre maximal de mesures gardées (les moins récemment utilisées sont évincées)
+MAX_ENTRIES = 2000
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _project_module_path(module):
+    """Chemin du fichier source de module s'il fait partie du projet, None sinon"""
+    path = getattr(module, "__file__", None)
+    if path and os.path.dirname(os.path.abspath(path)) == PROJECT_DIR:
+        return path
+    return None
+
+
+def code_fingerprint(function):
+    """Empreinte (sha1, 16 caractères) du code exécuté par function"""
+    digest = hashlib.sha1()
+    seen = set()
+
+    def visit_value(value, classes):
+        if isinstance(value, staticmethod):
+            value = value.__func__
+        if isinstance(value, types.FunctionType):
+            if value.__code__ not in seen:
+                seen.add(value.__code__)
+                visit_code(value.__code__, value.__globals__)
+        elif isinstance(value, types.ModuleType):
+            path = _project_module_path(value)
+            if path and path not in seen:
+                seen.add(path)
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+        elif isinstance(value, dict):
+            # Registre de fonctions (ALGORITHMS) : auto_sort dépend de tous les algorithmes
+            for item in value.values():
+                visit_value(item, classes)
+        elif isinstance(value, (int, float, str, bytes, tuple, frozenset)):
+            digest.update(repr(value).encode())
+
+    def visit_code(code, namespace):
+        digest.update(code.co_code)
+        # Classes du projet nommées par ce code : SortingAlgorithms._natural_runs est une méthode à suivre
+        classes = [value for value in map(namespace.get, code.co_names)
+                   if isinstance(value, type) and value.__module__ in (namespace.get("__name__"), "sorting_algorithms")]
+        for constant in code.co_consts:
+            if isinstance(constant, types.CodeType):
+                visit_code(constant, namespace)
+            else:
+                digest.update(repr(constant).encode())
+        for name in code.co_names:
+            digest.update(name.encode())
+            if name in namespace and not isinstance(namespace[name], type):
+                visit_value(namespace[name], classes)
+            for cls in classes:
+                if name in vars(cls):
+                    visit_value(vars(cls)[name], classes)
+            # Import local (from networks import bitonic) : le module du projet du même nom
+            path = os.path.join(PROJECT_DIR, f"{name}.py")
+            if name not in namespace and path not in seen and os.path.exists(path):
+                seen.add(path)
+                with open(path, "rb") as file:
+                    digest.update(file.read())
+
+    visit_value(function, [])
+    return digest.hexdigest()[:16]
+
+
+class BenchmarkCache:
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self.python = python_version()
+        self.machine = machine_fingerprint()
+        self._entries = None  # clé -> point, de la moins récemment utilisée à la plus récente
+        self._fingerprints = {}
+        self._dirty = False
+
+    @property
+    def entries(self):
+        if self._entries is None:
+            self._entries = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, encoding="utf-8") as file:
+                        self._entries = json.load(file)
+                except ValueError:
+                    pass  # fichier tronqué : le cache repart vide
+        return self._entries
+
+    def fingerprint(self, algorithm):
+        """Empreinte du code de l'algorithme algorithm (nom dans ALGORITHMS), calculée une fois par session"""
+        if algorithm not in self._fingerprints:
+            from sorting_algorithms import ALGORITHMS
+            self._fingerprints[algorithm] = code_fingerprint(ALGORITHMS[algorithm])
+        return self._fingerprints[algorithm]
+
+    def _prefix(self, algorithm, distribution, seed, repeats, warmup):
+        return "|".join([algorithm, self.fingerprint(algorithm), distribution, str(seed),
+                         f"{repeats}x{warmup}", self.python, self.machine])
+
+    def key(self, algorithm, size, distribution="uniform", seed=0, repeats=3, warmup=1):
+        return f"{self._prefix(algorithm, distribution, seed, repeats, warmup)}|{size}"
+
+    def get(self, key):
+        """Point en cache pour key (marqué comme récemment utilisé), None sinon"""
+        point = self.entries.pop(key, None)
+        if point is not None:
+            self.entries[key] = point
+            self._dirty = True
+        return point
+
+    def put(self, key, point):
+        self.entries.pop(key, None)
+        self.entries[key] = point
+        self._dirty = True
+
+    def points(self, algorithm, distribution="uniform", seed=0, repeats=3, warmup=1):
+        """Points à jour de cet algorithme, par taille : {taille: point}"""
+        prefix = self._prefix(algorithm, distribution, seed, repeats, warmup) + "|"
+        return {int(key[len(prefix):]): point for key, point in self.entries.items() if key.startswith(prefix)}
+
+    def record_sweep(self, algorithm, sweep, seed=0, repeats=3, warmup=1):
+        """Range les nouveaux points d'un balayage et marque ses points repris du cache comme utilisés"""
+        for point in sweep["points"]:
+            key = self.key(algorithm, point["size"], sweep["distribution"], seed, repeats, warmup)
+            if point.get("cached"):
+                self.get(key)
+            else:
+                self.put(key, point)
+
+    def save(self):
+        """Évince les entrées les moins récemment utilisées au-delà de max_entries puis écrit le fichier"""
+        if not self._dirty:
+            return
+        entries = self.entries
+        for key in list(entries)[:max(0, len(entries) - self.max_entries)]:
+            del entries[key]
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump(entries, file)
+        os.replace(temporary, self.path)
+        self._dirty = False
+
+    def clear(self):
+        self._entries = {}
+        self._dirty = True
+        self.save()
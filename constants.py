@@ -0,0 +1,18 @@
+# Constantes d'affichage partagées par le visualiseur et les moteurs de rendu
+WIDTH, HEIGHT = 800, 600
+BAR_COLOR = (0, 102, 204)
+BG_COLOR = (255, 255, 255)
+SELECTED_COLOR = (255, 0, 0)
+BUTTON_COLOR = (200, 200, 200)
+BUTTON_HOVER_COLOR = (150, 150, 150)
+TEXT_COLOR = (0, 0, 0)
+INPUT_COLOR = (240, 240, 240)
+INPUT_BORDER_COLOR = (150, 150, 150)
+INPUT_ACTIVE_COLOR = (220, 220, 255)
+
+# Hauteur réservée en haut de l'écran pour les statistiques
+STATS_HEIGHT = 100
+
+# Rendu par colonnes de pixels (grands tableaux) : étendue min-max et moyenne de chaque colonne
+RANGE_COLOR = (153, 194, 235)
+MEAN_COLOR = (0, 51, 102)
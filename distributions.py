@@ -0,0 +1,128 @@
+"""Générateurs reproductibles de données d'entrée.
+
+Chaque générateur reçoit (size, rng, max_value), où rng est un
+numpy.random.Generator initialisé par la graine, et renvoie un tableau
+NumPy int64 de valeurs comprises entre 1 et max_value. Tout est vectorisé :
+produire 10^7 éléments ne prend qu'une fraction de seconde.
+
+Pour ajouter une distribution, il suffit de l'enregistrer dans DISTRIBUTIONS
+(et dans LABELS pour son nom affiché).
+"""
+import numpy as np
+
+# Déplacement maximal d'un élément par rapport à sa place triée (presque trié)
+NEARLY_SORTED_K = 10
+# Nombre de valeurs distinctes (peu de valeurs uniques)
+FEW_UNIQUE_VALUES = 10
+# Nombre de dents croissantes (dents de scie)
+SAWTOOTH_TEETH = 8
+# Exposant de la loi de Zipf (plus il est grand, plus les petites valeurs dominent)
+ZIPF_EXPONENT = 1.5
+# Valeurs dont la loi de Zipf est tabulée exactement (au-delà : approximation continue)
+ZIPF_TABLE_SIZE = 1 << 20
+
+
+def uniform(size, rng, max_value):
+    return rng.integers(1, max_value, size=size, endpoint=True, dtype=np.int64)
+
+
+def sorted_values(size, rng, max_value):
+    return np.sort(uniform(size, rng, max_value))
+
+
+def reversed_values(size, rng, max_value):
+    return sorted_values(size, rng, max_value)[::-1].copy()
+
+
+def nearly_sorted(size, rng, max_value, k=NEARLY_SORTED_K):
+    """Données triées dont chaque élément est à moins de k positions de sa place"""
+    # Trier les positions bruitées par un décalage dans [0, k) déplace chaque élément d'au plus k - 1
+    noisy_positions = np.arange(size) + rng.uniform(0, k, size=size)
+    return sorted_values(size, rng, max_value)[np.argsort(noisy_positions, kind="stable")]
+
+
+def few_unique(size, rng, max_value, distinct=FEW_UNIQUE_VALUES):
+    values = np.unique(uniform(distinct, rng, max_value))
+    return values[rng.integers(0, len(values), size=size)]
+
+
+def organ_pipe(size, rng, max_value):
+    """Moitié croissante puis moitié décroissante"""
+    ordered = sorted_values(size, rng, max_value)
+    return np.concatenate((ordered[0::2], ordered[1::2][::-1]))
+
+
+def sawtooth(size, rng, max_value, teeth=SAWTOOTH_TEETH):
+    """Suite de teeth séquences croissantes de même longueur"""
+    values = uniform(size, rng, max_value)
+    period = -(-size // teeth) if size else 1
+    full = size - size % period
+    values[:full] = np.sort(values[:full].reshape(-1, period), axis=1).ravel()
+    values[full:] = np.sort(values[full:])
+    return values
+
+
+def zipf(size, rng, max_value, exponent=ZIPF_EXPONENT):
+    """Beaucoup de doublons : la valeur k apparaît avec une fréquence proportionnelle à k^-exponent"""
+    # Loi de Zipf bornée à max_value, tirée par inversion de la fonction de répartition
+    # (plus rapide que rng.zipf, et sans pic artificiel en max_value). La répartition n'est
+    # tabulée que sur les ZIPF_TABLE_SIZE premières valeurs ; au-delà, la queue est tirée par
+    # inversion de la loi continue x^-exponent : le coût ne dépend pas de max_value
+    head = min(max_value, ZIPF_TABLE_SIZE)
+    cdf = np.cumsum(np.arange(1, head + 1, dtype=np.float64) ** -exponent)
+    head_mass = cdf[-1]
+    low, high = head + 0.5, max_value + 0.5
+    if max_value <= head:
+        tail_mass = 0.0
+    elif exponent == 1:
+        tail_mass = np.log(high / low)
+    else:
+        tail_mass = (low ** (1 - exponent) - high ** (1 - exponent)) / (exponent - 1)
+    draws = rng.random(size) * (head_mass + tail_mass)
+    values = np.searchsorted(cdf, draws, side="right").astype(np.int64) + 1
+    in_tail = draws >= head_mass
+    if in_tail.any():
+        share = (draws[in_tail] - head_mass) / tail_mass
+        if exponent == 1:
+            tail = low * (high / low) ** share
+        else:
+            tail = (low ** (1 - exponent) - share * (exponent - 1) * tail_mass) ** (1 / (1 - exponent))
+        values[in_tail] = np.clip(np.rint(tail), head + 1, max_value).astype(np.int64)
+    return values
+
+
+DISTRIBUTIONS = {
+    "uniform": uniform,
+    "sorted": sorted_values,
+    "reversed": reversed_values,
+    "nearly_sorted": nearly_sorted,
+    "few_unique": few_unique,
+    "organ_pipe": organ_pipe,
+    "sawtooth": sawtooth,
+    "zipf": zipf,
+}
+
+LABELS = {
+    "uniform": "Aléatoire",
+    "sorted": "Triée",
+    "reversed": "Inversée",
+    "nearly_sorted": f"Presque triée (k={NEARLY_SORTED_K})",
+    "few_unique": "Peu de valeurs",
+    "organ_pipe": "Tuyau d'orgue",
+    "sawtooth": "Dents de scie",
+    "zipf": "Zipf",
+}
+
+
+def generate_array(distribution, size, seed=None, max_value=1000000):
+    """Tableau NumPy int64 de size valeurs tirées selon la distribution nommée"""
+    try:
+        generator = DISTRIBUTIONS[distribution]
+    except KeyError:
+        raise ValueError(f"distribution inconnue : {distribution}") from None
+    return generator(size, np.random.default_rng(seed), max_value)
+
+
+def generate(distribution, size, seed=None, max_value=1000000):
+    """Comme generate_array, mais renvoie une liste d'entiers Python"""
+    return generate_array(distribution, size, seed, max_value).tolist()
@@ -0,0 +1,162 @@
+"""Tri externe (hors mémoire) de fichiers binaires d'entiers.
+
+Le fichier d'entrée contient des entiers bruts (int64 en ordre natif par
+défaut). Le tri se fait en deux phases :
+1. des blocs de memory_limit octets sont lus, triés en mémoire (NumPy) puis
+   écrits chacun dans un fichier temporaire trié (une « suite ») ;
+2. les suites sont fusionnées fan_in par fan_in (plusieurs passes si
+   nécessaire) par une fusion k-voies guidée par un tas.
+
+Les lectures et écritures passent par des fichiers projetés en mémoire
+(np.memmap) et se font par tampons : chaque suite n'a en mémoire qu'un
+tampon de memory_limit / (2 * fan_in) octets, la moitié restante du budget
+servant au bloc fusionné avant son écriture.
+"""
+import heapq
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+
+DEFAULT_MEMORY_LIMIT = 64 << 20
+DEFAULT_FAN_IN = 16
+DEFAULT_DTYPE = np.int64
+
+
+class _RunReader:
+    """Lecture tamponnée d'une suite triée projetée en mémoire"""
+
+    def __init__(self, path, dtype, buffer_items):
+        self.data = np.memmap(path, dtype=dtype, mode="r") if os.path.getsize(path) else np.empty(0, dtype)
+        self.position = 0
+        self.buffer_items = buffer_items
+        self.buffer = None
+        self.refill()
+
+    def refill(self):
+        """Charge le tampon suivant ; renvoie False quand la suite est épuisée"""
+        end = min(self.position + self.buffer_items, len(self.data))
+        self.buffer = np.array(self.data[self.position:end])
+        self.position = end
+        return len(self.buffer) > 0
+
+    def take_until(self, bound):
+        """Retire et renvoie le début du tampon, jusqu'à bound inclus"""
+        count = np.searchsorted(self.buffer, bound, side="right")
+        taken, self.buffer = self.buffer[:count], self.buffer[count:]
+        return taken
+
+
+def merge_runs(run_paths, output_path, dtype=DEFAULT_DTYPE, memory_limit=DEFAULT_MEMORY_LIMIT):
+    """Fusion k-voies des suites triées run_paths dans output_path.
+
+    Le tas contient, pour chaque suite, la dernière valeur de son tampon. La
+    plus petite de ces valeurs (le sommet) est une borne sûre : tous les
+    éléments inférieurs ou égaux de tous les tampons peuvent être écrits
+    d'un coup, et le tampon de la suite au sommet est alors vide. La fusion
+    avance donc par blocs, vectorisés, plutôt qu'élément par élément.
+    """
+    itemsize = np.dtype(dtype).itemsize
+    total = sum(os.path.getsize(path) for path in run_paths) // itemsize
+    buffer_items = max(1, memory_limit // (2 * itemsize * max(1, len(run_paths))))
+    readers = [_RunReader(path, dtype, buffer_items) for path in run_paths]
+    heap = [(reader.buffer[-1], index) for index, reader in enumerate(readers) if len(reader.buffer)]
+    heapq.heapify(heap)
+
+    with open(output_path, "wb") as file:
+        file.truncate(total * itemsize)
+    if total == 0:
+        return
+    output = np.memmap(output_path, dtype=dtype, mode="r+", shape=(total,))
+    written = 0
+    while heap:
+        bound = heap[0][0]
+        pieces = [readers[index].take_until(bound) for _, index in heap]
+        block = np.concatenate(pieces)
+        block.sort(kind="stable")  # concaténation de suites triées : le tri fusionne les suites
+        output[written:written + len(block)] = block
+        written += len(block)
+        # Les suites dont tout le tampon était <= bound sont vides : on les recharge
+        # (après les avoir toutes retirées, un nouveau tampon pouvant recommencer par bound)
+        emptied = []
+        while heap and heap[0][0] <= bound:
+            emptied.append(heapq.heappop(heap)[1])
+        for index in emptied:
+            if readers[index].refill():
+                heapq.heappush(heap, (readers[index].buffer[-1], index))
+    output.flush()
+    del output
+
+
+def external_sort(input_path, output_path, memory_limit=DEFAULT_MEMORY_LIMIT, fan_in=DEFAULT_FAN_IN,
+                  dtype=DEFAULT_DTYPE, temp_dir=None, chunk_sort=None, on_run=None):
+    """Trie le fichier binaire input_path dans output_path sans le charger en entier.
+
+    - memory_limit : mémoire de travail en octets (taille des blocs de la phase 1)
+    - fan_in : nombre maximal de suites fusionnées à la fois
+    - chunk_sort(chunk) : tri en place d'un bloc (ndarray.sort par défaut)
+    - on_run(start, chunk) : appelé après le tri de chaque bloc (animation)
+
+    Renvoie un dictionnaire : octets traités, suites, passes de fusion, durées
+    des deux phases et débit en Mo/s.
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in doit être au moins égal à 2")
+    itemsize = np.dtype(dtype).itemsize
+    chunk_items = max(1, memory_limit // itemsize)
+    total_bytes = os.path.getsize(input_path)
+    total = total_bytes // itemsize
+    started = time.perf_counter()
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as work_dir:
+        # Phase 1 : suites triées
+        runs = []
+        source = np.memmap(input_path, dtype=dtype, mode="r", shape=(total,)) if total else np.empty(0, dtype)
+        for start in range(0, total, chunk_items):
+            chunk = np.array(source[start:start + chunk_items])
+            if chunk_sort is None:
+                chunk.sort()
+            else:
+                chunk_sort(chunk)
+            if on_run is not None:
+                on_run(start, chunk)
+            path = os.path.join(work_dir, f"run-0-{len(runs)}.bin")
+            chunk.tofile(path)
+            runs.append(path)
+        del source
+        runs_created = len(runs)
+        run_seconds = time.perf_counter() - started
+
+        # Phase 2 : fusions successives de fan_in suites au plus
+        passes = 0
+        while len(runs) > fan_in:
+            passes += 1
+            merged = []
+            for group_start in range(0, len(runs), fan_in):
+                path = os.path.join(work_dir, f"run-{passes}-{len(merged)}.bin")
+                merge_runs(runs[group_start:group_start + fan_in], path, dtype, memory_limit)
+                merged.append(path)
+            for path in runs:
+                os.remove(path)
+            runs = merged
+        if len(runs) > 1:
+            passes += 1
+            merge_runs(runs, output_path, dtype, memory_limit)
+        elif runs:
+            shutil.move(runs[0], output_path)
+        else:
+            open(output_path, "wb").close()
+
+    seconds = time.perf_counter() - started
+    return {
+        "bytes": total_bytes,
+        "items": total,
+        "runs": runs_created,
+        "passes": passes,
+        "run_seconds": run_seconds,
+        "merge_seconds": seconds - run_seconds,
+        "seconds": seconds,
+        "mb_per_s": total_bytes / 1e6 / seconds if seconds else float("inf"),
+    }
@@ -0,0 +1,113 @@
+"""Comptage exact des opérations effectuées par un algorithme de tri.
+
+Le comptage passe par des enveloppes : les éléments sont remplacés par des
+clés qui comptent leurs comparaisons et la liste par une sous-classe de list
+qui compte lectures, écritures et copies. Les fonctions de tri ne sont pas
+modifiées : sans comptage, elles tournent sur une liste ordinaire, sans
+aucun appel supplémentaire dans la boucle interne.
+"""
+
+
+class OperationCounts:
+    """Compteurs d'opérations d'une exécution"""
+
+    __slots__ = ("comparisons", "swaps", "reads", "writes", "allocations")
+
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.reads = 0
+        self.writes = 0
+        self.allocations = 0  # éléments copiés dans des listes auxiliaires
+
+    def as_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def make_counting_key(counts):
+    """Crée une classe de clé qui incrémente counts.comparisons à chaque comparaison"""
+
+    class CountingKey:
+        __slots__ = ("value",)
+
+        def __init__(self, value):
+            self.value = value
+
+        def __lt__(self, other):
+            counts.comparisons += 1
+            return self.value < other.value
+
+        def __le__(self, other):
+            counts.comparisons += 1
+            return self.value <= other.value
+
+        def __gt__(self, other):
+            counts.comparisons += 1
+            return self.value > other.value
+
+        def __ge__(self, other):
+            counts.comparisons += 1
+            return self.value >= other.value
+
+        def __eq__(self, other):
+            counts.comparisons += 1
+            return self.value == other.value
+
+        def __ne__(self, other):
+            counts.comparisons += 1
+            return self.value != other.value
+
+        __hash__ = None
+
+        def __index__(self):
+            # Permet aux tris sans comparaison (radix, dénombrement) de lire la clé
+            return self.value.__index__()
+
+        def __repr__(self):
+            return f"CountingKey({self.value!r})"
+
+    return CountingKey
+
+
+class CountingList(list):
+    """Liste qui compte les accès élément par élément et les copies par tranche"""
+
+    def __init__(self, iterable, counts):
+        super().__init__(iterable)
+        self.counts = counts
+
+    def __getitem__(self, index):
+        result = list.__getitem__(self, index)
+        if isinstance(index, slice):
+            # La copie reste instrumentée pour compter les accès à la liste auxiliaire
+            self.counts.allocations += len(result)
+            return CountingList(result, self.counts)
+        self.counts.reads += 1
+        return result
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self.counts.writes += len(value) if hasattr(value, "__len__") else 0
+        else:
+            self.counts.writes += 1
+        list.__setitem__(self, index, value)
+
+
+def count_operations(sorting_function, data):
+    """Exécute sorting_function sur une copie instrumentée de data.
+
+    Renvoie (liste triée, OperationCounts). Un appel du crochet avec i != j
+    est compté comme un échange ; avec i == j (écriture de merge_sort), la
+    valeur est déjà en place et seule l'écriture elle-même est comptée.
+    """
+    counts = OperationCounts()
+    key_class = make_counting_key(counts)
+    arr = CountingList((key_class(value) for value in data), counts)
+
+    def draw_swap(arr, i, j):
+        if i != j:
+            counts.swaps += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+    sorting_function(arr, draw_swap)
+    return [key.value for key in list.__iter__(arr)], counts
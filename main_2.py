@@ -1,6 +1,15 @@
 # main.py
+import argparse
+
 from visualizer import SortVisualizer
 
 if __name__ == "__main__":
-    visualizer = SortVisualizer()
-    visualizer.run()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Visualiseur d'algorithmes de tri")
+    parser.add_argument("--headless", action="store_true",
+                        help="sans fenêtre : lancer les tests de performance, enregistrer les graphiques puis quitter")
+    args = parser.parse_args()
+    visualizer = SortVisualizer(headless=args.headless)
+    if args.headless:
+        visualizer.run_benchmark_tests()
+    else:
+        visualizer.run()
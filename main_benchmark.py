@@ -0,0 +1,347 @@
+# main_benchmark.py
+"""Point d'entrée en ligne de commande du benchmark (aucun affichage requis).
+
+Exemple : python main_benchmark.py --sizes 100 1000 --repeats 7 -a merge -a quick
+"""
+import argparse
+import json
+import sys
+
+from benchmark import (
+    adaptive_sweep, auto_margins, generate_input, network_benchmark, run_benchmark, scaling_benchmark, selection_benchmark,
+    startup_metrics, streaming_benchmark, worker_ladder,
+)
+from benchmark_cache import DEFAULT_CACHE_PATH, BenchmarkCache
+from distributions import DISTRIBUTIONS
+from parallel_benchmark import default_workers, run_parallel_benchmark, run_parallel_sweeps
+from results_store import DEFAULT_PATH, ResultsStore
+from profiling import FORMATS, Profiler
+from sorting_algorithms import ALGORITHMS
+from storage import STORAGES
+
+
+def resolve_algorithm(name):
+    """Retrouve un algorithme par son nom complet ou abrégé ("merge", "Merge Sort"...)"""
+    wanted = name.lower().replace("_", " ").strip()
+    for full_name in ALGORITHMS:
+        lowered = full_name.lower()
+        if wanted in (lowered, lowered.replace(" sort", "")):
+            return full_name
+    raise argparse.ArgumentTypeError(f"algorithme inconnu : {name}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark des algorithmes de tri sans interface graphique")
+    parser.add_argument("-a", "--algorithm", action="append", type=resolve_algorithm,
+                        help="algorithme à mesurer (répétable, tous par défaut)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000],
+                        help="tailles d'entrée à tester")
+    parser.add_argument("--repeats", type=int, default=5, help="nombre d'exécutions mesurées")
+    parser.add_argument("--warmup", type=int, default=1, help="nombre d'exécutions de chauffe")
+    parser.add_argument("--seed", type=int, default=0, help="graine des données générées")
+    parser.add_argument("-d", "--distribution", action="append", choices=[*DISTRIBUTIONS, "all"],
+                        help="distribution des données (répétable, uniform par défaut ; all : toutes)")
+    parser.add_argument("-s", "--storage", action="append", choices=[*STORAGES, "all"],
+                        help="stockage des données : list, array (array.array) ou numpy (répétable, list par défaut)")
+    parser.add_argument("--memory", action="store_true",
+                        help="ajouter une passe mémoire séparée (tracemalloc) après le chronométrage")
+    parser.add_argument("--count", action="store_true",
+                        help="ajouter une passe de comptage (comparaisons, échanges, lectures, écritures)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help=f"exécuter sur un pool de N processus (0 : séquentiel ; {default_workers()} conseillé ici)")
+    parser.add_argument("--pin", action="store_true", help="épingler chaque processus sur un cœur distinct")
+    parser.add_argument("--store", nargs="?", const=DEFAULT_PATH, metavar="FICHIER",
+                        help=f"ajouter les résultats au stockage persistant (par défaut {DEFAULT_PATH})")
+    parser.add_argument("--adaptive", type=float, metavar="BUDGET",
+                        help="tailles croissantes jusqu'à épuiser BUDGET secondes par algorithme (ignore --sizes)")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_CACHE_PATH, metavar="FICHIER",
+                        help="avec --adaptive : reprendre les points déjà mesurés pour le code actuel de chaque "
+                             f"algorithme (par défaut {DEFAULT_CACHE_PATH})")
+    parser.add_argument("--scaling", type=int, metavar="TAILLE",
+                        help="accélération des tris parallèles selon le nombre de processus (jusqu'à --workers)")
+    parser.add_argument("--selection", type=int, metavar="TAILLE",
+                        help="accélération de nth_element, top_k et partial_sort sur un tri complet, selon k / n")
+    parser.add_argument("--streaming", type=int, metavar="TAILLE",
+                        help="débit et latence du premier élément de la fusion k-voies et des conteneurs triés")
+    parser.add_argument("--shards", type=int, default=16, help="avec --streaming, nombre de suites triées à fusionner")
+    parser.add_argument("--batch", type=int, default=1000, help="avec --streaming, taille des lots insérés")
+    parser.add_argument("--networks", type=int, metavar="LIGNES",
+                        help="réseaux de tri vectorisés sur un lot de LIGNES petits tableaux, contre les boucles scalaires")
+    parser.add_argument("--width", type=int, default=16, help="avec --networks, nombre d'éléments par ligne")
+    parser.add_argument("--startup", action="store_true",
+                        help="mesurer les temps d'import et le temps jusqu'à la première image")
+    parser.add_argument("--profile", metavar="FICHIER",
+                        help="profiler une exécution de chaque algorithme (phases, profondeurs) et écrire FICHIER")
+    parser.add_argument("--profile-format", choices=FORMATS, default="chrome",
+                        help="format de --profile : chrome (trace-event JSON) ou collapsed (piles repliées)")
+    parser.add_argument("--cprofile", action="store_true",
+                        help="avec --profile, enregistrer aussi les statistiques cProfile dans FICHIER.prof")
+    parser.add_argument("--json", action="store_true", help="sortie au format JSON")
+    parser.add_argument("--list", action="store_true", help="afficher les algorithmes disponibles")
+    args = parser.parse_args(argv)
+    if args.distribution and "all" in args.distribution:
+        args.distribution = list(DISTRIBUTIONS)
+    args.distribution = args.distribution or ["uniform"]
+    if args.storage and "all" in args.storage:
+        args.storage = list(STORAGES)
+    args.storage = args.storage or ["list"]
+    if args.workers > 0 and args.storage != ["list"]:
+        parser.error("--storage n'est disponible qu'en exécution séquentielle (--workers 0)")
+    if args.cache and not args.adaptive:
+        parser.error("--cache ne s'applique qu'aux balayages adaptatifs (--adaptive)")
+    return args
+
+
+def format_ms(value_ns):
+    return f"{value_ns / 1e6:10.3f}"
+
+
+def run_adaptive(args):
+    """Balayages adaptatifs : points mesurés et pente de croissance de chaque algorithme"""
+    names = args.algorithm or list(ALGORITHMS)
+    cache = BenchmarkCache(args.cache) if args.cache else None
+    if args.workers > 0:
+        sweeps = run_parallel_sweeps(names, args.adaptive, args.seed, workers=args.workers, pin=args.pin,
+                                     distributions=args.distribution, cache=cache, repeats=args.repeats,
+                                     warmup=args.warmup)
+        sweeps.sort(key=lambda sweep: (args.distribution.index(sweep["distribution"]),
+                                       names.index(sweep["algorithm"])))
+    else:
+        sweeps = []
+        for distribution in args.distribution:
+            for name in names:
+                protocol = (args.seed, args.repeats, args.warmup)
+                cached = cache.points(name, distribution, *protocol) if cache else None
+                sweep = adaptive_sweep(ALGORITHMS[name], budget=args.adaptive, repeats=args.repeats,
+                                       warmup=args.warmup, seed=args.seed, distribution=distribution,
+                                       cached=cached)
+                sweep["algorithm"] = name
+                sweeps.append(sweep)
+                if cache:
+                    cache.record_sweep(name, sweep, *protocol)
+        if cache:
+            cache.save()
+
+    if args.store:
+        store = ResultsStore(args.store)
+        for sweep in sweeps:
+            for point in sweep["points"]:
+                # Un point repris du cache a déjà été stocké lors de sa mesure
+                if not point.get("cached"):
+                    store.append(sweep["algorithm"], point["size"], point["times_ns"], sweep["distribution"])
+
+    if args.json:
+        json.dump(sweeps, sys.stdout, indent=2)
+        print()
+        return 0
+
+    for sweep in sweeps:
+        exponent = f"n^{sweep['exponent']:.2f}" if sweep["exponent"] is not None else "pente inconnue"
+        print(f"{sweep['algorithm']} [{sweep['distribution']}] ({exponent})")
+        for point in sweep["points"]:
+            print(f"  {point['size']:>10} {format_ms(point['median'])} ms" + (" (cache)" if point.get("cached") else ""))
+    return 0
+
+
+def run_scaling(args):
+    """Tris parallèles : temps, accélération et efficacité pour 1, 2, 4... processus"""
+    counts = worker_ladder(args.workers or None)
+    results = scaling_benchmark(args.scaling, counts, args.repeats, args.seed, args.distribution[0])
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"Référence (fusion mono-cœur, n={args.scaling}) : {format_ms(results[0]['baseline']).strip()} ms")
+    width = max(len("Algorithme"), *(len(r["algorithm"]) for r in results)) + 1
+    print(f"{'Algorithme':<{width}}{'Processus':>10}{'médiane':>11}{'accél.':>9}{'efficacité':>12}")
+    for r in results:
+        print(f"{r['algorithm']:<{width}}{r['workers']:>10} {format_ms(r['median'])}"
+              f"{r['speedup']:>8.2f}x{r['efficiency']:>11.0%}")
+    return 0
+
+
+def run_selection(args):
+    """Sélections sur TAILLE éléments : temps et accélération sur le tri complet pour chaque k / n"""
+    baseline = args.algorithm[0] if args.algorithm else "Quick Sort"
+    results = selection_benchmark(args.selection, repeats=args.repeats, warmup=args.warmup, seed=args.seed,
+                                  distribution=args.distribution[0], baseline=baseline)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"Référence (tri complet par {baseline}, n={args.selection}) : {format_ms(results[0]['full_sort']).strip()} ms")
+    print(f"{'Sélection':<14}{'k':>10}{'k / n':>9}{'médiane':>11}{'accél.':>9}")
+    for r in results:
+        print(f"{r['operation']:<14}{r['k']:>10}{r['ratio']:>9.1%} {format_ms(r['median'])}{r['speedup']:>8.2f}x")
+    return 0
+
+
+def run_streaming(args):
+    """Tri en flux sur TAILLE éléments : débit et latence jusqu'au premier élément"""
+    results = streaming_benchmark(args.streaming, args.shards, args.batch, args.repeats, args.seed,
+                                  args.distribution[0])
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+    width = max(len("Moteur"), *(len(r["engine"]) for r in results)) + 1
+    print(f"{'Moteur':<{width}}{'Mode':<11}{'médiane':>11}{'1er élément':>13}{'éléments/s':>14}")
+    for r in results:
+        print(f"{r['engine']:<{width}}{r['kind']:<11}{format_ms(r['median'])} {format_ms(r['first_item'])}"
+              f"   {r['throughput']:>11,.0f}")
+    return 0
+
+
+def run_networks(args):
+    """Lot de LIGNES tableaux de --width éléments : temps total, par ligne, et accélération sur Bubble Sort"""
+    results = network_benchmark(args.networks, args.width, args.repeats, args.seed)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+    width = max(len("Moteur"), *(len(r["engine"]) for r in results)) + 1
+    print(f"{args.networks} lignes de {args.width} éléments")
+    print(f"{'Moteur':<{width}}{'médiane':>11}{'par ligne (µs)':>16}{'accél.':>10}")
+    for r in results:
+        print(f"{r['engine']:<{width}}{format_ms(r['median'])} {r['per_row'] / 1e3:15.3f}{r['speedup']:>9.1f}x")
+    return 0
+
+
+def run_startup(args):
+    """Temps de démarrage, chaque mesure dans un interpréteur neuf"""
+    results = startup_metrics(args.repeats)
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+    width = max(len(r["probe"]) for r in results) + 1
+    print(f"{'Mesure':<{width}}{'min (ms)':>11}{'médiane':>11}{'p95':>11}  modules chargés")
+    for r in results:
+        print(f"{r['probe']:<{width}} {format_ms(r['min'])} {format_ms(r['median'])} {format_ms(r['p95'])}"
+              f"  {', '.join(r['modules']) or '-'}")
+    return 0
+
+
+def run_profile(args):
+    """Une exécution profilée par algorithme, taille et distribution, regroupées dans un seul fichier"""
+    profiler = Profiler(cprofile=args.cprofile)
+    for size in args.sizes:
+        for distribution in args.distribution:
+            data = generate_input(size, args.seed, distribution=distribution)
+            for name in args.algorithm or ALGORITHMS:
+                print(f"... {name} (n={size}, {distribution})", file=sys.stderr)
+                profiler.run((name, f"{distribution} n={size}"), ALGORITHMS[name], list(data))
+    profiler.write(args.profile, args.profile_format)
+    if args.cprofile:
+        profiler.write_cprofile(args.profile + ".prof")
+
+    if args.json:
+        json.dump({"phases": [{"stack": list(path), "self_ns": own}
+                              for path, own in profiler.phase_totals().items()],
+                   "depths": {name: dict(sorted(counts.items())) for name, counts in profiler.depths.items()}},
+                  sys.stdout, indent=2)
+        print()
+        return 0
+    print(f"Profil écrit dans {args.profile} ({args.profile_format})"
+          + (f", cProfile dans {args.profile}.prof" if args.cprofile else ""))
+    for path, own in sorted(profiler.phase_totals().items()):
+        print(f"{'  ' * (len(path) - 1) + path[-1]:<40} {format_ms(own)} ms")
+    for name, counts in profiler.depths.items():
+        print(f"Profondeurs de récursion de {name} :")
+        for depth, count in sorted(counts.items()):
+            print(f"  {depth:>4} {count:>10}")
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.list:
+        print("\n".join(ALGORITHMS))
+        return 0
+    if args.startup:
+        return run_startup(args)
+    if args.scaling:
+        return run_scaling(args)
+    if args.selection:
+        return run_selection(args)
+    if args.streaming:
+        return run_streaming(args)
+    if args.networks:
+        return run_networks(args)
+    if args.adaptive:
+        return run_adaptive(args)
+    if args.profile:
+        return run_profile(args)
+
+    def progress(name, size):
+        if not args.json:
+            print(f"... {name} (n={size})", file=sys.stderr)
+
+    if args.workers > 0:
+        results = run_parallel_benchmark(args.algorithm, args.sizes, args.repeats, args.warmup, args.seed,
+                                         workers=args.workers, pin=args.pin, memory=args.memory, count=args.count,
+                                         on_result=lambda stats: progress(stats["algorithm"], stats["size"]),
+                                         distributions=args.distribution)
+        order = {name: index for index, name in enumerate(args.algorithm or ALGORITHMS)}
+        results.sort(key=lambda stats: (args.sizes.index(stats["size"]),
+                                        args.distribution.index(stats["distribution"]),
+                                        order[stats["algorithm"]]))
+    else:
+        results = run_benchmark(args.algorithm, args.sizes, args.repeats, args.warmup, args.seed, progress,
+                                memory=args.memory, count=args.count, distributions=args.distribution,
+                                storages=args.storage)
+
+    if args.store:
+        # Le stockage persistant ne distingue pas les stockages : seules les listes y sont ajoutées
+        store = ResultsStore(args.store)
+        for r in results:
+            if r.get("storage", "list") == "list":
+                store.append(r["algorithm"], r["size"], r["times_ns"], r["distribution"])
+
+    if args.json:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        return 0
+
+    width = max(len("Algorithme"), *(len(r["algorithm"]) for r in results)) + 1
+    distribution_width = max(len("Distribution"), *(len(r["distribution"]) for r in results)) + 1
+    show_storage = args.storage != ["list"]
+    header = f"{'Algorithme':<{width}}{'Distribution':<{distribution_width}}"
+    if show_storage:
+        header += f"{'Stockage':<9}"
+    header += f"{'Taille':>8}{'min (ms)':>11}{'médiane':>11}{'p95':>11}{'écart-type':>11}"
+    if args.memory:
+        header += f"{'aux. (KB)':>11}{'pic (KB)':>11}{'o/élément':>11}"
+    if args.count:
+        header += f"{'comparaisons':>14}{'échanges':>12}{'lectures':>12}{'écritures':>12}"
+    print(header)
+    for r in results:
+        line = f"{r['algorithm']:<{width}}{r['distribution']:<{distribution_width}}"
+        if show_storage:
+            line += f"{r['storage']:<9}"
+        line += (f"{r['size']:>8} {format_ms(r['min'])} {format_ms(r['median'])}"
+                 f" {format_ms(r['p95'])} {format_ms(r['stddev'])}")
+        if args.memory:
+            line += (f" {r['memory']['auxiliary'] / 1024:10.2f} {r['memory']['peak'] / 1024:10.2f}"
+                     f" {r['memory']['bytes_per_element']:10.1f}")
+        if args.count:
+            counts = r["counts"]
+            line += (f" {counts['comparisons']:13d} {counts['swaps']:11d}"
+                     f" {counts['reads']:11d} {counts['writes']:11d}")
+        print(line)
+
+    margins = auto_margins(results)
+    if margins:
+        print("\nAuto : écart au meilleur algorithme")
+        for m in margins:
+            decision = m["decision"]
+            line = f"{m['distribution']:<{distribution_width}}"
+            if show_storage:
+                line += f"{m['storage']:<9}"
+            print(f"{line}{m['size']:>8} {m['ratio']:6.2f}x  meilleur : {m['best']}"
+                  f"  | {decision['algorithm']} : {decision['reason']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
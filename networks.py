@@ -0,0 +1,96 @@
+"""Réseaux de tri vectorisés (NumPy) : transposition pair-impair et tri bitonique.
+
+Un réseau de tri est une suite fixe d'étapes ; chaque étape compare et
+échange des paires d'indices disjointes, indépendantes des données. Une
+étape s'écrit donc comme un seul np.minimum / np.maximum entre deux vues à
+pas constant du tableau, au lieu d'une boucle Python d'échanges.
+
+- odd_even_transposition : n étapes, alternativement sur les paires
+  (0, 1), (2, 3)... et (1, 2), (3, 4)... ; O(n²) comparaisons, mais n
+  opérations vectorisées seulement.
+- bitonic : log2(N) (log2(N) + 1) / 2 étapes sur N = puissance de 2
+  supérieure ou égale à n (complément par le maximum de chaque ligne) ;
+  O(n log² n) comparaisons.
+
+Les deux acceptent un tableau 1-D ou un lot 2-D (une ligne par tableau
+indépendant, toutes triées en même temps). Le tri se fait en place ;
+on_stage(values) est appelé après chaque étape (animation).
+"""
+import numpy as np
+
+
+def _as_rows(values):
+    values = np.asarray(values)
+    if values.ndim not in (1, 2):
+        raise ValueError("réseau de tri : tableau 1-D ou lot 2-D (une ligne par tableau) attendu")
+    return values
+
+
+def _compare_exchange(low, high):
+    """Une étape : le minimum de chaque paire va dans low, le maximum dans high (deux vues)"""
+    smaller = np.minimum(low, high)
+    np.maximum(low, high, out=high)
+    low[...] = smaller
+
+
+def odd_even_transposition(values, on_stage=None):
+    """Trie values (1-D, ou chaque ligne d'un lot 2-D) en place par transposition pair-impair ; renvoie values"""
+    values = _as_rows(values)
+    n = values.shape[-1]
+    for stage in range(n):
+        start = stage % 2
+        _compare_exchange(values[..., start:n - 1:2], values[..., start + 1:n:2])
+        if on_stage is not None:
+            on_stage(values)
+    return values
+
+
+def bitonic(values, on_stage=None):
+    """Trie values (1-D, ou chaque ligne d'un lot 2-D) en place par le réseau bitonique ; renvoie values.
+
+    Forme « retournée » du réseau : la première étape de chaque fusion
+    compare un bloc de taille k à son propre miroir, les suivantes sont des
+    demi-nettoyeurs ; toutes les comparaisons vont dans le même sens.
+    """
+    values = _as_rows(values)
+    n = values.shape[-1]
+    if n < 2 or values.size == 0:
+        return values
+    size = 1 << (n - 1).bit_length()
+    in_place = size == n and values.flags.c_contiguous
+    if in_place:
+        work = values.reshape(-1, n)
+    else:
+        # Copie de travail contiguë, complétée jusqu'à size colonnes par le maximum de chaque ligne
+        # (qui reste trié en fin de ligne, quel que soit le type des éléments) ; values est mis à jour
+        # à chaque étape rapportée
+        rows = values.reshape(-1, n)
+        work = np.empty((rows.shape[0], size), dtype=values.dtype)
+        work[:, :n] = rows
+        work[:, n:] = rows.max(axis=1, keepdims=True)
+
+    def write_back():
+        if not in_place:
+            values[...] = work[:, :n].reshape(values.shape)
+
+    count = work.shape[0]
+    k = 2
+    while k <= size:
+        # Chaque bloc de taille k est comparé à son miroir...
+        blocks = work.reshape(count, size // k, k)
+        _compare_exchange(blocks[..., :k // 2], blocks[..., k - 1:k // 2 - 1:-1])
+        if on_stage is not None:
+            write_back()
+            on_stage(values)
+        # ... puis chaque moitié de taille 2j à son autre moitié
+        j = k // 4
+        while j >= 1:
+            halves = work.reshape(count, size // (2 * j), 2, j)
+            _compare_exchange(halves[:, :, 0], halves[:, :, 1])
+            if on_stage is not None:
+                write_back()
+                on_stage(values)
+            j //= 2
+        k *= 2
+    write_back()
+    return values
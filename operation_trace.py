@@ -0,0 +1,287 @@
+"""Trace compacte des opérations d'un tri, enregistrée puis rejouée.
+
+Le tri s'exécute une seule fois à pleine vitesse pendant que chaque opération
+(échange, écriture) reçue par le crochet draw_swap est ajoutée à des tableaux
+array.array. Les comparaisons ne passent pas par ce crochet : pour les
+enregistrer aussi, le tri porte sur des clés qui enveloppent les éléments
+(make_traced_key) et connaissent leur position. La trace peut ensuite être
+rejouée à n'importe quelle vitesse, en avant comme en arrière,
+indépendamment de la vitesse de l'algorithme.
+"""
+import sys
+from array import array
+
+from sorting_algorithms import swap
+
+SWAP, WRITE, COMPARE = 0, 1, 2
+OPERATION_NAMES = {SWAP: "swap", WRITE: "write", COMPARE: "compare"}
+
+
+def index_typecode(size):
+    """Plus petit type d'entier non signé capable de contenir les indices"""
+    return "H" if size <= 0xFFFF else "I"
+
+
+def value_typecode(values):
+    """Plus petit type de array.array capable de contenir values, ou None (liste Python).
+
+    Un tri n'écrit que des valeurs déjà présentes : l'intervalle des valeurs
+    initiales suffit.
+    """
+    if values and all(type(value) is int for value in values):
+        low, high = min(values), max(values)
+        for typecode in "bhiq":
+            limit = 1 << (8 * array(typecode).itemsize - 1)
+            if -limit <= low and high < limit:
+                return typecode
+    elif values and all(type(value) is float for value in values):
+        return "d"
+    return None
+
+
+def make_traced_key(trace):
+    """Crée une classe de clé qui enregistre chaque comparaison dans trace.
+
+    Une clé retient la dernière position où le crochet de la trace l'a placée :
+    une comparaison est enregistrée entre ces positions, même si l'algorithme
+    compare des copies rangées dans un tampon auxiliaire.
+    """
+    ops_append = trace.ops.append
+    first_append = trace.first.append
+    second_append = trace.second.append
+
+    def record(i, j):
+        ops_append(COMPARE)
+        first_append(i)
+        second_append(j)
+
+    class TracedKey:
+        __slots__ = ("value", "index")
+
+        def __init__(self, value, index=0):
+            self.value = value
+            self.index = index
+
+        def __lt__(self, other):
+            record(self.index, other.index)
+            return self.value < other.value
+
+        def __le__(self, other):
+            record(self.index, other.index)
+            return self.value <= other.value
+
+        def __gt__(self, other):
+            record(self.index, other.index)
+            return self.value > other.value
+
+        def __ge__(self, other):
+            record(self.index, other.index)
+            return self.value >= other.value
+
+        def __eq__(self, other):
+            record(self.index, other.index)
+            return self.value == other.value
+
+        def __ne__(self, other):
+            record(self.index, other.index)
+            return self.value != other.value
+
+        __hash__ = None
+
+        def __index__(self):
+            # Permet aux tris sans comparaison (radix, dénombrement) de lire la clé
+            return self.value.__index__()
+
+        def __repr__(self):
+            return f"TracedKey({self.value!r})"
+
+    return TracedKey
+
+
+class OperationTrace:
+    """Suite d'opérations (code, i, j) stockée dans trois tableaux compacts.
+
+    Une comparaison n'est rangée que si le tri porte sur des clés
+    make_traced_key ; elle ne modifie pas le tableau. Pour une écriture, i == j et le couple (ancienne valeur, nouvelle valeur)
+    est rangé dans values, dans l'ordre des écritures, ce qui permet de revenir
+    en arrière. Avec moins de 65536 éléments, une opération occupe 5 octets ;
+    une écriture y ajoute ses deux valeurs, stockées dans un array.array du
+    plus petit type qui contient les valeurs initiales (2 octets chacune pour
+    les hauteurs du visualiseur ; liste Python pour les types non numériques).
+    """
+
+    def __init__(self, initial):
+        self.initial = list(initial)
+        typecode = index_typecode(len(self.initial))
+        self.ops = array("B")
+        self.first = array(typecode)
+        self.second = array(typecode)
+        typecode = value_typecode(self.initial)
+        self.values = [] if typecode is None else array(typecode)
+        self._shadow = None
+
+    def __len__(self):
+        return len(self.ops)
+
+    def __getitem__(self, position):
+        return self.ops[position], self.first[position], self.second[position]
+
+    @property
+    def nbytes(self):
+        """Taille de la trace en octets : tableaux d'opérations et valeurs écrites"""
+        arrays = (self.ops, self.first, self.second)
+        total = sum(a.itemsize * len(a) for a in arrays)
+        if isinstance(self.values, array):
+            return total + self.values.itemsize * len(self.values)
+        # Liste de valeurs quelconques : pointeurs et objets distincts référencés
+        unique = {id(value): value for value in self.values}
+        return total + sys.getsizeof(self.values) + sum(map(sys.getsizeof, unique.values()))
+
+    def written_values(self, write):
+        """Couple (ancienne valeur, nouvelle valeur) de l'écriture numéro write (0 : la première)"""
+        return self.values[2 * write], self.values[2 * write + 1]
+
+    def events(self, start=0, stop=None):
+        """Générateur des opérations (code, i, j) entre start et stop"""
+        ops, first, second = self.ops, self.first, self.second
+        for position in range(start, len(ops) if stop is None else stop):
+            yield ops[position], first[position], second[position]
+
+    def recorder(self, draw_swap=swap, traced_keys=False):
+        """Renvoie un crochet draw_swap qui délègue à draw_swap puis enregistre l'opération.
+
+        Un appel avec i == j (cas de merge_sort) est une écriture : la valeur
+        a déjà été placée dans arr[i], l'ancienne est lue dans une copie miroir.
+        Avec traced_keys, arr contient des clés make_traced_key : le crochet
+        met à jour leur position et enregistre les valeurs qu'elles enveloppent.
+        """
+        shadow = self._shadow = list(self.initial)
+        ops_append = self.ops.append
+        first_append = self.first.append
+        second_append = self.second.append
+        values_append = self.values.append
+
+        inline_swap = draw_swap is swap
+
+        def hook(arr, i, j):
+            first_append(i)
+            second_append(j)
+            if i != j:
+                if inline_swap:
+                    arr[i], arr[j] = arr[j], arr[i]
+                else:
+                    draw_swap(arr, i, j)
+                ops_append(SWAP)
+                shadow[i], shadow[j] = shadow[j], shadow[i]
+                if traced_keys:
+                    arr[i].index = i
+                    arr[j].index = j
+            else:
+                if not inline_swap:
+                    draw_swap(arr, i, j)
+                new = arr[i]
+                if traced_keys:
+                    new.index = i
+                    new = new.value
+                ops_append(WRITE)
+                values_append(shadow[i])
+                values_append(new)
+                shadow[i] = new
+        return hook
+
+    @classmethod
+    def record(cls, sorting_function, arr, draw_swap=swap, compares=True):
+        """Trie arr en place avec sorting_function et renvoie la trace produite.
+
+        Avec compares, le tri porte sur des clés make_traced_key (les
+        comparaisons sont enregistrées) puis les valeurs triées sont recopiées
+        dans arr.
+        """
+        trace = cls(arr)
+        if compares:
+            key_class = make_traced_key(trace)
+            keys = [key_class(value, index) for index, value in enumerate(arr)]
+            sorting_function(keys, trace.recorder(draw_swap, traced_keys=True))
+            arr[:] = [key.value for key in keys]
+        else:
+            sorting_function(arr, trace.recorder(draw_swap))
+        trace._shadow = None
+        return trace
+
+
+class TracePlayer:
+    """Rejoue une trace sur une copie de la liste initiale, avec retour en arrière.
+
+    Une comparaison ne modifie pas le tableau : elle est seulement renvoyée
+    (et transmise à on_operation) pour être mise en surbrillance.
+    """
+
+    def __init__(self, trace):
+        self.trace = trace
+        self.array = list(trace.initial)
+        self.position = 0
+        self.write = 0  # nombre d'écritures appliquées : indice du prochain couple de valeurs
+
+    @property
+    def at_end(self):
+        return self.position >= len(self.trace)
+
+    def step(self):
+        """Applique l'opération suivante et la renvoie (ou None en fin de trace)"""
+        if self.at_end:
+            return None
+        trace = self.trace
+        op, i, j = trace[self.position]
+        arr = self.array
+        if op == SWAP:
+            arr[i], arr[j] = arr[j], arr[i]
+        elif op == WRITE:
+            arr[i] = trace.written_values(self.write)[1]
+            self.write += 1
+        self.position += 1
+        return op, i, j
+
+    def step_back(self):
+        """Annule la dernière opération appliquée et la renvoie (ou None au début)"""
+        if self.position == 0:
+            return None
+        self.position -= 1
+        trace = self.trace
+        op, i, j = trace[self.position]
+        arr = self.array
+        if op == SWAP:
+            arr[i], arr[j] = arr[j], arr[i]
+        elif op == WRITE:
+            self.write -= 1
+            arr[i] = trace.written_values(self.write)[0]
+        return op, i, j
+
+    def advance(self, count, on_operation=None):
+        """Avance (count > 0) ou recule (count < 0) de count opérations.
+
+        on_operation(i, j) est appelé pour chaque opération appliquée, par
+        exemple pour marquer les barres à redessiner. Renvoie le nombre
+        d'opérations réellement appliquées.
+        """
+        move = self.step if count >= 0 else self.step_back
+        applied = 0
+        for _ in range(abs(count)):
+            event = move()
+            if event is None:
+                break
+            applied += 1
+            if on_operation is not None:
+                on_operation(event[1], event[2])
+        return applied
+
+    def seek(self, position, on_operation=None):
+        """Se place à la position donnée, en repartant du début si c'est plus court"""
+        position = max(0, min(position, len(self.trace)))
+        if position < self.position - position:
+            self.array[:] = self.trace.initial
+            self.position = 0
+            self.write = 0
+            if on_operation is not None:
+                for index in range(len(self.array)):
+                    on_operation(index, index)
+        return self.advance(position - self.position, on_operation)
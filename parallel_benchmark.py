@@ -0,0 +1,250 @@
+"""Exécution des mesures sur un pool de processus.
+
+Chaque mesure élémentaire (type de passe, algorithme, entrée, répétition) est
+un travail indépendant. Les données d'entrée sont déposées une seule fois en
+mémoire partagée ; les travaux ne transportent que leur nom, rien n'est
+sérialisé. Les résultats remontent au fur et à mesure qu'ils se terminent.
+"""
+import multiprocessing
+import os
+import queue
+import signal
+from array import array
+from itertools import islice
+from multiprocessing import shared_memory
+
+from adaptive import AUTO, decide
+from benchmark import adaptive_sweep, generate_input, measure_memory, summarize, time_sort
+from instrumentation import count_operations
+from sorting_algorithms import ALGORITHMS
+
+TIME, MEMORY, COUNT = "time", "memory", "count"
+
+# Intervalle d'attente entre deux appels de idle() pendant l'exécution
+POLL_INTERVAL = 0.05
+
+# Travaux soumis à l'avance par processus (les suivants attendent qu'une place se libère)
+IN_FLIGHT_PER_WORKER = 2
+
+# Algorithmes qui lancent leurs propres processus : un processus du pool (démon) ne le peut pas
+# et les exécuterait sur un seul cœur. Leurs travaux tournent donc dans le processus principal,
+# une fois le pool arrêté
+SPAWNING_ALGORITHMS = ("Parallel Merge Sort", "Sample Sort")
+
+
+def default_workers():
+    """Par défaut, la moitié des cœurs : limite la contention (hyperthreading, cache, bande passante)"""
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class SharedInput:
+    """Liste d'entiers copiée dans un bloc de mémoire partagée (entiers 64 bits signés)"""
+
+    def __init__(self, data):
+        values = array("q", data)
+        self.size = len(values)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, values.itemsize * self.size))
+        self.shm.buf[:values.itemsize * self.size] = values.tobytes()
+        self.name = self.shm.name
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def read_shared_input(name, size):
+    """Relit dans un processus de travail la liste déposée par SharedInput"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf[:8 * size]
+        try:
+            with view.cast("q") as values:
+                return values.tolist()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def _init_worker(cpu_counter, cpus):
+    """Épingle chaque processus de travail sur son propre cœur (si demandé et possible)"""
+    # Un processus créé depuis l'interface hérite du gestionnaire de SIGTERM de SDL,
+    # qui empêcherait l'arrêt des processus en cas d'annulation
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    if cpus and hasattr(os, "sched_setaffinity"):
+        with cpu_counter.get_lock():
+            index = cpu_counter.value
+            cpu_counter.value += 1
+        os.sched_setaffinity(0, {cpus[index % len(cpus)]})
+
+
+def _run_job(job):
+    """Exécute un travail dans un processus du pool et renvoie son résultat"""
+    kind, name, input_key, shm_name, size, repetition, warmup = job
+    data = read_shared_input(shm_name, size)
+    sorting_function = ALGORITHMS[name]
+    result = {"kind": kind, "algorithm": name, "input": input_key, "size": size, "repetition": repetition}
+    if kind == TIME:
+        for _ in range(warmup):
+            time_sort(sorting_function, data)
+        elapsed, arr = time_sort(sorting_function, data)
+        if arr != sorted(data):
+            raise RuntimeError(f"{name} n'a pas trié les données")
+        result["time_ns"] = elapsed
+    elif kind == MEMORY:
+        result["memory"] = measure_memory(sorting_function, data)
+    else:
+        result["counts"] = count_operations(sorting_function, data)[1].as_dict()
+    return result
+
+
+def _iter_completed(function, payloads, workers=None, pin=False, idle=None, in_parent=None):
+    """Exécute function(payload) sur un pool pour chaque payload et produit les résultats dès qu'ils sont prêts.
+
+    Au plus IN_FLIGHT_PER_WORKER travaux par processus sont soumis à la fois :
+    tant que idle() ne rend pas la main (pause), aucun nouveau travail ne part.
+    Si idle() renvoie False, les processus sont arrêtés sans attendre la fin
+    des travaux en cours. Les payloads pour lesquels in_parent(payload) est
+    vrai sont exécutés dans le processus courant, après l'arrêt du pool.
+    """
+    workers = workers or default_workers()
+    cpus = sorted(os.sched_getaffinity(0))[:workers] if pin and hasattr(os, "sched_getaffinity") else []
+    cpu_counter = multiprocessing.Value("i", 0)
+    local = [payload for payload in payloads if in_parent is not None and in_parent(payload)]
+    remaining = iter([payload for payload in payloads if in_parent is None or not in_parent(payload)])
+    completed = queue.SimpleQueue()  # (succès, résultat ou exception), rempli par le pool
+    # La sortie du bloc with termine les processus (fin normale, annulation ou erreur)
+    with multiprocessing.Pool(workers, _init_worker, (cpu_counter, cpus)) as pool:
+        in_flight = 0
+        while True:
+            for payload in islice(remaining, workers * IN_FLIGHT_PER_WORKER - in_flight):
+                pool.apply_async(function, (payload,),
+                                 callback=lambda result: completed.put((True, result)),
+                                 error_callback=lambda error: completed.put((False, error)))
+                in_flight += 1
+            if not in_flight:
+                break
+            try:
+                ok, result = completed.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                pass
+            else:
+                in_flight -= 1
+                if not ok:
+                    raise result
+                yield result
+            if idle is not None and idle() is False:
+                return
+    for payload in local:
+        if idle is not None and idle() is False:
+            return
+        yield function(payload)
+
+
+def run_jobs(jobs, inputs, workers=None, pin=False, idle=None):
+    """Générateur : exécute les travaux sur le pool et produit chaque résultat dès qu'il est prêt.
+
+    - jobs : liste de tuples (type, algorithme, clé d'entrée, répétition, chauffe)
+    - inputs : dictionnaire clé d'entrée -> liste d'entiers
+    - workers : nombre maximal de processus (default_workers() par défaut)
+    - pin : épingler chaque processus sur un cœur distinct
+    - idle : fonction appelée régulièrement pendant l'attente (interface
+      graphique) ; si elle renvoie False, les travaux restants sont annulés
+
+    Les travaux des algorithmes de SPAWNING_ALGORITHMS tournent dans le
+    processus courant, après ceux du pool, pour pouvoir lancer leurs processus.
+    """
+    shared = {key: SharedInput(data) for key, data in inputs.items()}
+    try:
+        payloads = [(kind, name, key, shared[key].name, shared[key].size, repetition, warmup)
+                    for kind, name, key, repetition, warmup in jobs]
+        yield from _iter_completed(_run_job, payloads, workers, pin, idle,
+                                   in_parent=lambda payload: payload[1] in SPAWNING_ALGORITHMS)
+    finally:
+        for block in shared.values():
+            block.close()
+
+
+def _run_sweep(job):
+    """Balayage adaptatif complet d'un algorithme, dans un processus du pool"""
+    name, budget, seed, distribution, repeats, warmup, cached = job
+    sweep = adaptive_sweep(ALGORITHMS[name], budget=budget, repeats=repeats, warmup=warmup, seed=seed,
+                           distribution=distribution, cached=cached)
+    sweep["algorithm"] = name
+    return sweep
+
+
+def run_parallel_sweeps(algorithm_names=None, budget=2.0, seed=0, workers=None, pin=False,
+                        on_result=None, idle=None, distributions=("uniform",), cache=None, repeats=3, warmup=1):
+    """Balayages adaptatifs (benchmark.adaptive_sweep) de plusieurs algorithmes en parallèle.
+
+    Chaque couple (algorithme, distribution) dispose de son propre budget de
+    temps ; on_result(sweep) est appelé dès qu'un balayage est terminé.
+    repeats et warmup sont transmis à chaque balayage ; ceux des algorithmes
+    de SPAWNING_ALGORITHMS tournent dans le processus courant. Avec cache
+    (benchmark_cache.BenchmarkCache) et une graine fixée, les points déjà
+    mesurés pour le code actuel de l'algorithme sont repris (marqués
+    "cached") et seuls les autres sont mesurés puis ajoutés au cache.
+    """
+    sweeps = []
+    use_cache = cache is not None and seed is not None
+    protocol = (seed, repeats, warmup)
+    jobs = [(name, budget, seed, distribution, repeats, warmup,
+             cache.points(name, distribution, *protocol) if use_cache else None)
+            for distribution in distributions for name in (algorithm_names or ALGORITHMS)]
+    for sweep in _iter_completed(_run_sweep, jobs, workers, pin, idle,
+                                 in_parent=lambda job: job[0] in SPAWNING_ALGORITHMS):
+        sweeps.append(sweep)
+        if use_cache:
+            cache.record_sweep(sweep["algorithm"], sweep, *protocol)
+            cache.save()
+        if on_result is not None:
+            on_result(sweep)
+    return sweeps
+
+
+def run_parallel_benchmark(algorithm_names=None, sizes=(100, 1000), repeats=5, warmup=1, seed=0,
+                           workers=None, pin=False, memory=False, count=False, on_result=None, idle=None,
+                           distributions=("uniform",)):
+    """Équivalent parallèle de benchmark.run_benchmark.
+
+    Les répétitions d'un même triplet (algorithme, taille, distribution) sont réparties
+    sur le pool ; dès qu'elles sont toutes terminées, le résumé statistique
+    est transmis à on_result(stats). Renvoie la liste des résumés, dans
+    l'ordre d'achèvement.
+    """
+    algorithm_names = list(algorithm_names or ALGORITHMS)
+    inputs = {(size, distribution): generate_input(size, seed, distribution=distribution)
+              for size in sizes for distribution in distributions}
+    jobs = []
+    for key in inputs:
+        for name in algorithm_names:
+            jobs.extend((TIME, name, key, repetition, warmup) for repetition in range(repeats))
+            if memory:
+                jobs.append((MEMORY, name, key, 0, 0))
+            if count:
+                jobs.append((COUNT, name, key, 0, 0))
+    expected = repeats + int(memory) + int(count)
+
+    partial = {}
+    results = []
+    for job_result in run_jobs(jobs, inputs, workers, pin, idle):
+        key = (job_result["algorithm"],) + job_result["input"]
+        entry = partial.setdefault(key, {"times_ns": [], "received": 0})
+        entry["received"] += 1
+        if job_result["kind"] == TIME:
+            entry["times_ns"].append(job_result["time_ns"])
+        elif job_result["kind"] == MEMORY:
+            entry["memory"] = job_result["memory"]
+        else:
+            entry["counts"] = job_result["counts"]
+        if entry["received"] == expected:
+            stats = summarize(entry["times_ns"])
+            stats.update(entry, algorithm=key[0], size=key[1], distribution=key[2])
+            del stats["received"]
+            if key[0] == AUTO:
+                stats["decision"] = decide(inputs[key[1:]])
+            results.append(stats)
+            if on_result is not None:
+                on_result(stats)
+    return results
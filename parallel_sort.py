@@ -0,0 +1,234 @@
+"""Tris parallèles d'entiers sur plusieurs processus, en mémoire partagée.
+
+Les données (int64) sont placées dans deux blocs de mémoire partagée de
+même taille (multiprocessing.shared_memory) : les éléments et un tampon.
+Les processus de travail ne reçoivent que le nom des blocs et des bornes
+d'indices ; aucune donnée n'est sérialisée.
+
+- parallel_merge_sort : chaque processus trie un morceau, puis les
+  morceaux sont fusionnés deux à deux, niveau par niveau (arbre de
+  fusion). Chaque fusion est découpée en tranches indépendantes (par
+  co-rang) pour que tous les processus travaillent jusqu'au dernier niveau.
+- sample_sort : des séparateurs tirés d'un échantillon définissent un seau
+  par processus ; chaque processus trie son morceau, puis rassemble et
+  fusionne les parts d'un seau venant de tous les morceaux.
+
+Sous PARALLEL_MIN_SIZE éléments, avec un seul processus, ou depuis un
+processus démon (pool de benchmark, qui ne peut pas créer de processus),
+les mêmes étapes sont exécutées dans le processus courant.
+"""
+import multiprocessing
+import os
+import signal
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# En dessous, lancer des processus coûte plus cher que le tri lui-même
+PARALLEL_MIN_SIZE = 1 << 16
+
+# Taille de l'échantillon de sample_sort, par seau
+SAMPLE_OVERSAMPLING = 64
+
+# Blocs utilisés par les étapes, par nom (attachés une fois par processus)
+_buffers = {}
+# Blocs attachés dans ce processus : ils doivent vivre aussi longtemps que leurs vues NumPy
+_attached = []
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def _init_worker():
+    # Un processus créé depuis l'interface hérite du gestionnaire de SIGTERM de SDL,
+    # qui empêcherait l'arrêt du pool
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+
+def _buffer(name, size):
+    """Tableau int64 du bloc name, attaché au premier accès dans ce processus"""
+    buffer = _buffers.get(name)
+    if buffer is None:
+        shm = shared_memory.SharedMemory(name=name)
+        _attached.append(shm)
+        buffer = _buffers[name] = np.ndarray((size,), dtype=np.int64, buffer=shm.buf)
+    return buffer
+
+
+class _Workspace:
+    """Les deux blocs (éléments et tampon) et le pool de processus qui travaille dessus"""
+
+    def __init__(self, keys, workers):
+        self.size = len(keys)
+        self.workers = workers
+        self.pool = None
+        self._segments = []
+        local = workers < 2 or self.size < PARALLEL_MIN_SIZE or multiprocessing.current_process().daemon
+        if local:
+            self.names = (f"local-{id(self)}-0", f"local-{id(self)}-1")
+            self.arrays = [np.array(keys, dtype=np.int64), np.empty(self.size, dtype=np.int64)]
+            _buffers.update(zip(self.names, self.arrays))
+            return
+        self._segments = [shared_memory.SharedMemory(create=True, size=max(1, 8 * self.size)) for _ in range(2)]
+        self.names = tuple(segment.name for segment in self._segments)
+        self.arrays = [np.ndarray((self.size,), dtype=np.int64, buffer=segment.buf) for segment in self._segments]
+        self.arrays[0][:] = keys
+        self.pool = multiprocessing.Pool(workers, _init_worker)
+
+    def map(self, function, tasks):
+        if self.pool is None:
+            return [function(task) for task in tasks]
+        return self.pool.map(function, tasks, chunksize=1)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        for name in self.names:
+            _buffers.pop(name, None)
+        # Les vues NumPy doivent disparaître avant la fermeture des blocs
+        self.arrays = []
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+
+
+def _chunk_bounds(size, count):
+    return [size * k // count for k in range(count + 1)]
+
+
+def _sort_chunk(task):
+    """Trie en place les éléments [low, high) du bloc name"""
+    name, size, low, high = task
+    _buffer(name, size)[low:high].sort()
+
+
+def _merge_slice(task):
+    """Fusionne source[a_low:a_high] et source[b_low:b_high] (triés) dans target, à partir de out"""
+    source_name, target_name, size, a_low, a_high, b_low, b_high, out = task
+    source = _buffer(source_name, size)
+    merged = _buffer(target_name, size)[out:out + (a_high - a_low) + (b_high - b_low)]
+    merged[:a_high - a_low] = source[a_low:a_high]
+    merged[a_high - a_low:] = source[b_low:b_high]
+    # Deux suites triées bout à bout : le tri stable de NumPy (timsort) les fusionne en temps linéaire
+    merged.sort(kind="stable")
+
+
+def _co_rank(a, b, k):
+    """Nombre d'éléments de a parmi les k premiers de la fusion de a et b"""
+    low, high = max(0, k - len(b)), min(k, len(a))
+    while low < high:
+        i = (low + high) // 2
+        if a[i] < b[k - i - 1]:
+            low = i + 1
+        else:
+            high = i
+    return low
+
+
+def _merge_tasks(workspace, source, pair, slices):
+    """Tranches indépendantes de la fusion d'une paire de suites (une suite seule est recopiée)"""
+    (a_low, a_high), (b_low, b_high) = pair if len(pair) == 2 else (pair[0], (pair[0][1], pair[0][1]))
+    array = workspace.arrays[source]
+    a, b = array[a_low:a_high], array[b_low:b_high]
+    total = len(a) + len(b)
+    cuts = [total * k // slices for k in range(slices + 1)]
+    ranks = [_co_rank(a, b, k) for k in cuts]
+    return [(workspace.names[source], workspace.names[1 - source], workspace.size,
+             a_low + ranks[k], a_low + ranks[k + 1],
+             b_low + cuts[k] - ranks[k], b_low + cuts[k + 1] - ranks[k + 1],
+             a_low + cuts[k])
+            for k in range(slices) if cuts[k + 1] > cuts[k]]
+
+
+def parallel_merge_sort(keys, workers=None, on_step=None):
+    """Renvoie une copie triée des entiers keys : tri de morceaux en parallèle, puis fusion en arbre.
+
+    on_step(values) est appelé avec l'état complet du tableau après le tri
+    des morceaux et après chaque niveau de fusion (animation).
+    """
+    workers = workers or default_workers()
+    workspace = _Workspace(keys, workers)
+    try:
+        size = workspace.size
+        bounds = _chunk_bounds(size, workers)
+        runs = [(low, high) for low, high in zip(bounds, bounds[1:]) if high > low]
+        source = 0
+        workspace.map(_sort_chunk, [(workspace.names[source], size, low, high) for low, high in runs])
+        if on_step is not None:
+            on_step(workspace.arrays[source])
+
+        while len(runs) > 1:
+            # Chaque paire de suites est découpée en autant de tranches qu'il faut pour occuper tous les processus
+            pairs = [runs[k:k + 2] for k in range(0, len(runs), 2)]
+            tasks = []
+            for pair in pairs:
+                tasks.extend(_merge_tasks(workspace, source, pair, -(-workers // len(pairs))))
+            workspace.map(_merge_slice, tasks)
+            runs = [(pair[0][0], pair[-1][1]) for pair in pairs]
+            source = 1 - source
+            if on_step is not None:
+                on_step(workspace.arrays[source])
+        return np.array(workspace.arrays[source])
+    finally:
+        workspace.close()
+
+
+def _sort_and_cut(task):
+    """Trie un morceau et renvoie, pour chaque séparateur, l'indice où commence le seau suivant"""
+    name, size, low, high, splitters = task
+    chunk = _buffer(name, size)[low:high]
+    chunk.sort()
+    return low + np.searchsorted(chunk, splitters, side="right")
+
+
+def _gather_bucket(task):
+    """Recopie les parts (triées) d'un seau dans target à partir de out, puis les fusionne"""
+    source_name, target_name, size, pieces, out = task
+    source = _buffer(source_name, size)
+    target = _buffer(target_name, size)
+    position = out
+    for low, high in pieces:
+        target[position:position + high - low] = source[low:high]
+        position += high - low
+    target[out:position].sort(kind="stable")
+
+
+def sample_sort(keys, workers=None, on_step=None, seed=0):
+    """Renvoie une copie triée des entiers keys par tri par échantillonnage sur workers processus.
+
+    Les workers - 1 séparateurs sont pris à intervalles réguliers dans un
+    échantillon trié de SAMPLE_OVERSAMPLING éléments par seau. Des valeurs
+    très répétées peuvent déséquilibrer les seaux, pas fausser le tri.
+    on_step(values) est appelé après le tri des morceaux et à la fin.
+    """
+    workers = workers or default_workers()
+    keys = np.asarray(keys)
+    sample = np.sort(np.random.default_rng(seed).choice(keys, workers * SAMPLE_OVERSAMPLING)) \
+        if len(keys) else keys
+    splitters = sample[SAMPLE_OVERSAMPLING::SAMPLE_OVERSAMPLING][:workers - 1]
+    workspace = _Workspace(keys, workers)
+    try:
+        size = workspace.size
+        bounds = _chunk_bounds(size, workers)
+        source, target = workspace.names
+        cuts = workspace.map(_sort_and_cut, [(source, size, low, high, splitters)
+                                             for low, high in zip(bounds, bounds[1:])])
+        if on_step is not None:
+            on_step(workspace.arrays[0])
+
+        # Parts de chaque seau dans chaque morceau, et position du seau dans le résultat
+        edges = [[low, *cut, high] for (low, high), cut in zip(zip(bounds, bounds[1:]), cuts)]
+        tasks = []
+        out = 0
+        for bucket in range(len(splitters) + 1):
+            pieces = [(edge[bucket], edge[bucket + 1]) for edge in edges if edge[bucket + 1] > edge[bucket]]
+            tasks.append((source, target, size, pieces, out))
+            out += sum(high - low for low, high in pieces)
+        workspace.map(_gather_bucket, tasks)
+        if on_step is not None:
+            on_step(workspace.arrays[1])
+        return np.array(workspace.arrays[1])
+    finally:
+        workspace.close()
@@ -0,0 +1,123 @@
+"""Profilage optionnel des phases des tris, exportable vers les visionneuses de flamegraphs.
+
+Les tris instrumentés (quick_sort, heap_sort, comb_sort, merge_sort) lisent
+profiling.current une seule fois par appel. Sans profileur actif (None, par
+défaut), ils ne font rien de plus : aucun appel dans les boucles internes.
+
+Avec un Profiler actif, chaque phase (partition, construction du tas,
+passe de comb_sort, niveau de fusion...) est chronométrée par begin() / end()
+et les profondeurs de récursion sont comptées. Les phases s'exportent :
+- au format Chrome trace-event (JSON), lisible par chrome://tracing,
+  Perfetto ou speedscope ;
+- en piles repliées (« collapsed stacks »), une ligne "a;b;c temps_propre"
+  par pile, lisible par flamegraph.pl ou speedscope.
+cProfile peut être activé en plus pendant l'exécution (fichier .prof).
+"""
+import json
+import os
+import time
+from collections import Counter
+
+FORMATS = ("chrome", "collapsed")
+
+# Profileur actif, lu par les tris instrumentés
+current = None
+
+
+class Profiler:
+    """Phases imbriquées (begin / end) et histogrammes de profondeur de récursion.
+
+    events : une entrée par phase terminée, (pile de noms, début en ns depuis
+    la création, durée en ns, temps propre en ns, arguments).
+    depths : {nom : Counter(profondeur -> nombre d'appels)}.
+    Utilisé comme gestionnaire de contexte, il devient profiling.current.
+    """
+
+    def __init__(self, cprofile=False):
+        self.events = []
+        self.depths = {}
+        self.cprofile = None
+        if cprofile:
+            import cProfile
+            self.cprofile = cProfile.Profile()
+        self._stack = []
+        self._previous = None
+        self._origin = time.perf_counter_ns()
+
+    def __enter__(self):
+        global current
+        self._previous = current
+        current = self
+        return self
+
+    def __exit__(self, *exc):
+        global current
+        current = self._previous
+
+    def begin(self, name, **args):
+        self._stack.append([name, time.perf_counter_ns(), 0, args])
+
+    def end(self):
+        now = time.perf_counter_ns()
+        stack = self._stack
+        path = tuple(frame[0] for frame in stack)
+        name, start, children, args = stack.pop()
+        duration = now - start
+        if stack:
+            stack[-1][2] += duration
+        self.events.append((path, start - self._origin, duration, duration - children, args))
+
+    def record_depth(self, name, depth):
+        self.depths.setdefault(name, Counter())[depth] += 1
+
+    def run(self, labels, function, *args):
+        """Exécute function(*args) sous ce profileur, dans les phases labels (de la plus externe à la plus interne)"""
+        with self:
+            for label in labels:
+                self.begin(label)
+            try:
+                if self.cprofile is not None:
+                    return self.cprofile.runcall(function, *args)
+                return function(*args)
+            finally:
+                for _ in labels:
+                    self.end()
+
+    def phase_totals(self):
+        """Temps propre cumulé (ns) de chaque pile de phases"""
+        totals = Counter()
+        for path, _, _, own, _ in self.events:
+            totals[path] += own
+        return totals
+
+    def chrome_trace(self):
+        """Événements complets ("X") au format Chrome trace-event, temps en microsecondes"""
+        pid = os.getpid()
+        return {
+            "traceEvents": [{"name": path[-1], "cat": path[0], "ph": "X", "ts": start / 1000,
+                             "dur": duration / 1000, "pid": pid, "tid": 0, "args": args}
+                            for path, start, duration, _, args in self.events],
+            "displayTimeUnit": "ms",
+        }
+
+    def collapsed_stacks(self):
+        """Lignes "a;b;c poids" : temps propre de chaque pile, en microsecondes"""
+        return [f"{';'.join(path)} {own // 1000}" for path, own in self.phase_totals().items() if own >= 1000]
+
+    def write(self, path, format="chrome"):
+        """Écrit les phases dans path au format "chrome" (JSON) ou "collapsed" ; renvoie path"""
+        if format not in FORMATS:
+            raise ValueError(f"format de profil inconnu : {format}")
+        with open(path, "w", encoding="utf-8") as file:
+            if format == "chrome":
+                json.dump(self.chrome_trace(), file)
+            else:
+                file.write("\n".join(self.collapsed_stacks()) + "\n")
+        return path
+
+    def write_cprofile(self, path):
+        """Écrit les statistiques cProfile (format pstats, .prof) ; renvoie path"""
+        if self.cprofile is None:
+            raise ValueError("profileur créé sans cprofile=True")
+        self.cprofile.dump_stats(path)
+        return path
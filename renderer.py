@@ -0,0 +1,229 @@
+"""Rendu de l'animation des tris avec limitation du nombre d'images par seconde.
+
+Les opérations rejouées entre deux images sont seulement marquées (mark) ;
+chaque image (present) ne redessine que les barres modifiées depuis la
+précédente (mise à jour par rectangles "sales"). La cadence, au plus
+target_fps images par seconde, est réglée par la boucle de relecture.
+
+Au-delà de WIDTH éléments, une barre par élément ne tient plus à l'écran :
+le tableau est alors réparti en colonnes de pixels, chacune affichant le
+minimum, le maximum et la moyenne des éléments qu'elle couvre. Ces
+colonnes sont calculées et peintes avec NumPy puis copiées d'un bloc
+(pygame.surfarray), et seules les colonnes touchées sont recalculées.
+"""
+import math
+
+import numpy as np
+import pygame
+
+from constants import (
+    WIDTH, HEIGHT, BAR_COLOR, BG_COLOR, SELECTED_COLOR, TEXT_COLOR, STATS_HEIGHT, RANGE_COLOR, MEAN_COLOR,
+)
+
+# Au-delà de cette proportion de barres modifiées, un redessin complet coûte moins cher
+FULL_REDRAW_RATIO = 0.5
+
+# Hauteur de la zone des barres, sous les statistiques
+PLOT_HEIGHT = HEIGHT - STATS_HEIGHT
+
+# Couleurs des pixels d'une colonne : fond, étendue min-max, barre, moyenne, surbrillance
+_PALETTE = np.array([BG_COLOR, RANGE_COLOR, BAR_COLOR, MEAN_COLOR, SELECTED_COLOR], dtype=np.uint8)
+
+
+class FrameRenderer:
+    def __init__(self, screen, font, target_fps=60, ops_per_frame=None, target_duration=None):
+        """
+        - ops_per_frame : nombre fixe d'opérations appliquées entre deux images
+          (l'animation est alors cadencée par l'horloge à target_fps)
+        - target_duration : durée totale souhaitée de l'animation en secondes,
+          utilisée quand le nombre total d'opérations est connu
+        Sans aucun des deux, une opération est appliquée par image.
+        """
+        self.screen = screen
+        self.font = font
+        self.target_fps = target_fps
+        self.ops_per_frame = ops_per_frame
+        self.target_duration = target_duration
+        self.numbers = []
+        self.stats_provider = lambda: []
+        self.frames = 0
+        self._dirty = set()
+        self._highlighted = ()
+        self._batch = None
+        # Mise à l'échelle des valeurs : hauteur = (valeur - _low) * _scale
+        self._low = 0
+        self._scale = 1.0
+        # Mode par colonnes de pixels (tableaux de plus de WIDTH éléments)
+        self._binned = False
+        self._mirror = None  # copie NumPy du tableau, mise à jour à chaque image
+        self._bounds = None  # indices de début des colonnes, puis len(numbers)
+        self._image = None  # pixels de la zone des barres, (WIDTH, PLOT_HEIGHT, 3)
+        self._plot = None
+
+    def start(self, numbers, stats_provider=None, total_operations=None):
+        """Associe le rendu à la liste en cours de tri et dessine l'image initiale"""
+        self.numbers = numbers
+        if stats_provider is not None:
+            self.stats_provider = stats_provider
+        self.frames = 0
+        self._dirty = set()
+        self._highlighted = ()
+        self._batch = self.ops_per_frame
+        if self._batch is None and self.target_duration and total_operations:
+            self._batch = max(1, math.ceil(total_operations / (self.target_duration * self.target_fps)))
+        self._set_scale()
+        self._binned = len(numbers) > WIDTH
+        if self._binned:
+            # La colonne c couvre les indices i tels que i * WIDTH // n == c
+            count = len(numbers)
+            self._bounds = -(-np.arange(WIDTH + 1) * count // WIDTH)
+            self._image = np.empty((WIDTH, PLOT_HEIGHT, 3), dtype=np.uint8)
+            self._plot = pygame.Surface((WIDTH, PLOT_HEIGHT))
+        self.draw_full()
+
+    def _set_scale(self):
+        """La plus grande valeur occupe toute la hauteur (le tri ne fait que permuter les valeurs)"""
+        if not self.numbers:
+            return
+        self._low = min(0, min(self.numbers))
+        self._scale = PLOT_HEIGHT / max(1, max(self.numbers) - self._low)
+
+    @property
+    def bar_width(self):
+        count = len(self.numbers)
+        return WIDTH // count if 0 < count <= WIDTH else 1
+
+    @property
+    def visible_count(self):
+        return min(len(self.numbers), WIDTH // self.bar_width)
+
+    def bar_height(self, value):
+        return min(int((value - self._low) * self._scale), PLOT_HEIGHT)
+
+    @property
+    def ops_per_frame_hint(self):
+        """Nombre d'opérations par image retenu (1 si l'animation n'est pas cadencée)"""
+        return self._batch or 1
+
+    def mark(self, i, j):
+        """Marque les barres i et j comme modifiées, sans afficher d'image"""
+        self._dirty.add(i)
+        self._dirty.add(j)
+        self._highlighted = (i, j)
+
+    def _bar_rect(self, index):
+        bar_width = self.bar_width
+        height = self.bar_height(self.numbers[index])
+        return pygame.Rect(index * bar_width, HEIGHT - height, bar_width, height)
+
+    def _column_rect(self, index):
+        bar_width = self.bar_width
+        return pygame.Rect(index * bar_width, STATS_HEIGHT, bar_width, HEIGHT - STATS_HEIGHT)
+
+    def _draw_stats(self):
+        stats_rect = pygame.Rect(0, 0, WIDTH, STATS_HEIGHT)
+        self.screen.fill(BG_COLOR, stats_rect)
+        lines = self.stats_provider()
+        # Resserrer les lignes lorsqu'elles ne tiennent plus dans la zone réservée
+        spacing = min(30, (STATS_HEIGHT - 10) // max(1, len(lines)))
+        for line_number, line in enumerate(lines):
+            text = self.font.render(line, True, TEXT_COLOR)
+            self.screen.blit(text, (10, 10 + spacing * line_number))
+        return stats_rect
+
+    def _column_heights(self, columns):
+        """Hauteurs (pixels) du minimum, du maximum et de la moyenne des colonnes triées columns"""
+        bounds = self._bounds
+        # reduceat sur les paires (début, fin) : seules les positions paires sont utiles
+        indices = np.column_stack((bounds[columns], bounds[columns + 1])).ravel()
+        if indices[-1] == len(self._mirror):
+            indices = indices[:-1]
+        mirror = self._mirror
+        minimum = np.minimum.reduceat(mirror, indices)[::2]
+        maximum = np.maximum.reduceat(mirror, indices)[::2]
+        mean = np.add.reduceat(mirror, indices)[::2] / (bounds[columns + 1] - bounds[columns])
+        return [np.minimum(((values - self._low) * self._scale).astype(np.int16), PLOT_HEIGHT)
+                for values in (minimum, maximum, mean)]
+
+    def _paint_columns(self, columns, highlighted_columns=()):
+        """Peint les colonnes columns dans l'image : barre jusqu'au minimum, bande jusqu'au maximum, trait moyen"""
+        low, high, mean = self._column_heights(columns)
+        # Hauteur de chaque ligne de pixels au-dessus du bas de la zone (la ligne 0 est en haut)
+        levels = np.arange(PLOT_HEIGHT, 0, -1, dtype=np.int16)
+        # Numéro de couleur de chaque pixel dans _PALETTE, puis une seule indexation pour les couleurs
+        shades = (levels <= high[:, None]).view(np.uint8) + (levels <= low[:, None]).view(np.uint8)
+        shades[levels == np.maximum(mean, 1)[:, None]] = 3
+        if len(highlighted_columns):
+            selected = np.isin(columns, highlighted_columns)
+            shades[selected] = np.where(shades[selected] > 0, 4, 0)
+        self._image[columns] = _PALETTE[shades]
+
+    def _draw_columns(self, dirty, highlighted):
+        """Met à jour la copie NumPy pour les indices dirty puis repeint leurs colonnes ; renvoie leur rectangle"""
+        count = len(self.numbers)
+        if dirty is None or len(dirty) > count * FULL_REDRAW_RATIO:
+            self._mirror = np.array(self.numbers, dtype=np.float64)
+            columns = np.arange(WIDTH)
+        else:
+            indices = np.fromiter(dirty, dtype=np.int64, count=len(dirty))
+            numbers = self.numbers
+            self._mirror[indices] = [numbers[index] for index in indices.tolist()]
+            columns = np.unique(indices * WIDTH // count)
+        if len(columns) == 0:
+            return None
+        highlighted_columns = np.array([index * WIDTH // count for index in highlighted], dtype=np.int64)
+        self._paint_columns(columns, highlighted_columns)
+        pygame.surfarray.blit_array(self._plot, self._image)
+        left, right = int(columns[0]), int(columns[-1]) + 1
+        self.screen.blit(self._plot, (left, STATS_HEIGHT), pygame.Rect(left, 0, right - left, PLOT_HEIGHT))
+        return pygame.Rect(left, STATS_HEIGHT, right - left, PLOT_HEIGHT)
+
+    def draw_full(self, highlighted=()):
+        """Redessine tout l'écran (image initiale, image finale ou trop de barres modifiées)"""
+        if self._binned:
+            self._draw_columns(None, highlighted)
+            self._draw_stats()
+            pygame.display.flip()
+            self._dirty = set(highlighted)
+            self.frames += 1
+            return
+        self.screen.fill(BG_COLOR)
+        for index in range(self.visible_count):
+            color = SELECTED_COLOR if index in highlighted else BAR_COLOR
+            pygame.draw.rect(self.screen, color, self._bar_rect(index))
+        self._draw_stats()
+        pygame.display.flip()
+        self._dirty = set(highlighted)
+        self.frames += 1
+
+    def present(self):
+        """Affiche une image en ne redessinant que les barres modifiées"""
+        highlighted = self._highlighted
+        if self._binned:
+            rects = [self._draw_stats(), self._draw_columns(self._dirty, highlighted)]
+            pygame.display.update([rect for rect in rects if rect is not None])
+            self._dirty = set(highlighted)
+            self.frames += 1
+            return
+        visible = self.visible_count
+        dirty = [index for index in self._dirty if index < visible]
+        if len(dirty) > visible * FULL_REDRAW_RATIO:
+            self.draw_full(highlighted)
+            return
+        rects = [self._draw_stats()]
+        for index in dirty:
+            column = self._column_rect(index)
+            self.screen.fill(BG_COLOR, column)
+            color = SELECTED_COLOR if index in highlighted else BAR_COLOR
+            pygame.draw.rect(self.screen, color, self._bar_rect(index))
+            rects.append(column)
+        pygame.display.update(rects)
+        # Les barres en rouge devront être repeintes en bleu à l'image suivante
+        self._dirty = set(highlighted)
+        self.frames += 1
+
+    def finish(self):
+        """Dessine l'image finale, sans surbrillance"""
+        self._highlighted = ()
+        self.draw_full()
+
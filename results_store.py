@@ -0,0 +1,113 @@
+"""Stockage persistant des résultats de benchmark.
+
+Le fichier est au format JSON Lines : une ligne par exécution mesurée,
+ajoutée en fin de fichier sans jamais réécrire les précédentes. Chaque
+enregistrement garde toutes ses répétitions, ainsi que la distribution des
+données, la version de Python et une empreinte de la machine. Le fichier
+n'est lu qu'à la première consultation.
+"""
+import hashlib
+import json
+import math
+import os
+import platform
+import statistics
+import time
+
+DEFAULT_PATH = "resultats_benchmarks.jsonl"
+
+
+def python_version():
+    return f"{platform.python_implementation()} {platform.python_version()}"
+
+
+def machine_fingerprint():
+    """Empreinte courte de la machine (nom, architecture, processeur, nombre de cœurs)"""
+    description = "|".join([platform.node(), platform.machine(), platform.processor(), str(os.cpu_count())])
+    return hashlib.sha1(description.encode()).hexdigest()[:12]
+
+
+def median_confidence_interval(values, z=1.96):
+    """Intervalle de confiance (~95 %) de la médiane, par les statistiques d'ordre"""
+    ordered = sorted(values)
+    n = len(ordered)
+    half_width = z * math.sqrt(n) / 2
+    low = max(0, math.floor(n / 2 - half_width))
+    high = min(n - 1, math.ceil(n / 2 + half_width) - 1)
+    return ordered[low], ordered[high]
+
+
+class ResultsStore:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._index = None  # (algorithme, distribution, python, machine) -> {taille: [temps en ns]}
+        self.python = python_version()
+        self.machine = machine_fingerprint()
+
+    def _load(self):
+        index = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # ligne tronquée (exécution interrompue pendant l'écriture)
+                    self._add_to_index(index, record)
+        self._index = index
+
+    @staticmethod
+    def _add_to_index(index, record):
+        key = (record["algorithm"], record["distribution"], record["python"], record["machine"])
+        index.setdefault(key, {}).setdefault(record["size"], []).extend(record["times_ns"])
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._load()
+        return self._index
+
+    def append(self, algorithm, size, times_ns, distribution="uniform"):
+        """Ajoute une exécution (toutes ses répétitions) en fin de fichier"""
+        record = {
+            "algorithm": algorithm,
+            "size": size,
+            "distribution": distribution,
+            "python": self.python,
+            "machine": self.machine,
+            "times_ns": list(times_ns),
+            "timestamp": time.time(),
+        }
+        line = json.dumps(record) + "\n"
+        with open(self.path, "a+b") as file:
+            # Dernière ligne sans fin (écriture interrompue) : elle est close pour ne pas
+            # absorber ce nouvel enregistrement
+            if file.seek(0, os.SEEK_END):
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    line = "\n" + line
+            file.write(line.encode("utf-8"))
+        # L'index n'est mis à jour que s'il a déjà été chargé
+        if self._index is not None:
+            self._add_to_index(self._index, record)
+        return record
+
+    def times_by_size(self, algorithm, distribution="uniform", python=None, machine=None):
+        """Temps (ns) de toutes les sessions, par taille, pour cette machine et ce Python par défaut"""
+        key = (algorithm, distribution, python or self.python, machine or self.machine)
+        return self.index.get(key, {})
+
+    def series(self, algorithm, distribution="uniform", python=None, machine=None):
+        """Liste triée de (taille, médiane, borne basse, borne haute), en secondes"""
+        points = []
+        for size, times in sorted(self.times_by_size(algorithm, distribution, python, machine).items()):
+            low, high = median_confidence_interval(times)
+            points.append((size, statistics.median(times) / 1e9, low / 1e9, high / 1e9))
+        return points
+
+    def archive(self):
+        """Met le fichier actuel de côté (renommé avec un horodatage) et repart d'un stockage vide"""
+        if os.path.exists(self.path):
+            root, extension = os.path.splitext(self.path)
+            os.replace(self.path, f"{root}.{time.strftime('%Y%m%d-%H%M%S')}{extension}")
+        self._index = {}
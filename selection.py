@@ -0,0 +1,197 @@
+"""Sélection : k-ième élément, k plus petits éléments et tri partiel, sans trier tout le tableau.
+
+- nth_element : introselect. Sélection rapide (pivot médiane de trois,
+  partition en trois zones) qui ne poursuit que du côté contenant k ; au-delà
+  de 2 * log2(n) partitions, le pivot devient la médiane des médianes (groupes
+  de 5), ce qui garantit un temps linéaire dans le pire cas.
+- top_k : tas borné de k éléments parcourant l'entrée une seule fois, en
+  O(n log k). Une liste est traitée en place (le tas occupe ses k premières
+  cases) ; tout autre itérable est lu comme un flux.
+- partial_sort : nth_element puis tri des k premières cases seulement, en
+  O(n + k log k).
+
+Comme pour SortingAlgorithms, le crochet draw_swap(arr, i, j) reçoit chaque
+échange (i != j) ou chaque écriture déjà faite (i == j) : les sélections
+peuvent être animées et enregistrées par OperationTrace.
+"""
+import heapq
+
+from sorting_algorithms import INSERTION_CUTOFF, SortingAlgorithms
+
+# Fractions k / n mesurées par benchmark.selection_benchmark
+SELECTION_RATIOS = (0.001, 0.01, 0.1, 0.5, 1.0)
+
+
+def _check_k(k, n):
+    if not 0 <= k < n:
+        raise IndexError(f"rang {k} hors du tableau de {n} éléments")
+
+
+class SelectionAlgorithms:
+
+    @staticmethod
+    def nth_element(arr, k, draw_swap=None):
+        """Réordonne arr pour que arr[k] soit l'élément de rang k (0 : le plus petit).
+
+        Ensuite arr[i] <= arr[k] pour i < k et arr[i] >= arr[k] pour i > k.
+        Renvoie arr[k].
+        """
+        _check_k(k, len(arr))
+        SelectionAlgorithms._select(arr, 0, len(arr) - 1, k, draw_swap, 2 * len(arr).bit_length())
+        return arr[k]
+
+    @staticmethod
+    def _select(arr, start, end, k, draw_swap=None, depth=0):
+        """Introselect sur arr[start..end] (bornes incluses) ; depth : partitions avant la médiane des médianes"""
+        def exchange(i, j):
+            if draw_swap is None:
+                arr[i], arr[j] = arr[j], arr[i]
+            else:
+                draw_swap(arr, i, j)
+
+        def insertion_sort_range(low, high):
+            for i in range(low + 1, high + 1):
+                j = i
+                while j > low and arr[j] < arr[j - 1]:
+                    exchange(j, j - 1)
+                    j -= 1
+
+        def median_of_three(a, b, c):
+            if arr[a] < arr[b]:
+                if arr[b] < arr[c]:
+                    return b
+                return c if arr[a] < arr[c] else a
+            if arr[a] < arr[c]:
+                return a
+            return c if arr[b] < arr[c] else b
+
+        def median_of_medians(low, high):
+            # La médiane de chaque groupe de 5 est rangée au début de la zone, puis on en prend la médiane
+            groups = 0
+            for group in range(low, high + 1, 5):
+                last = min(group + 4, high)
+                insertion_sort_range(group, last)
+                median = (group + last) // 2
+                if median != low + groups:
+                    exchange(median, low + groups)
+                groups += 1
+            middle = low + (groups - 1) // 2
+            SelectionAlgorithms._select(arr, low, low + groups - 1, middle, draw_swap, 0)
+            return arr[middle]
+
+        while end - start + 1 > INSERTION_CUTOFF:
+            if depth > 0:
+                depth -= 1
+                pivot = arr[median_of_three(start, (start + end) // 2, end)]
+            else:
+                pivot = median_of_medians(start, end)
+            # Invariant : [start, lt) < pivot, [lt, i) == pivot, (gt, end] > pivot
+            lt, i, gt = start, start, end
+            while i <= gt:
+                value = arr[i]
+                if value < pivot:
+                    if lt != i:
+                        if draw_swap is None:
+                            arr[lt], arr[i] = arr[i], arr[lt]
+                        else:
+                            draw_swap(arr, lt, i)
+                    lt += 1
+                    i += 1
+                elif pivot < value:
+                    if i != gt:
+                        if draw_swap is None:
+                            arr[i], arr[gt] = arr[gt], arr[i]
+                        else:
+                            draw_swap(arr, i, gt)
+                    gt -= 1
+                else:
+                    i += 1
+            if k < lt:
+                end = lt - 1
+            elif k > gt:
+                start = gt + 1
+            else:
+                return
+        insertion_sort_range(start, end)
+
+    @staticmethod
+    def top_k(items, k, draw_swap=None):
+        """Les k plus petits éléments de items, triés, par un tas borné (O(n log k)).
+
+        Une liste est modifiée en place : à la fin, ses k premières cases
+        contiennent le résultat. Un autre itérable (générateur, fichier...)
+        est parcouru une seule fois sans être copié.
+        """
+        if k <= 0:
+            return []
+        if not isinstance(items, list):
+            return heapq.nsmallest(k, items)
+        arr = items
+        k = min(k, len(arr))
+
+        def sift_down(root, size):
+            # Tas max sur arr[0:size] : la racine est le plus grand des k candidats
+            while True:
+                largest = root
+                left = 2 * root + 1
+                right = left + 1
+                if left < size and arr[largest] < arr[left]:
+                    largest = left
+                if right < size and arr[largest] < arr[right]:
+                    largest = right
+                if largest == root:
+                    return
+                if draw_swap is None:
+                    arr[root], arr[largest] = arr[largest], arr[root]
+                else:
+                    draw_swap(arr, root, largest)
+                root = largest
+
+        for root in range(k // 2 - 1, -1, -1):
+            sift_down(root, k)
+        for i in range(k, len(arr)):
+            # Un élément plus petit que le plus grand candidat le remplace
+            if arr[i] < arr[0]:
+                if draw_swap is None:
+                    arr[0], arr[i] = arr[i], arr[0]
+                else:
+                    draw_swap(arr, 0, i)
+                sift_down(0, k)
+        for last in range(k - 1, 0, -1):
+            if draw_swap is None:
+                arr[0], arr[last] = arr[last], arr[0]
+            else:
+                draw_swap(arr, 0, last)
+            sift_down(0, last)
+        return arr[:k]
+
+    @staticmethod
+    def partial_sort(arr, k, draw_swap=None):
+        """Place dans arr[:k], triés, les k plus petits éléments ; le reste n'est pas ordonné"""
+        k = min(k, len(arr))
+        if k <= 0:
+            return
+        if k < len(arr):
+            SelectionAlgorithms.nth_element(arr, k - 1, draw_swap)
+        prefix = arr[:k]
+        if draw_swap is None:
+            SortingAlgorithms.quick_sort(prefix)
+            arr[:k] = prefix
+            return
+
+        # Les indices du préfixe sont ceux de arr : chaque opération est reportée sur arr
+        def prefix_swap(values, i, j):
+            if i != j:
+                values[i], values[j] = values[j], values[i]
+                draw_swap(arr, i, j)
+            else:
+                arr[i] = values[i]
+                draw_swap(arr, i, i)
+        SortingAlgorithms.quick_sort(prefix, prefix_swap)
+
+
+SELECTIONS = {
+    "nth_element": SelectionAlgorithms.nth_element,
+    "top_k": SelectionAlgorithms.top_k,
+    "partial_sort": SelectionAlgorithms.partial_sort,
+}
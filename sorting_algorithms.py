@@ -1,9 +1,50 @@
+import operator
 import time
+from bisect import bisect_left, bisect_right
 
+import profiling
+from storage import as_buffer, scratch_copy
+
+# Paramètres de l'introsort (quick_sort)
+INSERTION_CUTOFF = 16
+NINTHER_THRESHOLD = 40
+
+# Longueur minimale des suites de bottom_up_merge_sort et natural_merge_sort
+MIN_RUN = 32
+
+# Éléments consécutifs pris du même côté avant de passer en mode galop (natural_merge_sort)
+MIN_GALLOP = 7
+
+# Paramètres des tris sans comparaison (radix_sort, counting_sort)
+RADIX_BITS = 8
+COUNTING_SORT_MAX_RANGE = 1 << 20
+
+# Mémoire de travail de external_merge_sort : volontairement petite pour que
+# les listes des benchmarks soient découpées en plusieurs suites à fusionner
+EXTERNAL_SORT_MEMORY = 1 << 20
+EXTERNAL_SORT_FAN_IN = 8
+
+# Plus grande clé acceptée par les tris sur clés entières (int64)
+INT64_MAX = (1 << 63) - 1
+
+def swap(arr, i, j):
+    """Échange deux éléments : comportement de base attendu d'un crochet draw_swap"""
+    arr[i], arr[j] = arr[j], arr[i]
+
+
+# Contrat du crochet draw_swap(arr, i, j) : appelé avec i != j, il doit échanger
+# arr[i] et arr[j] ; appelé avec i == j, il signale une écriture déjà faite
+# dans arr[i]. Avec draw_swap=None, les échanges sont faits directement dans
+# la boucle, sans aucun appel de fonction supplémentaire.
+#
+# arr peut être une liste, un array.array ou un tableau NumPy 1-D : les deux
+# derniers sont triés en place à travers une memoryview (storage.as_buffer),
+# ou une vue NumPy de leur stockage pour les algorithmes vectorisés.
 class SortingAlgorithms:
 
     @staticmethod
-    def selection_sort(arr, draw_swap=lambda *args: None):
+    def selection_sort(arr, draw_swap=None):
+        arr = as_buffer(arr)
         n = len(arr)
         for i in range(n):
             min_index = i
@@ -11,61 +52,420 @@ class SortingAlgorithms:
                 if arr[j] < arr[min_index]:
                     min_index = j
             if i != min_index:
-                draw_swap(arr, i, min_index)
+                if draw_swap is None:
+                    arr[i], arr[min_index] = arr[min_index], arr[i]
+                else:
+                    draw_swap(arr, i, min_index)
 
     @staticmethod
-    def bubble_sort(arr, draw_swap=lambda *args: None):
+    def bubble_sort(arr, draw_swap=None):
+        arr = as_buffer(arr)
         n = len(arr)
         for i in range(n):
             for j in range(0, n - i - 1):
                 if arr[j] > arr[j + 1]:
-                    draw_swap(arr, j, j + 1)
+                    if draw_swap is None:
+                        arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                    else:
+                        draw_swap(arr, j, j + 1)
 
     @staticmethod
-    def insertion_sort(arr, draw_swap=lambda *args: None):
+    def insertion_sort(arr, draw_swap=None):
+        arr = as_buffer(arr)
         for i in range(1, len(arr)):
             j = i
             while j > 0 and arr[j] < arr[j - 1]:
-                draw_swap(arr, j, j - 1)
+                if draw_swap is None:
+                    arr[j], arr[j - 1] = arr[j - 1], arr[j]
+                else:
+                    draw_swap(arr, j, j - 1)
                 j -= 1
 
     @staticmethod
-    def merge_sort(arr, draw_swap=lambda *args: None):
+    def merge_sort(arr, draw_swap=None):
+        arr = as_buffer(arr)
+        # Une tranche de memoryview n'est qu'une vue : pour un stockage compact, la zone à
+        # fusionner est recopiée dans un tampon compact de même taille, alloué une seule fois
+        buffer = scratch_copy(arr) if isinstance(arr, memoryview) else None
+
         def merge_sort_rec(start, end):
             if end - start > 1:
                 mid = (start + end) // 2
                 merge_sort_rec(start, mid)
                 merge_sort_rec(mid, end)
-                left = arr[start:mid]
-                right = arr[mid:end]
-                i = j = 0
+                if buffer is None:
+                    left, right = arr[start:mid], arr[mid:end]
+                    i, left_end, j, right_end = 0, mid - start, 0, end - mid
+                else:
+                    buffer[start:end] = arr[start:end]
+                    left = right = buffer
+                    i, left_end, j, right_end = start, mid, mid, end
                 for k in range(start, end):
-                    if i < len(left) and (j >= len(right) or left[i] < right[j]):
+                    if i < left_end and (j >= right_end or left[i] < right[j]):
                         arr[k] = left[i]
                         i += 1
                     else:
                         arr[k] = right[j]
                         j += 1
-                    draw_swap(arr, k, k)
+                    if draw_swap is not None:
+                        draw_swap(arr, k, k)
+
+        profiler = profiling.current
+        if profiler is not None:
+            # Les appels récursifs passent alors par cette enveloppe : une phase par
+            # niveau de récursion, dont le temps propre est celui de ses fusions
+            sort_range = merge_sort_rec
+            depth = 0
+
+            def merge_sort_rec(start, end):
+                nonlocal depth
+                if end - start > 1:
+                    profiler.begin(f"niveau {depth}")
+                    profiler.record_depth("Merge Sort", depth)
+                    depth += 1
+                    sort_range(start, end)
+                    depth -= 1
+                    profiler.end()
         merge_sort_rec(0, len(arr))
 
     @staticmethod
-    def quick_sort(arr, draw_swap=lambda *args: None):
-        def quick_sort_rec(start, end):
-            if start < end:
-                pivot = arr[end]
-                i = start
-                for j in range(start, end):
-                    if arr[j] <= pivot:
+    def bottom_up_merge_sort(arr, draw_swap=None):
+        """Tri par fusion itératif (ascendant), stable, avec un seul tampon.
+
+        Les suites déjà ordonnées de l'entrée sont détectées (les suites
+        strictement décroissantes sont retournées) puis prolongées par
+        insertion jusqu'à MIN_RUN éléments. Les fusions se font ensuite en
+        alternant entre arr et un tampon de taille n alloué une seule fois ;
+        deux suites déjà dans l'ordre sont simplement recopiées. Seules les
+        écritures dans arr sont signalées à draw_swap(arr, k, k).
+        """
+        arr = as_buffer(arr)
+        n = len(arr)
+        if n < 2:
+            return
+
+        bounds = SortingAlgorithms._natural_runs(arr, draw_swap)
+        buffer = scratch_copy(arr)
+        src, dst = arr, buffer
+        while len(bounds) > 2:
+            merged_bounds = [0]
+            for index in range(0, len(bounds) - 1, 2):
+                lo = bounds[index]
+                mid = bounds[index + 1]
+                hi = bounds[index + 2] if index + 2 < len(bounds) else mid
+                if mid == hi or not src[mid] < src[mid - 1]:
+                    # Suite isolée ou deux suites déjà dans l'ordre : simple
+                    # copie, sans passer par une tranche temporaire
+                    for k in range(lo, hi):
+                        dst[k] = src[k]
+                        if dst is arr and draw_swap is not None:
+                            draw_swap(arr, k, k)
+                else:
+                    i, j = lo, mid
+                    for k in range(lo, hi):
+                        if j >= hi or (i < mid and not src[j] < src[i]):
+                            dst[k] = src[i]
+                            i += 1
+                        else:
+                            dst[k] = src[j]
+                            j += 1
+                        if dst is arr and draw_swap is not None:
+                            draw_swap(arr, k, k)
+                merged_bounds.append(hi)
+            bounds = merged_bounds
+            src, dst = dst, src
+
+        # Le résultat final doit se trouver dans arr
+        if src is buffer:
+            for k in range(n):
+                arr[k] = buffer[k]
+                if draw_swap is not None:
+                    draw_swap(arr, k, k)
+
+    @staticmethod
+    def _natural_runs(arr, draw_swap=None):
+        """Découpe arr en suites naturelles et renvoie leurs bornes [0, ..., n].
+
+        Les suites strictement décroissantes sont retournées, puis les suites
+        trop courtes sont prolongées par insertion jusqu'à MIN_RUN éléments.
+        """
+        n = len(arr)
+        bounds = [0]
+        start = 0
+        while start < n:
+            end = start + 1
+            if end < n and arr[end] < arr[end - 1]:
+                while end < n and arr[end] < arr[end - 1]:
+                    end += 1
+                i, j = start, end - 1
+                while i < j:
+                    if draw_swap is None:
+                        arr[i], arr[j] = arr[j], arr[i]
+                    else:
                         draw_swap(arr, i, j)
+                    i += 1
+                    j -= 1
+            else:
+                while end < n and not arr[end] < arr[end - 1]:
+                    end += 1
+            # Prolonger les suites trop courtes par insertion
+            forced_end = min(n, start + MIN_RUN)
+            while end < forced_end:
+                j = end
+                while j > start and arr[j] < arr[j - 1]:
+                    if draw_swap is None:
+                        arr[j], arr[j - 1] = arr[j - 1], arr[j]
+                    else:
+                        draw_swap(arr, j, j - 1)
+                    j -= 1
+                end += 1
+            bounds.append(end)
+            start = end
+        return bounds
+
+    @staticmethod
+    def _copy_run(src, dst, start, end, at, draw_swap=None):
+        """Recopie src[start:end] dans dst à partir de at ; renvoie la position suivante dans dst"""
+        if draw_swap is None:
+            dst[at:at + end - start] = src[start:end]
+            return at + end - start
+        for k in range(start, end):
+            dst[at] = src[k]
+            draw_swap(dst, at, at)
+            at += 1
+        return at
+
+    @staticmethod
+    def _gallop_merge(src, dst, lo, mid, hi, draw_swap=None):
+        """Fusion stable de src[lo:mid] et src[mid:hi] dans dst[lo:hi], avec galop à la Timsort.
+
+        Après MIN_GALLOP éléments consécutifs pris du même côté, le bloc
+        suivant de ce côté est délimité par recherche dichotomique (bisect)
+        puis recopié d'un seul coup.
+        """
+        copy_run = SortingAlgorithms._copy_run
+        i, j, k = lo, mid, lo
+        left_wins = right_wins = 0
+        while i < mid and j < hi:
+            if src[j] < src[i]:
+                right_wins += 1
+                left_wins = 0
+                if right_wins >= MIN_GALLOP:
+                    # Tous les éléments de droite strictement inférieurs à src[i]
+                    end = bisect_left(src, src[i], j, hi)
+                    k = copy_run(src, dst, j, end, k, draw_swap)
+                    j = end
+                    right_wins = 0
+                    continue
+                dst[k] = src[j]
+                j += 1
+            else:
+                left_wins += 1
+                right_wins = 0
+                if left_wins >= MIN_GALLOP:
+                    # Tous les éléments de gauche inférieurs ou égaux à src[j] (stabilité)
+                    end = bisect_right(src, src[j], i, mid)
+                    k = copy_run(src, dst, i, end, k, draw_swap)
+                    i = end
+                    left_wins = 0
+                    continue
+                dst[k] = src[i]
+                i += 1
+            if draw_swap is not None:
+                draw_swap(dst, k, k)
+            k += 1
+        k = copy_run(src, dst, i, mid, k, draw_swap)
+        copy_run(src, dst, j, hi, k, draw_swap)
+
+    @staticmethod
+    def natural_merge_sort(arr, draw_swap=None):
+        """Tri par fusion naturelle avec galop, dans l'esprit de Timsort.
+
+        Mêmes suites que bottom_up_merge_sort, mais les fusions recopient par
+        blocs : deux suites déjà dans l'ordre sont recopiées d'un coup, et
+        une fusion passe en mode galop dès qu'un côté gagne MIN_GALLOP fois
+        de suite. Linéaire sur une entrée triée ou inversée.
+        """
+        arr = as_buffer(arr)
+        n = len(arr)
+        if n < 2:
+            return
+        bounds = SortingAlgorithms._natural_runs(arr, draw_swap)
+        buffer = scratch_copy(arr)
+        src, dst = arr, buffer
+        while len(bounds) > 2:
+            report = draw_swap if dst is arr else None
+            merged_bounds = [0]
+            for index in range(0, len(bounds) - 1, 2):
+                lo = bounds[index]
+                mid = bounds[index + 1]
+                hi = bounds[index + 2] if index + 2 < len(bounds) else mid
+                if mid == hi or not src[mid] < src[mid - 1]:
+                    SortingAlgorithms._copy_run(src, dst, lo, hi, lo, report)
+                else:
+                    SortingAlgorithms._gallop_merge(src, dst, lo, mid, hi, report)
+                merged_bounds.append(hi)
+            bounds = merged_bounds
+            src, dst = dst, src
+
+        # Le résultat final doit se trouver dans arr
+        if src is buffer:
+            SortingAlgorithms._copy_run(buffer, arr, 0, n, 0, draw_swap)
+
+    @staticmethod
+    def auto_sort(arr, draw_swap=None):
+        """Mesure le pré-tri de arr en un passage (adaptive.py) et le trie avec l'algorithme choisi.
+
+        Renvoie la décision (algorithme, raison, mesures).
+        """
+        from adaptive import AUTO_SMALL, COUNTING, RADIX, decide, integer_keys
+        arr = SortingAlgorithms._as_array(arr)
+        keys = integer_keys(arr) if len(arr) > AUTO_SMALL else None
+        decision = decide(arr, keys)
+        if keys is not None and keys is not arr and draw_swap is None and decision["algorithm"] in (RADIX, COUNTING):
+            # Liste d'int déjà convertie pour la mesure : trier ses clés évite une seconde conversion
+            ALGORITHMS[decision["algorithm"]](keys)
+            arr[:] = keys.tolist()
+        else:
+            ALGORITHMS[decision["algorithm"]](arr, draw_swap)
+        return decision
+
+    @staticmethod
+    def quick_sort(arr, draw_swap=None):
+        """Introsort itératif, en O(n log n) dans le pire cas.
+
+        Pivot médiane de trois (ninther au-delà de NINTHER_THRESHOLD éléments),
+        partition en trois zones (< pivot, == pivot, > pivot) pour les doublons,
+        tri par insertion sous INSERTION_CUTOFF éléments et repli sur un tri
+        par tas quand la profondeur dépasse 2 * log2(n). La pile explicite
+        reçoit toujours le plus grand côté : elle reste en O(log n) et aucune
+        récursion Python n'est utilisée.
+        """
+        arr = as_buffer(arr)
+
+        def median_of_three(a, b, c):
+            if arr[a] < arr[b]:
+                if arr[b] < arr[c]:
+                    return b
+                return c if arr[a] < arr[c] else a
+            if arr[a] < arr[c]:
+                return a
+            return c if arr[b] < arr[c] else b
+
+        def choose_pivot(start, end):
+            mid = (start + end) // 2
+            if end - start + 1 > NINTHER_THRESHOLD:
+                step = (end - start + 1) // 8
+                return arr[median_of_three(
+                    median_of_three(start, start + step, start + 2 * step),
+                    median_of_three(mid - step, mid, mid + step),
+                    median_of_three(end - 2 * step, end - step, end),
+                )]
+            return arr[median_of_three(start, mid, end)]
+
+        def insertion_sort_range(start, end):
+            for i in range(start + 1, end + 1):
+                j = i
+                while j > start and arr[j] < arr[j - 1]:
+                    if draw_swap is None:
+                        arr[j], arr[j - 1] = arr[j - 1], arr[j]
+                    else:
+                        draw_swap(arr, j, j - 1)
+                    j -= 1
+
+        def heap_sort_range(start, end):
+            count = end - start + 1
+
+            def sift_down(root, size):
+                while True:
+                    largest = root
+                    left = 2 * root + 1
+                    right = left + 1
+                    if left < size and arr[start + largest] < arr[start + left]:
+                        largest = left
+                    if right < size and arr[start + largest] < arr[start + right]:
+                        largest = right
+                    if largest == root:
+                        return
+                    if draw_swap is None:
+                        arr[start + root], arr[start + largest] = arr[start + largest], arr[start + root]
+                    else:
+                        draw_swap(arr, start + root, start + largest)
+                    root = largest
+
+            for root in range(count // 2 - 1, -1, -1):
+                sift_down(root, count)
+            for last in range(count - 1, 0, -1):
+                if draw_swap is None:
+                    arr[start], arr[start + last] = arr[start + last], arr[start]
+                else:
+                    draw_swap(arr, start, start + last)
+                sift_down(0, last)
+
+        n = len(arr)
+        if n < 2:
+            return
+        profiler = profiling.current
+        max_depth = 2 * n.bit_length()
+        stack = [(0, n - 1, max_depth)]
+        while stack:
+            start, end, depth = stack.pop()
+            while end - start + 1 > INSERTION_CUTOFF:
+                if depth == 0:
+                    if profiler is not None:
+                        profiler.begin("repli sur le tas", size=end - start + 1)
+                    heap_sort_range(start, end)
+                    if profiler is not None:
+                        profiler.end()
+                    break
+                depth -= 1
+                if profiler is not None:
+                    # La pile explicite remplace la récursion : profondeur = partitions déjà traversées
+                    profiler.record_depth("Quick Sort", max_depth - depth - 1)
+                    profiler.begin("partition", size=end - start + 1)
+                pivot = choose_pivot(start, end)
+                # Invariant : [start, lt) < pivot, [lt, i) == pivot, (gt, end] > pivot
+                lt, i, gt = start, start, end
+                while i <= gt:
+                    value = arr[i]
+                    if value < pivot:
+                        if lt != i:
+                            if draw_swap is None:
+                                arr[lt], arr[i] = arr[i], arr[lt]
+                            else:
+                                draw_swap(arr, lt, i)
+                        lt += 1
                         i += 1
-                draw_swap(arr, i, end)
-                quick_sort_rec(start, i - 1)
-                quick_sort_rec(i + 1, end)
-        quick_sort_rec(0, len(arr) - 1)
+                    elif pivot < value:
+                        if i != gt:
+                            if draw_swap is None:
+                                arr[i], arr[gt] = arr[gt], arr[i]
+                            else:
+                                draw_swap(arr, i, gt)
+                        gt -= 1
+                    else:
+                        i += 1
+                if profiler is not None:
+                    profiler.end()
+                # Le plus grand côté attend sur la pile, on continue avec le plus petit
+                if lt - start < end - gt:
+                    stack.append((gt + 1, end, depth))
+                    end = lt - 1
+                else:
+                    stack.append((start, lt - 1, depth))
+                    start = gt + 1
+            else:
+                if profiler is None:
+                    insertion_sort_range(start, end)
+                else:
+                    profiler.begin("insertion", size=end - start + 1)
+                    insertion_sort_range(start, end)
+                    profiler.end()
 
     @staticmethod
-    def heap_sort(arr, draw_swap=lambda *args: None):
+    def heap_sort(arr, draw_swap=None):
+        arr = as_buffer(arr)
+
         def heapify(n, i):
             largest = i
             left = 2 * i + 1
@@ -75,29 +475,341 @@ class SortingAlgorithms:
             if right < n and arr[right] > arr[largest]:
                 largest = right
             if largest != i:
-                draw_swap(arr, i, largest)
+                if draw_swap is None:
+                    arr[i], arr[largest] = arr[largest], arr[i]
+                else:
+                    draw_swap(arr, i, largest)
                 heapify(n, largest)
         n = len(arr)
+        profiler = profiling.current
+        if profiler is not None:
+            profiler.begin("construction du tas")
         for i in range(n // 2 - 1, -1, -1):
             heapify(n, i)
+        if profiler is not None:
+            profiler.end()
+            profiler.begin("extraction")
         for i in range(n - 1, 0, -1):
-            draw_swap(arr, 0, i)
+            if draw_swap is None:
+                arr[0], arr[i] = arr[i], arr[0]
+            else:
+                draw_swap(arr, 0, i)
             heapify(i, 0)
+        if profiler is not None:
+            profiler.end()
 
     @staticmethod
-    def comb_sort(arr, draw_swap=lambda *args: None):
+    def comb_sort(arr, draw_swap=None):
+        arr = as_buffer(arr)
         n = len(arr)
         gap = n
         shrink = 1.3
         sorted = False
+        profiler = profiling.current
         while not sorted:
             gap = int(gap / shrink)
             if gap <= 1:
                 gap = 1
                 sorted = True
+            if profiler is not None:
+                profiler.begin("passe", gap=gap)
             i = 0
             while i + gap < n:
                 if arr[i] > arr[i + gap]:
-                    draw_swap(arr, i, i + gap)
+                    if draw_swap is None:
+                        arr[i], arr[i + gap] = arr[i + gap], arr[i]
+                    else:
+                        draw_swap(arr, i, i + gap)
                     sorted = False
-                i += 1
\ No newline at end of file
+                i += 1
+            if profiler is not None:
+                profiler.end()
+
+    @staticmethod
+    def _as_array(arr):
+        """Liste telle quelle, sinon vue NumPy (sans copie) du stockage de arr"""
+        if isinstance(arr, list):
+            return arr
+        import numpy as np
+        return np.asarray(as_buffer(arr))
+
+    @staticmethod
+    def odd_even_sort(arr, draw_swap=None):
+        """Transposition pair-impair vectorisée (networks.py) : n étapes, chacune un seul min / max NumPy.
+
+        Avec draw_swap, les éléments modifiés par chaque étape sont réécrits
+        dans arr : l'animation avance étape par étape.
+        """
+        from networks import odd_even_transposition
+        SortingAlgorithms._network_sort(odd_even_transposition, arr, draw_swap)
+
+    @staticmethod
+    def bitonic_sort(arr, draw_swap=None):
+        """Réseau de tri bitonique vectorisé (networks.py) : O(log² n) étapes de min / max NumPy.
+
+        Avec draw_swap, les éléments modifiés par chaque étape sont réécrits dans arr.
+        """
+        from networks import bitonic
+        SortingAlgorithms._network_sort(bitonic, arr, draw_swap)
+
+    @staticmethod
+    def _network_sort(network, arr, draw_swap):
+        """Trie arr avec le réseau network(valeurs, on_stage), qui trie un tableau NumPy en place"""
+        import numpy as np
+        arr = SortingAlgorithms._as_array(arr)
+        if len(arr) < 2:
+            return
+        if isinstance(arr, np.ndarray) and draw_swap is None:
+            network(arr)
+            return
+        values = np.array(arr)
+        on_stage = None
+        if draw_swap is not None:
+            shown = values.copy()
+
+            def on_stage(staged):
+                changed = np.flatnonzero(staged != shown)
+                shown[changed] = staged[changed]
+                for k, value in zip(changed.tolist(), staged[changed].tolist()):
+                    arr[k] = value
+                    draw_swap(arr, k, k)
+        network(values, on_stage)
+        if draw_swap is None:
+            arr[:] = values.tolist()
+
+    @staticmethod
+    def _integer_keys(arr):
+        """Clés entières de arr sous forme de tableau NumPy int64 (sans copie si possible).
+
+        Les tris sur clés entières ne savent pas trier autre chose : un
+        élément non entier (un flottant serait tronqué) lève TypeError, un
+        entier hors de l'intervalle des int64 lève OverflowError.
+        """
+        import numpy as np
+        if isinstance(arr, np.ndarray):
+            keys, elements = arr, arr.tolist
+            if keys.dtype.kind not in "iuO":
+                raise TypeError(f"tri sur clés entières : éléments entiers attendus (type {keys.dtype} reçu)")
+        else:
+            keys, elements = np.array(arr), lambda: arr
+        if keys.dtype.kind == "i" or keys.dtype.kind == "u" and (not keys.size or keys.max() <= INT64_MAX):
+            return keys.astype(np.int64, copy=False)
+        # Flottants, entiers trop grands pour NumPy ou types mêlés : vérification élément par élément
+        try:
+            return np.fromiter(map(operator.index, elements()), dtype=np.int64, count=len(keys))
+        except TypeError as error:
+            raise TypeError(f"tri sur clés entières : éléments entiers attendus ({error})") from None
+        except OverflowError:
+            raise OverflowError("tri sur clés entières : entier hors de l'intervalle des int64 "
+                                f"[{-INT64_MAX - 1}, {INT64_MAX}]") from None
+
+    @staticmethod
+    def _write_keys(arr, values, draw_swap=None, start=0):
+        """Écrit les clés entières values (tableau NumPy) dans arr à partir de start, avec le type des éléments de arr.
+
+        Les éléments de arr doivent être entiers (validés par _integer_keys) :
+        la conversion vers leur type est alors exacte.
+        """
+        import numpy as np
+        if isinstance(arr, np.ndarray) and draw_swap is None:
+            arr[start:start + len(values)] = values
+            return
+        element_type = type(arr[0])
+        if element_type is int and draw_swap is None:
+            arr[start:start + len(values)] = values.tolist()
+            return
+        for k, value in enumerate(values.tolist(), start):
+            arr[k] = value if element_type is int else element_type(value)
+            if draw_swap is not None:
+                draw_swap(arr, k, k)
+
+    @staticmethod
+    def _apply_order(arr, source, order, draw_swap=None):
+        """Écrit arr[k] = source[order[k]] pour tout k ; source est une copie de l'entrée"""
+        import numpy as np
+        if isinstance(arr, np.ndarray):
+            arr[...] = source[order]
+            if draw_swap is not None:
+                for k in range(len(arr)):
+                    draw_swap(arr, k, k)
+            return
+        if draw_swap is None:
+            arr[:] = [source[index] for index in order.tolist()]
+            return
+        for k, index in enumerate(order.tolist()):
+            arr[k] = source[index]
+            draw_swap(arr, k, k)
+
+    @staticmethod
+    def radix_argsort(keys, radix_bits=RADIX_BITS, on_pass=None):
+        """Permutation stable qui trie les clés entières keys (tri par base LSD).
+
+        Chaque passe traite radix_bits bits (16 au plus) : l'histogramme des
+        chiffres (np.bincount) permet de sauter les passes où tous les
+        éléments ont le même chiffre, et la répartition stable d'une passe est
+        confiée au tri stable de NumPy sur des chiffres non signés étroits,
+        qui est lui-même un tri par dénombrement (histogramme, sommes
+        préfixes, dispersion) écrit en C. on_pass(order) est appelé après
+        chaque passe effective.
+        """
+        import numpy as np
+        if not 1 <= radix_bits <= 16:
+            raise ValueError("radix_bits doit être compris entre 1 et 16")
+        keys = SortingAlgorithms._integer_keys(keys)
+        n = len(keys)
+        order = np.arange(n)
+        if n < 2:
+            return order
+        # Décaler les clés pour gérer les négatifs
+        shifted = (keys - keys.min()).astype(np.uint64)
+        digit_type = np.uint8 if radix_bits <= 8 else np.uint16
+        mask = np.uint64((1 << radix_bits) - 1)
+        for shift in range(0, int(shifted.max()).bit_length(), radix_bits):
+            digits = ((shifted[order] >> np.uint64(shift)) & mask).astype(digit_type)
+            histogram = np.bincount(digits, minlength=1 << radix_bits)
+            if histogram.max() == n:
+                continue
+            order = order[np.argsort(digits, kind="stable")]
+            if on_pass is not None:
+                on_pass(order)
+        return order
+
+    @staticmethod
+    def radix_sort(arr, draw_swap=None, radix_bits=RADIX_BITS):
+        """Tri par base LSD vectorisé pour des entiers (liste ou tableau NumPy).
+
+        Avec draw_swap, arr est réécrit après chaque passe pour que
+        l'animation montre la progression chiffre par chiffre.
+        """
+        arr = SortingAlgorithms._as_array(arr)
+        source = arr.copy()
+        on_pass = None
+        if draw_swap is not None:
+            def on_pass(order):
+                SortingAlgorithms._apply_order(arr, source, order, draw_swap)
+        order = SortingAlgorithms.radix_argsort(arr, radix_bits, on_pass)
+        if draw_swap is None:
+            SortingAlgorithms._apply_order(arr, source, order)
+
+    @staticmethod
+    def counting_sort(arr, draw_swap=None):
+        """Tri par dénombrement vectorisé, pour des entiers de faible étendue.
+
+        Un tableau NumPy trié sans crochet est reconstruit directement à partir
+        de l'histogramme (np.bincount puis np.repeat). Sinon, la permutation
+        stable est calculée pour déplacer les éléments d'origine.
+        """
+        import numpy as np
+        arr = SortingAlgorithms._as_array(arr)
+        n = len(arr)
+        if n < 2:
+            return
+        keys = SortingAlgorithms._integer_keys(arr)
+        low = int(keys.min())
+        key_range = int(keys.max()) - low + 1
+        if key_range > COUNTING_SORT_MAX_RANGE:
+            raise ValueError(f"étendue des clés trop grande pour le tri par dénombrement ({key_range})")
+        offsets = keys - low
+        if isinstance(arr, np.ndarray) and draw_swap is None:
+            histogram = np.bincount(offsets, minlength=key_range)
+            arr[...] = np.repeat(np.arange(low, low + key_range, dtype=keys.dtype), histogram)
+            return
+        digit_type = np.uint16 if key_range <= 1 << 16 else np.uint32
+        order = np.argsort(offsets.astype(digit_type), kind="stable")
+        source = arr.copy()
+        SortingAlgorithms._apply_order(arr, source, order, draw_swap)
+
+    @staticmethod
+    def external_merge_sort(arr, draw_swap=None, memory_limit=EXTERNAL_SORT_MEMORY, fan_in=EXTERNAL_SORT_FAN_IN):
+        """Tri externe (external_sort.py) d'une liste d'entiers, via des fichiers temporaires.
+
+        La liste est écrite dans un fichier binaire, triée par blocs de
+        memory_limit octets puis fusionnée, et relue. Avec draw_swap, chaque
+        bloc trié est recopié à sa place pour l'animation, avant le résultat
+        final de la fusion. Des éléments non entiers lèvent TypeError avant
+        toute écriture sur disque.
+        """
+        import os
+        import tempfile
+
+        import numpy as np
+        from external_sort import external_sort
+        arr = SortingAlgorithms._as_array(arr)
+        # Les éléments sont reconstruits à partir de leur clé entière, avec leur propre type :
+        # les clés sont validées (entiers int64) avant d'écrire quoi que ce soit
+        keys = SortingAlgorithms._integer_keys(arr)
+        if len(arr) < 2:
+            return
+
+        def write_back(start, values):
+            SortingAlgorithms._write_keys(arr, values, draw_swap, start)
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            input_path = os.path.join(work_dir, "entree.bin")
+            output_path = os.path.join(work_dir, "sortie.bin")
+            keys.tofile(input_path)
+            external_sort(input_path, output_path, memory_limit, fan_in, temp_dir=work_dir,
+                          on_run=write_back if draw_swap is not None else None)
+            result = np.fromfile(output_path, dtype=np.int64)
+        write_back(0, result)
+
+    @staticmethod
+    def parallel_merge_sort(arr, draw_swap=None, workers=None):
+        """Tri par fusion parallèle (parallel_sort.py) d'entiers : des processus trient chacun
+        un morceau en mémoire partagée, puis les morceaux sont fusionnés en arbre.
+
+        Avec draw_swap, le tableau est recopié après chaque niveau de l'arbre.
+        """
+        from parallel_sort import parallel_merge_sort
+        SortingAlgorithms._sort_keys_with(parallel_merge_sort, arr, draw_swap, workers)
+
+    @staticmethod
+    def sample_sort(arr, draw_swap=None, workers=None):
+        """Tri par échantillonnage parallèle (parallel_sort.py) d'entiers : un seau par processus,
+        délimité par des séparateurs tirés d'un échantillon.
+
+        Avec draw_swap, le tableau est recopié après le tri des morceaux puis à la fin.
+        """
+        from parallel_sort import sample_sort
+        SortingAlgorithms._sort_keys_with(sample_sort, arr, draw_swap, workers)
+
+    @staticmethod
+    def _sort_keys_with(engine, arr, draw_swap, workers):
+        """Trie arr avec engine(clés, workers, on_step), qui renvoie les clés triées.
+
+        Les éléments sont réécrits à partir des clés triées : des éléments non
+        entiers lèvent TypeError avant toute écriture (voir _integer_keys).
+        """
+        arr = SortingAlgorithms._as_array(arr)
+        keys = SortingAlgorithms._integer_keys(arr)
+        if len(arr) < 2:
+            return
+        on_step = None
+        if draw_swap is not None:
+            def on_step(values):
+                SortingAlgorithms._write_keys(arr, values, draw_swap)
+        result = engine(keys, workers, on_step)
+        # Avec draw_swap, la dernière étape a déjà écrit le résultat
+        if draw_swap is None:
+            SortingAlgorithms._write_keys(arr, result)
+
+# Registre des algorithmes disponibles (nom affiché -> fonction de tri)
+ALGORITHMS = {
+    "Selection Sort": SortingAlgorithms.selection_sort,
+    "Bubble Sort": SortingAlgorithms.bubble_sort,
+    "Insertion Sort": SortingAlgorithms.insertion_sort,
+    "Merge Sort": SortingAlgorithms.merge_sort,
+    "Bottom-Up Merge Sort": SortingAlgorithms.bottom_up_merge_sort,
+    "Quick Sort": SortingAlgorithms.quick_sort,
+    "Heap Sort": SortingAlgorithms.heap_sort,
+    "Comb Sort": SortingAlgorithms.comb_sort,
+    "Radix Sort": SortingAlgorithms.radix_sort,
+    "Counting Sort": SortingAlgorithms.counting_sort,
+    "External Merge Sort": SortingAlgorithms.external_merge_sort,
+    "Parallel Merge Sort": SortingAlgorithms.parallel_merge_sort,
+    "Sample Sort": SortingAlgorithms.sample_sort,
+    "Natural Merge Sort": SortingAlgorithms.natural_merge_sort,
+    "Auto": SortingAlgorithms.auto_sort,
+    "Odd-Even Sort": SortingAlgorithms.odd_even_sort,
+    "Bitonic Sort": SortingAlgorithms.bitonic_sort,
+}
@@ -0,0 +1,76 @@
+"""Stockage des éléments à trier : liste Python ou stockage compact et contigu.
+
+Une liste d'entiers coûte un pointeur (8 octets) plus un objet int (28
+octets ou plus) par élément, dispersés en mémoire. Un array.array ou un
+tableau NumPy range les valeurs brutes côte à côte (8 octets pour un int64).
+
+Les algorithmes de SortingAlgorithms acceptent les trois : une liste est
+triée telle quelle, un array.array ou un tableau NumPy est trié en place à
+travers une memoryview 1-D sur son stockage (as_buffer), sans conversion
+préalable en liste. Les algorithmes vectorisés passent, eux, par une vue
+NumPy du même stockage.
+"""
+import array
+import sys
+
+STORAGES = ("list", "array", "numpy")
+
+# Type des éléments des array.array créés par make_storage (entier signé 64 bits)
+ARRAY_TYPECODE = "q"
+
+
+def as_buffer(arr):
+    """Liste telle quelle, ou memoryview 1-D modifiable sur le stockage de arr (array.array, tableau NumPy)"""
+    if isinstance(arr, (list, memoryview)):
+        return arr
+    view = memoryview(arr)
+    if view.ndim != 1 or not view.c_contiguous or view.readonly:
+        raise ValueError("le stockage à trier doit être un tableau 1-D contigu et modifiable")
+    return view
+
+
+def scratch_copy(arr):
+    """Tampon de travail de même taille que arr et du même genre (liste, ou memoryview sur une copie)"""
+    if isinstance(arr, memoryview):
+        return memoryview(bytearray(arr)).cast(arr.format)
+    return arr[:]
+
+
+def make_storage(values, kind="list"):
+    """Copie des entiers values dans le stockage kind ("list", "array" ou "numpy")"""
+    if kind == "list":
+        return list(values)
+    if kind == "array":
+        return array.array(ARRAY_TYPECODE, values)
+    if kind == "numpy":
+        import numpy as np
+        return np.array(values, dtype=np.int64)
+    raise ValueError(f"stockage inconnu : {kind}")
+
+
+def storage_kind(arr):
+    if isinstance(arr, list):
+        return "list"
+    if isinstance(arr, array.array):
+        return "array"
+    return "numpy"
+
+
+def copy_storage(arr):
+    """Copie de arr dans le même stockage"""
+    if isinstance(arr, list):
+        return list(arr)
+    if isinstance(arr, array.array):
+        return array.array(arr.typecode, arr)
+    return arr.copy()
+
+
+def bytes_per_element(arr):
+    """Octets occupés par élément : conteneur et, pour une liste, objets distincts qu'elle référence"""
+    if not len(arr):
+        return 0.0
+    total = sys.getsizeof(arr)
+    if isinstance(arr, list):
+        # Les petits entiers partagés (-5 à 256) ne sont comptés qu'une fois
+        total += sum(sys.getsizeof(value) for value in {id(value): value for value in arr}.values())
+    return total / len(arr)
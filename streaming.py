@@ -0,0 +1,186 @@
+"""Tri en flux : fusion paresseuse de sources triées et conteneur trié incrémental.
+
+- kway_merge : fusion k-voies guidée par un tas, sur des itérables
+  quelconques (listes, générateurs, fichiers...). Un seul élément par source
+  est gardé en mémoire et chaque élément est produit dès qu'il est sûr
+  d'être le plus petit restant.
+- SortedContainer : liste triée découpée en blocs d'au plus 2 * BLOCK_SIZE
+  éléments, avec le maximum de chaque bloc. Une insertion cherche le bloc
+  par dichotomie sur les maximums puis la place dans le bloc : elle ne
+  déplace que les éléments d'un bloc. Les insertions par lots (update)
+  trient le lot puis le répartissent bloc par bloc ; un gros lot reconstruit
+  tout en une fusion.
+"""
+import heapq
+from bisect import bisect_left, bisect_right, insort
+
+# Taille visée d'un bloc de SortedContainer (un bloc est coupé en deux au-delà du double)
+BLOCK_SIZE = 1000
+
+# En dessous de ce nombre d'éléments pour un même bloc, insertion un par un plutôt que tri du bloc
+BATCH_SORT_MIN = 16
+
+# Un lot d'au moins len(conteneur) / BATCH_REBUILD_RATIO éléments reconstruit tous les blocs
+BATCH_REBUILD_RATIO = 4
+
+
+def kway_merge(*iterables, key=None):
+    """Générateur des éléments des itérables triés iterables, dans l'ordre.
+
+    Fusion stable : à égalité, l'élément de la source la plus à gauche sort
+    en premier. Mémoire : un élément et un itérateur par source.
+    """
+    # Entrées du tas : (clé, numéro de la source, élément, itérateur) ; sans key, la clé est l'élément
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.append([value if key is None else key(value), index, value, iterator])
+            break
+    heapq.heapify(heap)
+    replace = heapq.heapreplace
+    while len(heap) > 1:
+        entry = heap[0]
+        yield entry[2]
+        for value in entry[3]:
+            # L'entrée au sommet est mise à jour en place puis redescendue
+            entry[0] = value if key is None else key(value)
+            entry[2] = value
+            replace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
+    # Une seule source restante : plus rien à comparer
+    if heap:
+        _, _, value, iterator = heap[0]
+        yield value
+        yield from iterator
+
+
+class SortedContainer:
+    """Conteneur toujours trié : add, update (par lots), remove, recherche et accès par indice"""
+
+    def __init__(self, values=()):
+        self._blocks = []
+        self._maxes = []
+        self._len = 0
+        self.update(values)
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, value):
+        index = bisect_left(self._maxes, value)
+        if index == len(self._maxes):
+            return False
+        block = self._blocks[index]
+        position = bisect_left(block, value)
+        return position < len(block) and not value < block[position]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("indice hors du conteneur")
+        for block in self._blocks:
+            if index < len(block):
+                return block[index]
+            index -= len(block)
+
+    def __repr__(self):
+        return f"SortedContainer({list(self)!r})"
+
+    def _rebuild(self, values):
+        """Redécoupe la liste triée values en blocs de BLOCK_SIZE éléments"""
+        self._blocks = [values[start:start + BLOCK_SIZE] for start in range(0, len(values), BLOCK_SIZE)]
+        self._maxes = [block[-1] for block in self._blocks]
+        self._len = len(values)
+
+    def _split(self, index):
+        """Coupe en deux le bloc index s'il dépasse 2 * BLOCK_SIZE éléments"""
+        block = self._blocks[index]
+        if len(block) > 2 * BLOCK_SIZE:
+            half = block[BLOCK_SIZE:]
+            del block[BLOCK_SIZE:]
+            self._blocks.insert(index + 1, half)
+            self._maxes[index] = block[-1]
+            self._maxes.insert(index + 1, half[-1])
+
+    def add(self, value):
+        if not self._blocks:
+            self._blocks.append([value])
+            self._maxes.append(value)
+        else:
+            # Premier bloc dont le maximum dépasse value (le dernier si aucun)
+            index = min(bisect_right(self._maxes, value), len(self._maxes) - 1)
+            block = self._blocks[index]
+            insort(block, value)
+            self._maxes[index] = block[-1]
+            self._split(index)
+        self._len += 1
+
+    def update(self, values):
+        """Insère tous les éléments de values (un lot) ; le lot est trié une seule fois"""
+        batch = sorted(values)
+        if not batch:
+            return
+        if len(batch) * BATCH_REBUILD_RATIO >= self._len:
+            # Deux suites triées bout à bout : Timsort les fusionne en temps linéaire
+            self._rebuild(sorted([*self, *batch]))
+            return
+        # Les éléments du lot destinés à un même bloc sont contigus : un seul passage par bloc touché
+        touched = []
+        start = 0
+        last = len(self._maxes) - 1
+        while start < len(batch):
+            index = min(bisect_right(self._maxes, batch[start]), last)
+            end = len(batch) if index == last else bisect_right(batch, self._maxes[index], start)
+            block = self._blocks[index]
+            if end - start < BATCH_SORT_MIN:
+                for value in batch[start:end]:
+                    insort(block, value)
+            else:
+                block.extend(batch[start:end])
+                block.sort()
+            self._maxes[index] = block[-1]
+            touched.append(index)
+            start = end
+        # De droite à gauche, pour que les coupes ne décalent pas les indices restants
+        for index in reversed(touched):
+            while len(self._blocks[index]) > 2 * BLOCK_SIZE:
+                self._split(index)
+                index += 1
+        self._len += len(batch)
+
+    def remove(self, value):
+        """Retire une occurrence de value ; ValueError si elle est absente"""
+        index = bisect_left(self._maxes, value)
+        if index < len(self._maxes):
+            block = self._blocks[index]
+            position = bisect_left(block, value)
+            if position < len(block) and not value < block[position]:
+                del block[position]
+                self._len -= 1
+                if block:
+                    self._maxes[index] = block[-1]
+                else:
+                    del self._blocks[index]
+                    del self._maxes[index]
+                return
+        raise ValueError(f"{value!r} absent du conteneur")
+
+    def bisect_left(self, value):
+        """Nombre d'éléments strictement inférieurs à value"""
+        index = bisect_left(self._maxes, value)
+        return sum(map(len, self._blocks[:index])) + (bisect_left(self._blocks[index], value)
+                                                      if index < len(self._blocks) else 0)
+
+    def bisect_right(self, value):
+        """Nombre d'éléments inférieurs ou égaux à value"""
+        index = bisect_right(self._maxes, value)
+        return sum(map(len, self._blocks[:index])) + (bisect_right(self._blocks[index], value)
+                                                      if index < len(self._blocks) else 0)
@@ -0,0 +1,101 @@
+"""Mesures et décisions de l'algorithme automatique (python -m pytest)."""
+import random
+
+import numpy as np
+import pytest
+
+from adaptive import AUTO_SMALL, COUNTING, INTROSORT, MERGE, RADIX, decide, profile
+from distributions import generate
+from sorting_algorithms import ALGORITHMS, swap
+from test_sorting_algorithms import random_values
+
+
+def greedy_runs(values):
+    """Suites monotones découpées de gauche à droite, une égalité prolongeant la suite en cours"""
+    runs, direction = 1, 0
+    for previous, value in zip(values, values[1:]):
+        step = (value > previous) - (value < previous)
+        if step and not direction:
+            direction = step
+        elif step and step != direction:
+            runs, direction = runs + 1, 0
+    return runs
+
+
+def test_runs_keys_and_generic_agree():
+    rng = random.Random(12)
+    for _ in range(300):
+        values = [rng.randint(0, rng.choice((1, 3, 50))) for _ in range(rng.randint(2, 30))]
+        expected = greedy_runs(values)
+        assert profile(values, np.array(values))["runs"] == expected, values
+        assert profile([float(x) for x in values])["runs"] == expected, values
+
+
+@pytest.mark.parametrize("values, runs", [
+    ([5, 5, 4, 4, 3, 3, 1, 1], 1),
+    ([1, 1, 2, 2, 2, 3], 1),
+    ([3, 2, 1, 1, 2, 3], 2),
+    ([1, 2, 3, 1, 2, 3, 1, 2, 3], 3),
+])
+def test_equal_neighbours_continue_runs(values, runs):
+    assert profile(values, np.array(values))["runs"] == runs
+    assert profile([float(x) for x in values])["runs"] == runs
+
+
+@pytest.mark.parametrize("distribution, expected", [
+    ("uniform", RADIX),
+    ("reversed", RADIX),
+    ("organ_pipe", RADIX),
+    ("sawtooth", RADIX),
+])
+def test_decide_wide_integers(distribution, expected):
+    values = generate(distribution, 5000, seed=0, max_value=10 ** 9)
+    assert decide(values)["algorithm"] == expected
+
+
+@pytest.mark.parametrize("max_value, expected", [(1000, COUNTING), (10 ** 9, RADIX)])
+def test_decide_sorted_integers(max_value, expected):
+    # Liste déjà triée : un passage de la fusion naturelle ; un tableau NumPy reste au tri vectorisé
+    values = generate("sorted", 5000, seed=0, max_value=max_value)
+    assert decide(values)["algorithm"] == MERGE
+    assert decide(np.array(values))["algorithm"] == expected
+
+
+def test_decide_integers_too_wide_for_radix():
+    values = generate("sorted", 5000, seed=0, max_value=2 ** 62)
+    assert decide(values)["algorithm"] == MERGE
+    assert decide(generate("uniform", 5000, seed=0, max_value=2 ** 62))["algorithm"] == INTROSORT
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "reversed", "few_unique", "zipf"])
+def test_decide_narrow_integers(distribution):
+    values = generate(distribution, 5000, seed=0, max_value=1000)
+    assert decide(values)["algorithm"] == COUNTING
+
+
+def test_decide_generic():
+    rng = random.Random(13)
+    values = [rng.random() for _ in range(5000)]
+    assert decide(values)["algorithm"] == INTROSORT
+    decision = decide(sorted(values, reverse=True) + sorted(values))
+    assert decision["algorithm"] == MERGE and decision["measures"]["runs"] == 2
+    assert decide(values[:AUTO_SMALL])["algorithm"] == MERGE
+
+
+@pytest.mark.parametrize("hook", [None, swap])
+def test_auto_sort(hook):
+    for distribution in ("uniform", "sorted", "sawtooth", "few_unique"):
+        for max_value in (100, 10 ** 12):
+            values = generate(distribution, 1000, seed=1, max_value=max_value)
+            for arr in (list(values), np.array(values), [x / 7 for x in values]):
+                expected = sorted(arr)
+                decision = ALGORITHMS["Auto"](arr, hook)
+                assert list(arr) == expected, (distribution, max_value, decision["algorithm"])
+
+
+def test_natural_merge_galloping():
+    # Longues suites entrelacées : la fusion passe en mode galop
+    values = sorted(random_values(3000, 3)) + sorted(random_values(3000, 4, -10, 10)) + random_values(500, 5)
+    arr = list(values)
+    ALGORITHMS["Natural Merge Sort"](arr)
+    assert arr == sorted(values)
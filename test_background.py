@@ -0,0 +1,126 @@
+"""Tâches en arrière-plan : progression, pause et annulation (python -m pytest)."""
+import threading
+import time
+
+import pytest
+
+from background import BackgroundTask
+from sorting_algorithms import ALGORITHMS
+
+
+def wait_until_finished(task, timeout=10):
+    """Relit les événements comme la boucle de l'interface, jusqu'à la fin de la tâche"""
+    events = []
+    deadline = time.monotonic() + timeout
+    while not task.finished:
+        assert time.monotonic() < deadline, "la tâche ne s'est pas terminée"
+        events += task.poll()
+        time.sleep(0.001)
+    return events
+
+
+def test_result_and_events():
+    def work(task, count):
+        for step in range(count):
+            task.report("progress", step)
+            task.checkpoint()
+        return "fini"
+
+    task = BackgroundTask(work, 5).start()
+    events = wait_until_finished(task)
+    assert task.result == "fini" and not task.cancelled
+    assert events == [("progress", step) for step in range(5)]
+
+
+def test_error_raised_by_poll():
+    def work(task):
+        raise KeyError("erreur de la tâche")
+
+    task = BackgroundTask(work).start()
+    with pytest.raises(KeyError):
+        wait_until_finished(task)
+    assert task.finished
+
+
+def test_pause_blocks_at_checkpoint_then_resume():
+    reached = threading.Event()
+    steps = []
+
+    def work(task):
+        reached.set()
+        task.checkpoint()
+        steps.append("après la pause")
+        return len(steps)
+
+    task = BackgroundTask(work)
+    task.pause()
+    assert task.paused
+    task.start()
+    assert reached.wait(5)
+    time.sleep(0.05)
+    assert steps == [] and not task.finished
+    task.resume()
+    wait_until_finished(task)
+    assert task.result == 1
+
+
+@pytest.mark.parametrize("paused", [False, True])
+def test_cancel(paused):
+    started = threading.Event()
+
+    def work(task):
+        started.set()
+        while True:
+            task.checkpoint()
+            time.sleep(0.001)
+
+    task = BackgroundTask(work).start()
+    assert started.wait(5)
+    if paused:
+        task.pause()
+    task.cancel()
+    wait_until_finished(task)
+    assert task.cancelled and task.result is None and task.error is None
+
+
+def test_keep_going():
+    def work(task):
+        results = [task.keep_going()]
+        task.cancel()
+        results.append(task.keep_going())
+        return results
+
+    task = BackgroundTask(work).start()
+    wait_until_finished(task)
+    assert task.result == [True, False]
+
+
+def test_checked_swap_cancels_a_sort():
+    values = list(range(3000, 0, -1))
+
+    def work(task):
+        arr = list(values)
+        ALGORITHMS["Bubble Sort"](arr, task.checked_swap(interval=100))
+        return arr
+
+    task = BackgroundTask(work)
+    events = []
+    task.start()
+    while not any(kind == "operations" for kind, _ in events):
+        events += task.poll()
+        time.sleep(0.001)
+    task.cancel()
+    events += wait_until_finished(task)
+    assert task.cancelled
+    counts = [value for kind, value in events if kind == "operations"]
+    assert counts and all(count % 100 == 0 for count in counts)
+
+
+def test_checked_swap_sorts():
+    def work(task, arr):
+        ALGORITHMS["Quick Sort"](arr, task.checked_swap(interval=10))
+        return arr
+
+    task = BackgroundTask(work, list(range(500, 0, -1))).start()
+    wait_until_finished(task)
+    assert task.result == list(range(1, 501))
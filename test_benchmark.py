@@ -0,0 +1,46 @@
+"""Moteur de benchmark sans interface graphique (python -m pytest)."""
+import json
+import subprocess
+import sys
+
+import pytest
+
+import main_benchmark
+from benchmark import percentile, run_benchmark, summarize
+
+
+def test_headless_imports():
+    # Le moteur et la ligne de commande ne chargent pas pygame
+    code = "import sys, benchmark, main_benchmark; print('pygame' in sys.modules)"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "False"
+
+
+def test_summarize():
+    stats = summarize([40, 10, 30, 20])
+    assert stats["runs"] == 4 and stats["min"] == 10 and stats["median"] == 25
+    assert stats["p95"] == pytest.approx(38.5)
+    assert percentile([5], 95) == 5
+    with pytest.raises(ValueError):
+        percentile([], 50)
+
+
+def test_run_benchmark():
+    names = ["Merge Sort", "Quick Sort"]
+    results = run_benchmark(names, sizes=(10, 200), repeats=3, warmup=0, distributions=("uniform", "sorted"))
+    assert [(r["algorithm"], r["size"], r["distribution"]) for r in results] == [
+        (name, size, distribution) for size in (10, 200) for distribution in ("uniform", "sorted") for name in names]
+    for stats in results:
+        assert len(stats["times_ns"]) == stats["runs"] == 3
+        assert stats["min"] <= stats["median"] <= stats["p95"]
+
+
+def test_run_benchmark_rejects_no_repeats():
+    with pytest.raises(ValueError):
+        run_benchmark(["Merge Sort"], sizes=(10,), repeats=0)
+
+
+def test_cli_json(capsys):
+    assert main_benchmark.main(["--sizes", "50", "-a", "merge", "-a", "heap", "--repeats", "2", "--json"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert [r["algorithm"] for r in results] == ["Merge Sort", "Heap Sort"]
@@ -0,0 +1,86 @@
+"""Cache des mesures de benchmark : empreinte du code et éviction LRU (python -m pytest)."""
+import json
+
+import pytest
+
+from benchmark import adaptive_sweep
+from benchmark_cache import BenchmarkCache, code_fingerprint
+from sorting_algorithms import ALGORITHMS
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache.json")
+
+
+def build_sort(step, limit=10):
+    """Fonction de tri jetable qui appelle une fonction auxiliaire et lit une constante globale"""
+    namespace = {"LIMIT": limit}
+    exec(f"def helper(arr):\n    return [x + {step} for x in arr]\n\n"
+         "def sort(arr, draw_swap=None):\n    arr[:LIMIT] = sorted(helper(arr[:LIMIT]))\n", namespace)
+    return namespace["sort"]
+
+
+def test_code_fingerprint():
+    assert code_fingerprint(build_sort(1)) == code_fingerprint(build_sort(1))
+    # Le code d'une fonction appelée et les constantes globales lues font partie de l'empreinte
+    assert code_fingerprint(build_sort(1)) != code_fingerprint(build_sort(2))
+    assert code_fingerprint(build_sort(1)) != code_fingerprint(build_sort(1, limit=20))
+    fingerprints = {code_fingerprint(ALGORITHMS[name]) for name in ("Merge Sort", "Heap Sort", "Radix Sort")}
+    assert len(fingerprints) == 3
+
+
+def test_lru_eviction_and_reload(path):
+    cache = BenchmarkCache(path, max_entries=3)
+    for key in "abc":
+        cache.put(key, {"median": ord(key)})
+    # "a" devient la plus récemment utilisée : "b" est évincée à l'enregistrement
+    assert cache.get("a") == {"median": ord("a")}
+    cache.put("d", {"median": ord("d")})
+    cache.save()
+    reloaded = BenchmarkCache(path, max_entries=3)
+    assert list(reloaded.entries) == ["c", "a", "d"]
+    assert reloaded.get("b") is None
+
+
+def test_save_only_when_changed(path):
+    cache = BenchmarkCache(path)
+    assert cache.get("absente") is None
+    cache.save()
+    with pytest.raises(FileNotFoundError):
+        open(path)
+    cache.put("k", {"median": 1})
+    cache.clear()
+    with open(path, encoding="utf-8") as file:
+        assert json.load(file) == {}
+
+
+def test_truncated_file(path):
+    with open(path, "w", encoding="utf-8") as file:
+        file.write('{"clé": {"median": ')
+    cache = BenchmarkCache(path)
+    assert cache.entries == {}
+    cache.put("k", {"median": 1})
+    cache.save()
+    assert BenchmarkCache(path).entries == {"k": {"median": 1}}
+
+
+def test_sweep_points_reused(path):
+    cache = BenchmarkCache(path)
+    sorting_function = ALGORITHMS["Merge Sort"]
+    sweep = adaptive_sweep(sorting_function, budget=0.05, start_size=64, max_size=1024, repeats=2)
+    cache.record_sweep("Merge Sort", sweep, seed=0, repeats=2)
+    cache.save()
+    reloaded = BenchmarkCache(path)
+    cached = reloaded.points("Merge Sort", seed=0, repeats=2)
+    assert sorted(cached) == [point["size"] for point in sweep["points"]]
+    # Autre protocole, autre distribution ou autre algorithme : rien à reprendre
+    assert reloaded.points("Merge Sort", seed=1, repeats=2) == {}
+    assert reloaded.points("Merge Sort", "sorted", seed=0, repeats=2) == {}
+    assert reloaded.points("Heap Sort", seed=0, repeats=2) == {}
+    # Les points en cache ne sont pas remesurés et le balayage s'arrête aux mêmes tailles
+    again = adaptive_sweep(sorting_function, budget=0.05, start_size=64, max_size=1024, repeats=2, cached=cached)
+    assert [point["size"] for point in again["points"]] == [point["size"] for point in sweep["points"]]
+    assert all(point["cached"] for point in again["points"])
+    reloaded.record_sweep("Merge Sort", again, seed=0, repeats=2)
+    assert all("cached" not in point for point in reloaded.entries.values())
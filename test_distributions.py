@@ -0,0 +1,54 @@
+"""Générateurs de données d'entrée (python -m pytest)."""
+import numpy as np
+import pytest
+
+from distributions import (
+    DISTRIBUTIONS, FEW_UNIQUE_VALUES, LABELS, NEARLY_SORTED_K, SAWTOOTH_TEETH, generate, generate_array,
+)
+
+
+@pytest.mark.parametrize("distribution", list(DISTRIBUTIONS))
+@pytest.mark.parametrize("size", [0, 1, 7, 1000])
+def test_shape_range_and_reproducibility(distribution, size):
+    values = generate_array(distribution, size, seed=3, max_value=500)
+    assert values.dtype == np.int64 and values.shape == (size,)
+    assert np.all((1 <= values) & (values <= 500))
+    assert np.array_equal(values, generate_array(distribution, size, seed=3, max_value=500))
+    assert generate(distribution, size, seed=3, max_value=500) == values.tolist()
+    assert distribution in LABELS
+
+
+def test_unknown_distribution():
+    with pytest.raises(ValueError):
+        generate_array("gaussienne", 10)
+
+
+def test_shapes():
+    n = 10000
+    assert np.all(np.diff(generate_array("sorted", n, 0)) >= 0)
+    assert np.all(np.diff(generate_array("reversed", n, 0)) <= 0)
+    assert len(np.unique(generate_array("few_unique", n, 0))) <= FEW_UNIQUE_VALUES
+    pipe = generate_array("organ_pipe", n, 0)
+    peak = int(np.argmax(pipe))
+    assert np.all(np.diff(pipe[:peak + 1]) >= 0) and np.all(np.diff(pipe[peak:]) <= 0)
+    # Une descente à chaque début de dent (sauf la première)
+    assert np.count_nonzero(np.diff(generate_array("sawtooth", n, 0)) < 0) <= SAWTOOTH_TEETH - 1
+
+
+def test_nearly_sorted_displacement():
+    # Valeurs très étendues, donc distinctes : la place triée de chaque élément est unique
+    values = generate_array("nearly_sorted", 10000, 0, max_value=10 ** 15)
+    assert len(np.unique(values)) == len(values)
+    target = np.argsort(np.argsort(values))
+    assert np.max(np.abs(target - np.arange(len(values)))) < NEARLY_SORTED_K
+
+
+def test_zipf():
+    values = generate_array("zipf", 100000, 0)
+    counts = np.bincount(values, minlength=4)
+    # Fréquence proportionnelle à k^-1.5 : 1 est environ 2.8 fois plus fréquent que 2
+    assert counts[1] > counts[2] > counts[3]
+    assert 2.4 < counts[1] / counts[2] < 3.2
+    # Le coût ne dépend pas de max_value (la répartition n'est pas tabulée jusqu'au bout)
+    wide = generate_array("zipf", 1000, 0, max_value=2 ** 62)
+    assert wide.min() >= 1 and wide.max() <= 2 ** 62
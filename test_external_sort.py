@@ -0,0 +1,43 @@
+"""Tri externe et son interface en ligne de commande (python -m pytest)."""
+import numpy as np
+import pytest
+
+import main_external_sort
+from distributions import DISTRIBUTIONS
+from external_sort import external_sort
+
+
+@pytest.mark.parametrize("distribution", list(DISTRIBUTIONS))
+def test_generate_file(tmp_path, distribution):
+    path = tmp_path / "donnees.bin"
+    main_external_sort.generate_file(path, 5000, distribution, seed=1)
+    values = np.fromfile(path, dtype=np.int64)
+    assert len(values) == 5000 and values.min() >= 1
+
+
+@pytest.mark.parametrize("distribution", list(DISTRIBUTIONS))
+def test_cli_sorts_generated_file(tmp_path, capsys, distribution):
+    source, target = tmp_path / "donnees.bin", tmp_path / "triees.bin"
+    argv = [str(source), str(target), "--generate", "20000", "--distribution", distribution, "--memory", "0.02"]
+    assert main_external_sort.main(argv) == 0
+    assert "20000 entiers" in capsys.readouterr().out
+    assert np.array_equal(np.fromfile(target, dtype=np.int64), np.sort(np.fromfile(source, dtype=np.int64)))
+
+
+@pytest.mark.parametrize("count", [0, 1, 999, 1000, 12345])
+def test_external_sort_multiple_passes(tmp_path, count):
+    source, target = tmp_path / "donnees.bin", tmp_path / "triees.bin"
+    values = np.random.default_rng(count).integers(-2 ** 63, 2 ** 63 - 1, count, dtype=np.int64)
+    values.tofile(source)
+    runs = []
+    stats = external_sort(source, target, memory_limit=8000, fan_in=3, temp_dir=tmp_path,
+                          on_run=lambda start, chunk: runs.append(start))
+    assert np.array_equal(np.fromfile(target, dtype=np.int64), np.sort(values))
+    assert stats["items"] == count and stats["runs"] == len(runs) == -(-count // 1000)
+    # 13 suites fusionnées 3 par 3 : 13 -> 5 -> 2 -> 1
+    assert stats["passes"] == {0: 0, 1: 0, 999: 0, 1000: 0, 12345: 3}[count]
+
+
+def test_external_sort_rejects_small_fan_in(tmp_path):
+    with pytest.raises(ValueError):
+        external_sort(tmp_path / "absent.bin", tmp_path / "triees.bin", fan_in=1)
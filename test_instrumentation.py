@@ -0,0 +1,68 @@
+"""Comptage exact des opérations (python -m pytest)."""
+import random
+
+import pytest
+
+from instrumentation import count_operations
+from sorting_algorithms import ALGORITHMS
+
+
+def inversions(values):
+    return sum(values[i] > values[j] for i in range(len(values)) for j in range(i + 1, len(values)))
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(14)
+    return [rng.randint(-50, 50) for _ in range(80)]
+
+
+def test_bubble_sort_counts(values):
+    n = len(values)
+    result, counts = count_operations(ALGORITHMS["Bubble Sort"], values)
+    assert result == sorted(values)
+    assert counts.comparisons == n * (n - 1) // 2
+    assert counts.swaps == inversions(values)
+    # Chaque comparaison lit deux éléments, chaque échange lit puis écrit les deux
+    assert counts.reads == 2 * counts.comparisons + 2 * counts.swaps
+    assert counts.writes == 2 * counts.swaps
+    assert counts.allocations == 0
+
+
+def test_insertion_sort_counts(values):
+    n = len(values)
+    _, counts = count_operations(ALGORITHMS["Insertion Sort"], values)
+    assert counts.swaps == inversions(values)
+    # Une comparaison par échange, plus au plus une comparaison d'arrêt par élément
+    assert counts.swaps <= counts.comparisons <= counts.swaps + n - 1
+    _, counts = count_operations(ALGORITHMS["Insertion Sort"], sorted(values))
+    assert counts.as_dict() == {"comparisons": n - 1, "swaps": 0, "reads": 2 * (n - 1), "writes": 0,
+                                "allocations": 0}
+
+
+def test_selection_sort_comparisons(values):
+    n = len(values)
+    _, counts = count_operations(ALGORITHMS["Selection Sort"], values)
+    assert counts.comparisons == n * (n - 1) // 2
+    assert counts.swaps <= n - 1
+
+
+def test_merge_sort_counts():
+    _, counts = count_operations(ALGORITHMS["Merge Sort"], [2, 1])
+    assert counts.comparisons == 1 and counts.swaps == 0
+    _, counts = count_operations(ALGORITHMS["Merge Sort"], list(range(64)))
+    # Suites déjà en ordre : chaque fusion de deux moitiés de k éléments compare k fois
+    assert counts.comparisons == 6 * 32
+
+
+@pytest.mark.parametrize("name", ["Radix Sort", "Counting Sort"])
+def test_non_comparison_sorts(name, values):
+    result, counts = count_operations(ALGORITHMS[name], values)
+    assert result == sorted(values) and counts.comparisons == 0
+
+
+def test_data_left_untouched(values):
+    original = list(values)
+    result, _ = count_operations(ALGORITHMS["Quick Sort"], values)
+    assert values == original
+    assert result == sorted(values) and all(type(value) is int for value in result)
@@ -0,0 +1,38 @@
+"""Réseaux de tri vectorisés : transposition pair-impair et tri bitonique (python -m pytest)."""
+import numpy as np
+import pytest
+
+from networks import bitonic, odd_even_transposition
+
+
+@pytest.mark.parametrize("network", [odd_even_transposition, bitonic])
+def test_networks_on_batches(network):
+    rng = np.random.default_rng(8)
+    for width in (0, 1, 2, 3, 8, 13, 64):
+        rows = rng.integers(-20, 20, (5, width))
+        expected = np.sort(rows, axis=1)
+        assert np.array_equal(network(rows.copy()), expected)
+
+
+@pytest.mark.parametrize("network", [odd_even_transposition, bitonic])
+def test_networks_zero_one_principle(network):
+    # Un réseau qui trie toutes les entrées de 0 et de 1 trie toutes les entrées de même largeur
+    for width in range(1, 11):
+        rows = (np.arange(1 << width)[:, None] >> np.arange(width)) & 1
+        assert np.array_equal(network(rows.copy()), np.sort(rows, axis=1)), width
+
+
+@pytest.mark.parametrize("network, stages", [(odd_even_transposition, lambda n: n),
+                                             (bitonic, lambda n: (n - 1).bit_length() * ((n - 1).bit_length() + 1) // 2)])
+def test_networks_in_place_with_stages(network, stages):
+    rng = np.random.default_rng(9)
+    for n in (2, 5, 16, 100):
+        values = rng.integers(-20, 20, n)
+        expected = np.sort(values)
+        snapshots = []
+        assert network(values, on_stage=lambda current: snapshots.append(current.copy())) is values
+        # Une étape rapportée par étape du réseau, le tableau d'origine étant tenu à jour
+        assert len(snapshots) == stages(n) and np.array_equal(snapshots[-1], expected)
+        assert np.array_equal(values, expected)
+    with pytest.raises(ValueError):
+        network(np.zeros((2, 2, 2)))
@@ -0,0 +1,57 @@
+"""Enregistrement et relecture des traces d'opérations (python -m pytest)."""
+import random
+
+import pytest
+
+from instrumentation import count_operations
+from operation_trace import COMPARE, SWAP, WRITE, OperationTrace, TracePlayer
+from sorting_algorithms import ALGORITHMS
+
+
+def random_values(n, seed):
+    rng = random.Random(seed)
+    return [rng.randint(-50, 50) for _ in range(n)]
+
+
+@pytest.mark.parametrize("name", ["Insertion Sort", "Merge Sort", "Quick Sort", "Heap Sort", "Radix Sort"])
+@pytest.mark.parametrize("compares", [True, False])
+def test_trace_replay(name, compares):
+    values = random_values(300, 11)
+    arr = list(values)
+    trace = OperationTrace.record(ALGORITHMS[name], arr, compares=compares)
+    assert arr == sorted(values)
+    player = TracePlayer(trace)
+    player.seek(len(trace))
+    assert player.array == arr
+    player.advance(-len(trace) // 2)
+    player.seek(0)
+    assert player.array == values
+    assert (COMPARE in trace.ops) == (compares and name != "Radix Sort")
+
+
+@pytest.mark.parametrize("name", ["Insertion Sort", "Merge Sort", "Quick Sort", "Heap Sort", "Natural Merge Sort"])
+def test_trace_compares(name):
+    values = random_values(200, 12)
+    trace = OperationTrace.record(ALGORITHMS[name], list(values))
+    _, counts = count_operations(ALGORITHMS[name], values)
+    compares = [(i, j) for op, i, j in trace.events() if op == COMPARE]
+    assert len(compares) == counts.comparisons
+    assert all(0 <= i < len(values) and 0 <= j < len(values) for i, j in compares)
+    assert trace.ops.count(SWAP) + trace.ops.count(WRITE) + len(compares) == len(trace)
+
+
+def test_compare_positions_follow_elements():
+    # Insertion par échanges : chaque comparaison porte sur les deux positions échangées ensuite
+    trace = OperationTrace.record(ALGORITHMS["Insertion Sort"], [3, 1, 2])
+    assert list(trace.events()) == [(COMPARE, 1, 0), (SWAP, 1, 0), (COMPARE, 2, 1), (SWAP, 2, 1), (COMPARE, 1, 0)]
+
+
+def test_compare_events_leave_array_unchanged():
+    values = random_values(50, 13)
+    trace = OperationTrace.record(ALGORITHMS["Quick Sort"], list(values))
+    player = TracePlayer(trace)
+    for op, i, j in trace.events():
+        before = list(player.array)
+        assert player.step() == (op, i, j)
+        if op == COMPARE:
+            assert player.array == before
@@ -0,0 +1,48 @@
+"""Tris parallèles en mémoire partagée (python -m pytest)."""
+import random
+
+import numpy as np
+import pytest
+
+import parallel_sort
+from parallel_benchmark import run_parallel_benchmark
+from test_sorting_algorithms import random_values
+
+ENGINES = [parallel_sort.parallel_merge_sort, parallel_sort.sample_sort]
+
+
+def test_co_rank():
+    rng = random.Random(6)
+    for _ in range(200):
+        a = sorted(random_values(rng.randint(0, 20), rng.random()))
+        b = sorted(random_values(rng.randint(0, 20), rng.random()))
+        merged = sorted(a + b)
+        for k in range(len(a) + len(b) + 1):
+            i = parallel_sort._co_rank(a, b, k)
+            assert sorted(a[:i] + b[:k - i]) == merged[:k]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_engines_with_processes(engine):
+    keys = np.array(random_values(parallel_sort.PARALLEL_MIN_SIZE + 123, 7, -10 ** 6, 10 ** 6), dtype=np.int64)
+    steps = []
+    result = engine(keys, workers=2, on_step=lambda values: steps.append(np.array(values)))
+    assert result.tolist() == sorted(keys.tolist())
+    # L'entrée n'est pas modifiée ; le dernier état montré est le résultat
+    assert steps and np.array_equal(steps[-1], result)
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("workers", [1, 3])
+def test_engines_small_and_repeated(engine, workers):
+    for values in ([], [5], [3, 1, 2], [7] * 1000, random_values(5000, 8, -3, 3)):
+        keys = np.array(values, dtype=np.int64)
+        assert engine(keys, workers=workers).tolist() == sorted(values)
+
+
+def test_spawning_sorts_run_from_pool_jobs():
+    # Les tris qui créent leurs propres processus ne peuvent pas tourner dans un processus du pool (démon)
+    results = run_parallel_benchmark(["Parallel Merge Sort", "Sample Sort", "Merge Sort"], sizes=(2000,),
+                                     repeats=2, warmup=0, workers=2)
+    assert sorted(stats["algorithm"] for stats in results) == ["Merge Sort", "Parallel Merge Sort", "Sample Sort"]
+    assert all(len(stats["times_ns"]) == 2 for stats in results)
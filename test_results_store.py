@@ -0,0 +1,70 @@
+"""Stockage persistant des résultats de benchmark (python -m pytest)."""
+import json
+
+import pytest
+
+from results_store import ResultsStore, median_confidence_interval
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "resultats.jsonl")
+
+
+def test_append_and_reload(path):
+    store = ResultsStore(path)
+    store.append("Merge Sort", 100, [3000, 1000, 2000])
+    store.append("Merge Sort", 100, [4000])
+    store.append("Merge Sort", 200, [9000], distribution="sorted")
+    store.append("Quick Sort", 100, [500])
+    # Une nouvelle session relit le fichier : les répétitions des sessions s'ajoutent
+    reloaded = ResultsStore(path)
+    assert reloaded.times_by_size("Merge Sort") == {100: [3000, 1000, 2000, 4000]}
+    assert reloaded.times_by_size("Merge Sort", "sorted") == {200: [9000]}
+    assert reloaded.times_by_size("Merge Sort", machine="autre machine") == {}
+    with open(path, encoding="utf-8") as file:
+        assert len(file.readlines()) == 4
+
+
+def test_index_loaded_lazily_then_updated(path):
+    ResultsStore(path).append("Heap Sort", 10, [1])
+    store = ResultsStore(path)
+    assert store._index is None
+    assert store.times_by_size("Heap Sort") == {10: [1]}
+    store.append("Heap Sort", 10, [2])
+    assert store.times_by_size("Heap Sort") == {10: [1, 2]}
+
+
+def test_truncated_last_line(path):
+    store = ResultsStore(path)
+    store.append("Merge Sort", 100, [1000])
+    record = json.dumps({"algorithm": "Merge Sort", "size": 100, "times_ns": [5]})
+    with open(path, "a", encoding="utf-8") as file:
+        file.write(record[:len(record) // 2])  # écriture interrompue
+    ResultsStore(path).append("Merge Sort", 100, [2000])
+    assert ResultsStore(path).times_by_size("Merge Sort") == {100: [1000, 2000]}
+
+
+def test_series(path):
+    store = ResultsStore(path)
+    store.append("Merge Sort", 200, [4e9, 2e9, 3e9])
+    store.append("Merge Sort", 100, [1e9])
+    (size, median, low, high), second = store.series("Merge Sort")
+    assert (size, median, low, high) == (100, 1.0, 1.0, 1.0)
+    assert second[0] == 200 and second[1] == 3.0 and second[2] <= 3.0 <= second[3]
+
+
+def test_median_confidence_interval():
+    values = list(range(100, 0, -1))
+    low, high = median_confidence_interval(values)
+    assert low < 50 < high and low >= 30 and high <= 70
+    assert median_confidence_interval([7]) == (7, 7)
+
+
+def test_archive(path, tmp_path):
+    store = ResultsStore(path)
+    store.append("Merge Sort", 100, [1000])
+    store.archive()
+    assert store.times_by_size("Merge Sort") == {}
+    assert ResultsStore(path).times_by_size("Merge Sort") == {}
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,60 @@
+"""Sélection : k-ième élément, k plus petits éléments et tri partiel (python -m pytest)."""
+import math
+
+import pytest
+
+from instrumentation import count_operations
+from selection import SelectionAlgorithms
+from sorting_algorithms import swap
+from test_sorting_algorithms import SIZES, killer_input, random_values
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_selection(n):
+    values = random_values(n, seed=n)
+    expected = sorted(values)
+    for k in {0, n // 3, n - 1} if n else ():
+        arr = list(values)
+        assert SelectionAlgorithms.nth_element(arr, k) == expected[k]
+        assert all(x <= arr[k] for x in arr[:k]) and all(x >= arr[k] for x in arr[k + 1:])
+        assert sorted(arr) == expected
+    for k in {0, 1, n // 2, n, n + 5}:
+        assert SelectionAlgorithms.top_k(list(values), k) == expected[:k]
+        assert SelectionAlgorithms.top_k(iter(values), k) == expected[:k]
+        arr = list(values)
+        SelectionAlgorithms.partial_sort(arr, k)
+        assert arr[:k] == expected[:k] and sorted(arr) == expected
+
+
+@pytest.mark.parametrize("n", [n for n in SIZES if n])
+def test_selection_with_hook(n):
+    # Le crochet reçoit toutes les opérations : le tableau final est le même qu'en interne
+    values = random_values(n, seed=n + 1, low=-5, high=5)
+    expected = sorted(values)
+    k = n // 2
+    arr = list(values)
+    assert SelectionAlgorithms.nth_element(arr, k, swap) == expected[k]
+    assert sorted(arr) == expected
+    arr = list(values)
+    assert SelectionAlgorithms.top_k(arr, k + 1, swap) == expected[:k + 1] == arr[:k + 1]
+    arr = list(values)
+    SelectionAlgorithms.partial_sort(arr, k, swap)
+    assert arr[:k] == expected[:k] and sorted(arr) == expected
+
+
+def test_nth_element_rank_out_of_range():
+    for arr, k in (([], 0), ([3, 1, 2], 3), ([3, 1, 2], -1)):
+        with pytest.raises(IndexError):
+            SelectionAlgorithms.nth_element(arr, k)
+
+
+def test_nth_element_on_killer_input():
+    # Médiane des médianes après 2 * log2(n) partitions : pas de comportement quadratique
+    def select(arr, draw_swap=None):
+        SelectionAlgorithms.nth_element(arr, len(arr) // 2, draw_swap)
+
+    for n in (1000, 4000):
+        values = killer_input(select, n)
+        arr, counts = count_operations(select, values)
+        assert arr[n // 2] == sorted(values)[n // 2]
+        assert counts.comparisons <= 8 * n * math.log2(n)
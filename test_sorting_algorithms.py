@@ -0,0 +1,193 @@
+"""Vérifications aléatoires des algorithmes du registre, comparés à sorted() (python -m pytest)."""
+import math
+import random
+
+import numpy as np
+import pytest
+
+from instrumentation import count_operations
+from profiling import Profiler
+from sorting_algorithms import ALGORITHMS, INT64_MAX, RADIX_BITS, SortingAlgorithms, swap
+
+# Algorithmes quadratiques (ou en n étapes) : limités aux petites tailles
+SLOW = ("Selection Sort", "Bubble Sort", "Insertion Sort", "Odd-Even Sort")
+
+# Algorithmes qui ne trient que des entiers (clés int64)
+INTEGER_ONLY = ("Radix Sort", "Counting Sort", "External Merge Sort", "Parallel Merge Sort", "Sample Sort")
+
+SIZES = (0, 1, 2, 3, 17, 100, 1000)
+
+
+def random_values(n, seed, low=-50, high=50):
+    """n entiers dans [low, high] : négatifs et doublons"""
+    rng = random.Random(seed)
+    return [rng.randint(low, high) for _ in range(n)]
+
+
+def shaped_inputs(n, seed):
+    values = random_values(n, seed)
+    yield values
+    yield sorted(values)
+    yield sorted(values, reverse=True)
+    yield [7] * n
+
+
+def sizes_for(name):
+    return [n for n in SIZES if name not in SLOW or n <= 100]
+
+
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_sorts_shaped_inputs(name):
+    for n in sizes_for(name):
+        for values in shaped_inputs(n, seed=n):
+            arr = list(values)
+            ALGORITHMS[name](arr)
+            assert arr == sorted(values), (name, n)
+
+
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_sorts_with_hook(name):
+    for n in sizes_for(name):
+        values = random_values(n, seed=n)
+        arr = list(values)
+        ALGORITHMS[name](arr, swap)
+        assert arr == sorted(values), (name, n)
+
+
+@pytest.mark.parametrize("name", [name for name in ALGORITHMS if name not in INTEGER_ONLY])
+def test_sorts_floats(name):
+    rng = random.Random(1)
+    for n in sizes_for(name):
+        values = [rng.uniform(-1, 1) for _ in range(n)]
+        arr = list(values)
+        ALGORITHMS[name](arr)
+        assert arr == sorted(values), (name, n)
+
+
+def killer_input(sorting_function, n):
+    """Entrée défavorable construite par l'adversaire de McIlroy (« A Killer Adversary for Quicksort »).
+
+    Les valeurs ne sont fixées qu'au moment où une comparaison l'exige, de
+    façon à rendre chaque pivot aussi mauvais que possible ; triées à leur
+    tour, elles reproduisent exactement les mêmes comparaisons.
+    """
+    gas = n
+    values = [gas] * n
+    solid = 0
+    candidate = None
+
+    def compare(x, y):
+        nonlocal solid, candidate
+        if values[x] == gas and values[y] == gas:
+            frozen = x if x == candidate else y
+            values[frozen] = solid
+            solid += 1
+        if values[x] == gas:
+            candidate = x
+        elif values[y] == gas:
+            candidate = y
+        return values[x] - values[y]
+
+    class Item:
+        __slots__ = ("index",)
+
+        def __init__(self, index):
+            self.index = index
+
+        def __lt__(self, other):
+            return compare(self.index, other.index) < 0
+
+        def __gt__(self, other):
+            return compare(self.index, other.index) > 0
+
+    sorting_function([Item(index) for index in range(n)])
+    return values
+
+
+def test_introsort_heap_fallback():
+    values = killer_input(ALGORITHMS["Quick Sort"], 2000)
+    arr = list(values)
+    profiler = Profiler()
+    with profiler:
+        ALGORITHMS["Quick Sort"](arr)
+    assert arr == sorted(values)
+    # La profondeur maximale est atteinte : le tri par tas prend le relais
+    assert ("repli sur le tas",) in profiler.phase_totals()
+
+
+def test_introsort_comparisons_on_killer_input():
+    # Repli sur le tas : O(n log n) comparaisons même face à l'adversaire
+    for n in (1000, 4000):
+        _, counts = count_operations(ALGORITHMS["Quick Sort"], killer_input(ALGORITHMS["Quick Sort"], n))
+        assert counts.comparisons <= 8 * n * math.log2(n)
+
+
+class Record:
+    """Élément comparé sur sa seule clé : sa position d'origine révèle un tri instable"""
+    __slots__ = ("key", "origin")
+
+    def __init__(self, key, origin):
+        self.key = key
+        self.origin = origin
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+@pytest.mark.parametrize("name", ["Bottom-Up Merge Sort", "Natural Merge Sort", "Insertion Sort"])
+def test_stable_sorts(name):
+    rng = random.Random(15)
+    for n in (2, 31, 32, 33, 200):
+        keys = [rng.randint(0, 5) for _ in range(n)] + list(range(n, 0, -1)) + [3] * 40
+        arr = [Record(key, origin) for origin, key in enumerate(keys)]
+        ALGORITHMS[name](arr)
+        assert [(r.key, r.origin) for r in arr] == sorted((r.key, r.origin) for r in arr), (name, n)
+
+
+def test_bottom_up_merge_single_buffer():
+    # Un seul tampon de n éléments, quel que soit le nombre de passes de fusion
+    for n in (1, 5, 100, 1000):
+        result, counts = count_operations(ALGORITHMS["Bottom-Up Merge Sort"], random_values(n, n))
+        assert result == sorted(random_values(n, n))
+        assert counts.allocations == (n if n > 1 else 0)
+
+
+@pytest.mark.parametrize("name", INTEGER_ONLY)
+def test_integer_sorts_reject_floats(name):
+    for values in ([0.5, -0.2, 0.3, -0.7], np.array([2.7, -0.2, 1.3, -1.7])):
+        original = list(values)
+        with pytest.raises(TypeError):
+            ALGORITHMS[name](values)
+        assert list(values) == original
+
+
+@pytest.mark.parametrize("values", [[1 << 63, 1], [-(1 << 63) - 1, 1], np.array([1 << 63, 1], dtype=np.uint64)])
+def test_integer_sorts_reject_out_of_range(values):
+    with pytest.raises(OverflowError):
+        ALGORITHMS["Radix Sort"](values)
+
+
+@pytest.mark.parametrize("radix_bits", [1, 4, RADIX_BITS, 11, 16])
+def test_radix_sort_full_int64_range(radix_bits):
+    rng = np.random.default_rng(radix_bits)
+    values = rng.integers(-INT64_MAX - 1, INT64_MAX, 500, dtype=np.int64, endpoint=True).tolist()
+    values += [-INT64_MAX - 1, INT64_MAX, 0, -1]
+    arr = list(values)
+    SortingAlgorithms.radix_sort(arr, radix_bits=radix_bits)
+    assert arr == sorted(values)
+
+
+def test_radix_argsort_is_stable():
+    keys = np.array(random_values(1000, 16, -3, 3))
+    order = SortingAlgorithms.radix_argsort(keys)
+    assert np.array_equal(order, np.argsort(keys, kind="stable"))
+    with pytest.raises(ValueError):
+        SortingAlgorithms.radix_argsort(keys, radix_bits=17)
+
+
+def test_counting_sort_range_limit():
+    arr = np.array(random_values(300, 17, -10 ** 5, 10 ** 5))
+    ALGORITHMS["Counting Sort"](arr)
+    assert arr.tolist() == sorted(arr.tolist())
+    with pytest.raises(ValueError):
+        ALGORITHMS["Counting Sort"]([0, 1 << 40])
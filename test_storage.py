@@ -0,0 +1,51 @@
+"""Stockages compacts (array.array, NumPy) et tri à travers une memoryview (python -m pytest)."""
+import numpy as np
+import pytest
+
+from sorting_algorithms import ALGORITHMS
+from storage import STORAGES, as_buffer, bytes_per_element, copy_storage, make_storage, scratch_copy, storage_kind
+from test_sorting_algorithms import random_values, shaped_inputs, sizes_for
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+@pytest.mark.parametrize("name", list(ALGORITHMS))
+def test_sorts_every_storage(name, storage):
+    for n in sizes_for(name):
+        for values in shaped_inputs(n, seed=n):
+            arr = make_storage(values, storage)
+            ALGORITHMS[name](arr)
+            assert list(arr) == sorted(values), (name, storage, n)
+
+
+@pytest.mark.parametrize("storage", STORAGES)
+def test_storage_helpers(storage):
+    values = random_values(100, 13)
+    arr = make_storage(values, storage)
+    assert storage_kind(arr) == storage and list(arr) == values
+    copy = copy_storage(arr)
+    copy[0] = 1000
+    assert storage_kind(copy) == storage and arr[0] == values[0]
+    # Le tampon de travail est indépendant mais du même genre que la vue à trier
+    buffer = as_buffer(arr)
+    scratch = scratch_copy(buffer)
+    scratch[0] = 1000
+    assert type(scratch) is type(buffer) and list(scratch[1:]) == values[1:] and arr[0] == values[0]
+
+
+def test_as_buffer_rejects_unsortable_storage():
+    readonly = np.arange(5)
+    readonly.setflags(write=False)
+    for arr in (np.zeros((3, 3), dtype=np.int64), np.arange(10)[::2], readonly):
+        with pytest.raises(ValueError):
+            as_buffer(arr)
+    with pytest.raises(ValueError):
+        make_storage([1, 2], "tuple")
+
+
+def test_bytes_per_element():
+    values = list(range(1000, 2000))
+    assert bytes_per_element(make_storage(values, "numpy")) < 9
+    assert 8 <= bytes_per_element(make_storage(values, "array")) < 9
+    # Pointeur plus objet int pour une liste
+    assert bytes_per_element(make_storage(values, "list")) > 28
+    assert bytes_per_element([]) == 0.0
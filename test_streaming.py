@@ -0,0 +1,84 @@
+"""Fusion k-voies paresseuse et conteneur trié incrémental (python -m pytest)."""
+import random
+
+import pytest
+
+from streaming import BLOCK_SIZE, SortedContainer, kway_merge
+from test_sorting_algorithms import random_values
+
+
+def test_kway_merge():
+    rng = random.Random(9)
+    sources = [sorted(random_values(rng.randint(0, 50), seed)) for seed in range(12)] + [[]]
+    assert list(kway_merge(*sources)) == sorted(sum(sources, []))
+    descending = [source[::-1] for source in sources]
+    assert list(kway_merge(*(iter(s) for s in descending), key=lambda x: -x)) == sorted(sum(sources, []), reverse=True)
+    assert list(kway_merge()) == []
+
+
+def test_sorted_container():
+    rng = random.Random(10)
+    container = SortedContainer()
+    reference = []
+    for step in range(6000):
+        action = rng.random()
+        if action < 0.5:
+            value = rng.randint(-300, 300)
+            container.add(value)
+            reference.append(value)
+        elif action < 0.55:
+            batch = random_values(rng.choice((3, 40, 3 * BLOCK_SIZE)), step, -300, 300)
+            container.update(batch)
+            reference.extend(batch)
+        elif reference:
+            value = rng.choice(reference) if action < 0.8 else rng.randint(-400, 400)
+            if value in reference:
+                container.remove(value)
+                reference.remove(value)
+            else:
+                assert value not in container
+                with pytest.raises(ValueError):
+                    container.remove(value)
+        if step % 500 == 0 or step == 5999:
+            reference.sort()
+            assert list(container) == reference and len(container) == len(reference)
+            for probe in (-400, -1, 0, 5, 400):
+                assert container.bisect_left(probe) == sum(x < probe for x in reference)
+                assert container.bisect_right(probe) == sum(x <= probe for x in reference)
+                assert (probe in container) == (probe in reference)
+            for index in (0, len(reference) // 2, -1):
+                if reference:
+                    assert container[index] == reference[index]
+    with pytest.raises(IndexError):
+        container[len(reference)]
+
+
+def test_kway_merge_stable_and_lazy():
+    # À égalité, la source la plus à gauche d'abord ; un seul élément lu par source avant le premier
+    consumed = []
+
+    def source(index, values):
+        for value in values:
+            consumed.append(index)
+            yield value, index
+
+    sources = [source(index, [1, 2, 2, 5]) for index in range(3)]
+    merged = kway_merge(*sources, key=lambda item: item[0])
+    assert next(merged) == (1, 0) and consumed == [0, 1, 2]
+    assert list(merged) == [(1, 1), (1, 2), (2, 0), (2, 0), (2, 1), (2, 1), (2, 2), (2, 2), (5, 0), (5, 1), (5, 2)]
+
+
+def test_sorted_container_blocks():
+    # Blocs d'au plus 2 * BLOCK_SIZE éléments, triés bout à bout, après insertions une à une et par lots
+    rng = random.Random(11)
+    container = SortedContainer(random_values(5 * BLOCK_SIZE, 12))
+    for step in range(20):
+        if step % 2:
+            container.update(random_values(rng.choice((5, 40, BLOCK_SIZE)), step))
+        else:
+            for _ in range(BLOCK_SIZE):
+                container.add(rng.randint(-50, 50))
+    blocks = container._blocks
+    assert all(0 < len(block) <= 2 * BLOCK_SIZE for block in blocks)
+    assert container._maxes == [block[-1] for block in blocks]
+    assert list(container) == sorted(container) and len(container) == sum(map(len, blocks))
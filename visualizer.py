@@ -1,40 +1,47 @@
+import os
 import pygame
-import random
 import time
-import json
-import os
-from sorting_algorithms import SortingAlgorithms
-import tracemalloc
-import matplotlib.pyplot as plt
+from sorting_algorithms import ALGORITHMS
+from adaptive import AUTO, decide
 import numpy as np
-from matplotlib.backends.backend_agg import FigureCanvasAgg
-from matplotlib.figure import Figure
-
-WIDTH, HEIGHT = 800, 600
-BAR_COLOR = (0, 102, 204)
-BG_COLOR = (255, 255, 255)
-SELECTED_COLOR = (255, 0, 0)
-BUTTON_COLOR = (200, 200, 200)
-BUTTON_HOVER_COLOR = (150, 150, 150)
-TEXT_COLOR = (0, 0, 0)
-INPUT_COLOR = (240, 240, 240)
-INPUT_BORDER_COLOR = (150, 150, 150)
-INPUT_ACTIVE_COLOR = (220, 220, 255)
+
+from constants import (
+    WIDTH, HEIGHT, BAR_COLOR, BG_COLOR, SELECTED_COLOR, BUTTON_COLOR, BUTTON_HOVER_COLOR,
+    TEXT_COLOR, INPUT_COLOR, INPUT_BORDER_COLOR, INPUT_ACTIVE_COLOR,
+)
+from renderer import FrameRenderer
+from operation_trace import OperationTrace, TracePlayer
+from benchmark import FIT_POINTS, fit_power_law
+from parallel_benchmark import COUNT, MEMORY, TIME, default_workers, run_jobs, run_parallel_sweeps
+from results_store import ResultsStore
+from benchmark_cache import BenchmarkCache
+from distributions import DISTRIBUTIONS, LABELS, generate
+from background import BackgroundTask
+
+# Fichiers écrits par l'export PNG des graphiques
+PERFORMANCE_GRAPH_PATH = "tri_performance.png"
+HEATMAP_PATH = "tri_distributions.png"
 
 class SortVisualizer:
-    def __init__(self):
+    def __init__(self, headless=False):
+        # Mode sans fenêtre (CI, traitements par lots) : pilotes SDL factices,
+        # et les écrans interactifs sont sautés au lieu d'attendre un clic
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
         self.comparisons = 0
         self.swaps = 0
+        self.reads = 0
+        self.writes = 0
         self.execution_time = 0
-        self.start_ticks = 0
         self.is_sorting = False
         self.memory_usage = 0
         self.peak_memory = 0
+        self.auto_decision = None
         self.current_results = {}
-        self.performance_data = {name: {'sizes': [], 'times': []} for name in [
-            "Selection Sort", "Bubble Sort", "Insertion Sort", 
-            "Merge Sort", "Quick Sort", "Heap Sort", "Comb Sort"
-        ]}
+        # Résultats persistants de toutes les sessions (lus seulement à la première consultation)
+        self.results_store = ResultsStore()
         
         # Ajouter un bouton pour réinitialiser le graphique
         self.reset_graph_button = pygame.Rect(350, 310, 200, 40)
@@ -46,31 +53,23 @@ class SortVisualizer:
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("Arial", 20)
         self.small_font = pygame.font.SysFont("Arial", 16)
+        # L'animation rejouée dure environ 8 secondes quel que soit l'algorithme
+        self.renderer = FrameRenderer(self.screen, self.font, target_fps=60, target_duration=8)
         
-        self.algorithms = [
-            SortingAlgorithms.selection_sort,
-            SortingAlgorithms.bubble_sort,
-            SortingAlgorithms.insertion_sort,
-            SortingAlgorithms.merge_sort,
-            SortingAlgorithms.quick_sort,
-            SortingAlgorithms.heap_sort,
-            SortingAlgorithms.comb_sort,
-        ]
-        self.algorithm_names = [
-            "Selection Sort",
-            "Bubble Sort",
-            "Insertion Sort",
-            "Merge Sort",
-            "Quick Sort",
-            "Heap Sort",
-            "Comb Sort"
-        ]
+        self.algorithms = list(ALGORITHMS.values())
+        self.algorithm_names = list(ALGORITHMS)
         
         self.buttons = []
         self.return_button = pygame.Rect(WIDTH // 2 - 100, HEIGHT - 60, 200, 40)
         self.run_all_button = pygame.Rect(350, 70, 200, 40)
         self.graph_button = pygame.Rect(350, 130, 200, 40)
         self.benchmark_button = pygame.Rect(350, 250, 200, 40)  # Ajout d'un bouton pour lancer les benchmarks
+        self.distribution_button = pygame.Rect(350, 370, 250, 40)
+        self.heatmap_button = pygame.Rect(WIDTH - 230, HEIGHT - 60, 200, 40)
+        self.export_button = pygame.Rect(30, HEIGHT - 60, 200, 40)
+        
+        # Distribution des données générées (voir distributions.DISTRIBUTIONS)
+        self.distribution = "uniform"
         
         # Configuration pour l'entrée du nombre d'éléments
         self.element_count = 100  # Valeur par défaut
@@ -89,42 +88,45 @@ class SortVisualizer:
         self.showing_results = False
         self.showing_graph = False
         self.graph_surface = None
+        self.heatmap_surface = None
+        self.showing_heatmap = False
+        # Figure des courbes conservée entre deux affichages, et artistes de chaque série
+        self.graph_figure = None
+        self.graph_series = {}
+        self.graph_image = None
+        self.heatmap_figure = None
+        
+        # Exécution des mesures sur un pool de processus
+        self.parallel_workers = default_workers()
+        self.pin_workers = False
+        
+        # Budget de temps (en secondes) du balayage adaptatif de chaque algorithme
+        self.benchmark_budget = 2.0
+        # Graine fixe des balayages : les points déjà mesurés pour le code actuel d'un algorithme
+        # sont repris du cache, seuls les algorithmes modifiés (ou les nouvelles tailles) sont mesurés
+        self.benchmark_seed = 0
+        self.benchmark_cache = BenchmarkCache()
 
     def generate_numbers(self):
-        self.numbers = [random.randint(1, HEIGHT - 100) for _ in range(self.element_count)]
+        self.numbers = generate(self.distribution, self.element_count, max_value=HEIGHT - 100)
         self.bar_width = WIDTH // self.element_count if self.element_count <= WIDTH else 1
 
     def create_buttons(self):
         self.buttons = []
+        # Resserrer les boutons lorsqu'ils ne tiennent plus à l'écran
+        step = min(40, (HEIGHT - 90) // len(self.algorithm_names))
         for i, name in enumerate(self.algorithm_names):
-            rect = pygame.Rect(100, 70 + 40 * i, 200, 30)
+            rect = pygame.Rect(100, 70 + step * i, 200, min(30, step - 4))
             self.buttons.append((rect, name))
 
-    def draw_bars(self, highlighted_indices=None):
-        self.screen.fill(BG_COLOR)
-        highlighted_indices = highlighted_indices or []
-        
-        # Adapter l'affichage en fonction du nombre d'éléments
-        bar_width = self.bar_width
-        for i, value in enumerate(self.numbers):
-            if i >= WIDTH // bar_width:
-                break  # Ne pas dessiner plus de barres que ce qui peut tenir à l'écran
-                
-            x = i * bar_width
-            height = min(value % (HEIGHT - 100), HEIGHT - 100)  # Assurer que la hauteur est dans les limites
-            color = SELECTED_COLOR if i in highlighted_indices else BAR_COLOR
-            pygame.draw.rect(self.screen, color, (x, HEIGHT - height, bar_width, height))
-
-        # Afficher les statistiques
-        stats_text = self.font.render(f"Comparaisons: {self.comparisons} | Échanges: {self.swaps}", True, TEXT_COLOR)
-        time_text = self.font.render(f"Temps d'exécution: {self.execution_time:.6f} secondes", True, TEXT_COLOR)
-        memory_text = self.font.render(f"Mémoire: {self.memory_usage:.2f} KB | Pic: {self.peak_memory:.2f} KB", True, TEXT_COLOR)
-        
-        self.screen.blit(stats_text, (10, 10))
-        self.screen.blit(time_text, (10, 40))
-        self.screen.blit(memory_text, (10, 70))
-        
-        pygame.display.flip()
+    def stats_lines(self):
+        """Lignes de statistiques affichées au-dessus des barres"""
+        return [
+            f"Comparaisons: {self.comparisons} | Échanges: {self.swaps} | Lectures/écritures: {self.reads}/{self.writes}",
+            f"Temps d'exécution: {self.execution_time:.6f} secondes",
+            f"Mémoire auxiliaire: {self.memory_usage:.2f} KB | Pic: {self.peak_memory:.2f} KB",
+        ] + ([f"Auto : {self.translate_algo_name(self.auto_decision['algorithm'])}, "
+              f"{self.auto_decision['reason']}"] if self.auto_decision else [])
 
     def draw_menu(self):
         self.screen.fill(BG_COLOR)
@@ -162,6 +164,12 @@ class SortVisualizer:
         pygame.draw.rect(self.screen, color, self.reset_graph_button)
         text = self.font.render("Réinitialiser graphique", True, TEXT_COLOR)
         self.screen.blit(text, (self.reset_graph_button.x + 10, self.reset_graph_button.y + 10))
+        
+        # Bouton pour changer la distribution des données
+        color = BUTTON_HOVER_COLOR if self.distribution_button.collidepoint(mouse_pos) else BUTTON_COLOR
+        pygame.draw.rect(self.screen, color, self.distribution_button)
+        text = self.small_font.render(f"Données : {LABELS[self.distribution]}", True, TEXT_COLOR)
+        self.screen.blit(text, (self.distribution_button.x + 10, self.distribution_button.y + 12))
     
         # Zone de saisie pour le nombre d'éléments
         input_color = INPUT_ACTIVE_COLOR if self.element_input_active else INPUT_COLOR
@@ -184,119 +192,250 @@ class SortVisualizer:
         self.screen.blit(text, (self.return_button.x + 25, self.return_button.y + 10))
         pygame.display.flip()
 
-    def draw_swap(self, arr, i, j):
-        # Effectuer l'échange et mettre à jour les statistiques
-        arr[i], arr[j] = arr[j], arr[i]
-        self.comparisons += 1
-        self.swaps += 1
-
-        # Mettre à jour le temps d'exécution
-        self.execution_time = (pygame.time.get_ticks() - self.start_ticks) / 1000.0
-
-        # Mettre à jour les stats de mémoire
-        current, peak = tracemalloc.get_traced_memory()
-        self.memory_usage = current / 1024
-        self.peak_memory = max(self.peak_memory, peak / 1024)
-
-        # Si on n'est pas en mode "affichage des résultats", dessiner l'animation
-        if not self.showing_results and not self.showing_graph:
-            self.draw_bars([i, j])
-            
-            # Ralentir légèrement l'animation pour mieux voir les changements
-            pygame.time.delay(1)  # Petit délai pour l'animation
-            
-            # Gérer les événements pendant l'animation pour permettre de quitter
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    exit()
-
     def measure_performance(self, sorting_function, algorithm_name=None, show_animation=True):
         # Réinitialiser les statistiques
         self.comparisons = 0
         self.swaps = 0
+        self.reads = 0
+        self.writes = 0
         self.execution_time = 0  
         self.memory_usage = 0
         self.peak_memory = 0
+        self.auto_decision = None
         
         # Définir si on doit montrer l'animation ou non
         self.showing_results = not show_animation
 
         # Créer une copie des nombres pour ne pas altérer l'original
         numbers_copy = self.numbers.copy()
-        
-        # Démarrer le suivi de la mémoire
-        tracemalloc.start()
-        self.start_ticks = pygame.time.get_ticks()
-        
-        # Exécuter l'algorithme de tri
-        sorting_function(numbers_copy, self.draw_swap)
-        
-        # Si nous sommes en mode animation, mettre à jour les nombres triés
+        name = algorithm_name or self.algorithm_names[self.algorithms.index(sorting_function)]
+        if name == AUTO:
+            # Décision qu'Auto prendra sur ces données (identique pour toutes les passes)
+            self.auto_decision = decide(numbers_copy)
+        
+        # Les passes tournent en arrière-plan : l'interface reste à 60 images/s
+        def measure(task):
+            # Passes 1 à 3 (chronométrage seul, mémoire, comptage exact des
+            # opérations) : chacune dans son processus, sur sa propre copie,
+            # à l'écart du fil de l'interface qui fausserait le chronométrage
+            jobs = [(TIME, name, "current", 0, 0), (MEMORY, name, "current", 0, 0), (COUNT, name, "current", 0, 0)]
+            results = {}
+            finished = 0
+            for job in run_jobs(jobs, {"current": numbers_copy}, len(jobs), self.pin_workers, task.keep_going):
+                results.update(job)
+                finished += 1
+                task.report("progress", (finished, len(jobs)))
+            task.checkpoint()
+            
+            # Passe 4 (animation seulement) : enregistrement des opérations pour
+            # les rejouer ensuite à la vitesse de l'affichage
+            trace = None
+            if show_animation:
+                # Les comparaisons sont enregistrées sur des clés enveloppes, qu'Auto ne reconnaît pas
+                # comme des entiers : la trace rejoue directement l'algorithme qu'il a choisi
+                traced = ALGORITHMS[self.auto_decision["algorithm"]] if self.auto_decision else sorting_function
+                trace = OperationTrace.record(traced, numbers_copy, task.checked_swap())
+            return results, trace
+        
+        task = BackgroundTask(measure)
+        if not self.run_task(task, f"Mesures en cours : {name}"):
+            return None
+        results, trace = task.result
+        elapsed_ns = results["time_ns"]
+        memory = results["memory"]
+        counts = results["counts"]
+        self.execution_time = elapsed_ns / 1e9
+        self.memory_usage = memory["auxiliary"] / 1024
+        self.peak_memory = memory["peak"] / 1024
+        self.comparisons = counts["comparisons"]
+        self.swaps = counts["swaps"]
+        self.reads = counts["reads"]
+        self.writes = counts["writes"]
         if show_animation:
             self.numbers = numbers_copy
 
-        # Calculer le temps total d'exécution
-        self.execution_time = (pygame.time.get_ticks() - self.start_ticks) / 1000.0
-        
-        # Obtenir l'utilisation finale de la mémoire
-        current, peak = tracemalloc.get_traced_memory()
-        self.memory_usage = current / 1024
-        self.peak_memory = peak / 1024
-        
-        # Arrêter le suivi de la mémoire
-        tracemalloc.stop()
-
         # Enregistrer les résultats si un nom d'algorithme est spécifié
         if algorithm_name:
             self.current_results[algorithm_name] = {
                 "time": self.execution_time,
-                "memory": self.peak_memory,
+                "memory": self.memory_usage,
                 "comparisons": self.comparisons,
-                "swaps": self.swaps
+                "swaps": self.swaps,
+                "reads": self.reads,
+                "writes": self.writes,
+                "allocations": counts["allocations"]
             }
             
             # Enregistrer les données pour le graphique
-            if algorithm_name in self.performance_data:
-                # Vérifier si cette taille existe déjà dans les données
-                if self.element_count in self.performance_data[algorithm_name]['sizes']:
-                    # Mettre à jour le temps pour cette taille
-                    index = self.performance_data[algorithm_name]['sizes'].index(self.element_count)
-                    self.performance_data[algorithm_name]['times'][index] = self.execution_time
-                else:
-                    # Ajouter la nouvelle taille et son temps
-                    self.performance_data[algorithm_name]['sizes'].append(self.element_count)
-                    self.performance_data[algorithm_name]['times'].append(self.execution_time)
-
-        # Afficher une dernière image des barres triées si en mode animation
+            self.record_performance(algorithm_name, self.element_count, [elapsed_ns], self.distribution)
+
+        # Rejouer l'animation à partir de la trace enregistrée
         if show_animation:
-            self.draw_bars()
+            self.replay_trace(trace)
             
         # Afficher dans le terminal
-        print(f"{algorithm_name if algorithm_name else 'Algorithme'} - Temps: {self.execution_time:.6f}s | Mémoire: {self.peak_memory:.2f} KB | Comparaisons: {self.comparisons} | Échanges: {self.swaps}")
+        print(f"{algorithm_name if algorithm_name else 'Algorithme'} - Temps: {self.execution_time:.6f}s | Mémoire auxiliaire: {self.memory_usage:.2f} KB (pic {self.peak_memory:.2f} KB) | Comparaisons: {self.comparisons} | Échanges: {self.swaps}")
         
         return self.execution_time
 
+    def record_performance(self, algorithm_name, size, times_ns, distribution="uniform"):
+        """Ajoute une exécution (toutes ses répétitions, en ns) au stockage persistant"""
+        self.results_store.append(algorithm_name, size, times_ns, distribution)
+        self.graph_surface = None  # Les graphiques devront être régénérés
+        self.heatmap_surface = None
+
+    def run_task(self, task, title, on_event=None):
+        """Exécute une BackgroundTask en gardant l'interface à 60 images/s.
+
+        Les événements envoyés par la tâche sont transmis à on_event(kind,
+        value), dans le fil de l'interface. Espace : pause/reprise, Échap :
+        annuler. Renvoie False si la tâche a été annulée.
+        """
+        progress = None
+        operations = 0
+        started = time.perf_counter()
+        task.start()
+        while not task.finished:
+            for kind, value in task.poll():
+                if kind == "progress":
+                    progress = value
+                elif kind == "operations":
+                    operations = value
+                if on_event is not None:
+                    on_event(kind, value)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    task.cancel()
+                    pygame.quit()
+                    exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_ESCAPE:
+                        task.cancel()
+                    elif event.key == pygame.K_SPACE:
+                        if task.paused:
+                            task.resume()
+                        else:
+                            task.pause()
+            self.draw_task_progress(title, progress, operations, task.paused, time.perf_counter() - started)
+            self.clock.tick(60)
+        return not task.cancelled
+
+    def draw_task_progress(self, title, progress, operations, paused, elapsed):
+        """Écran d'attente d'une tâche : titre, barre de progression, opérations, durée"""
+        self.screen.fill(BG_COLOR)
+        text = self.font.render(title, True, TEXT_COLOR)
+        self.screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 - 60))
+        bar = pygame.Rect(WIDTH // 2 - 200, HEIGHT // 2 - 20, 400, 24)
+        pygame.draw.rect(self.screen, INPUT_COLOR, bar)
+        if progress and progress[1]:
+            done, total = progress
+            pygame.draw.rect(self.screen, BAR_COLOR, (bar.x, bar.y, bar.width * done // total, bar.height))
+            label = self.small_font.render(f"{done}/{total}", True, TEXT_COLOR)
+            self.screen.blit(label, (bar.centerx - label.get_width() // 2, bar.y + 3))
+        pygame.draw.rect(self.screen, INPUT_BORDER_COLOR, bar, 2)
+        status = f"Durée : {elapsed:.1f} s"
+        if operations:
+            status += f" | Opérations enregistrées : {operations}"
+        if paused:
+            status += " | En pause"
+        text = self.small_font.render(status, True, TEXT_COLOR)
+        self.screen.blit(text, (WIDTH // 2 - text.get_width() // 2, HEIGHT // 2 + 20))
+        hint = self.small_font.render("Espace : pause/reprise | Échap : annuler", True, TEXT_COLOR)
+        self.screen.blit(hint, (WIDTH // 2 - hint.get_width() // 2, HEIGHT // 2 + 50))
+        pygame.display.flip()
+
+    def replay_trace(self, trace):
+        """Rejoue une trace d'opérations avec contrôle de la lecture.
+
+        Espace : pause, flèches gauche/droite : reculer/avancer d'une image,
+        flèches haut/bas : accélérer/ralentir, Entrée : aller à la fin.
+        """
+        if self.headless:
+            return
+        player = TracePlayer(trace)
+        renderer = self.renderer
+
+        def stats_lines():
+            return self.stats_lines() + [f"Opération {player.position}/{len(trace)}"]
+
+        renderer.start(player.array, stats_lines, total_operations=len(trace))
+        ops_per_frame = renderer.ops_per_frame_hint
+        paused = False
+        while True:
+            step = 0 if paused else ops_per_frame
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    exit()
+                elif event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_SPACE:
+                        paused = not paused
+                    elif event.key == pygame.K_RIGHT:
+                        step = ops_per_frame
+                    elif event.key == pygame.K_LEFT:
+                        step = -ops_per_frame
+                    elif event.key == pygame.K_UP:
+                        ops_per_frame *= 2
+                    elif event.key == pygame.K_DOWN:
+                        ops_per_frame = max(1, ops_per_frame // 2)
+                    elif event.key == pygame.K_RETURN:
+                        player.seek(len(trace))
+            if step:
+                player.advance(step, renderer.mark)
+            if player.at_end and not paused:
+                break
+            renderer.present()
+            self.clock.tick(renderer.target_fps)
+        renderer.finish()
+
     def run_all_algorithms(self):
         self.showing_results = True
         self.current_results = {}
         
-        # Sauvegarde des nombres originaux
-        original_numbers = self.numbers.copy()
-        
-        for i, algorithm in enumerate(self.algorithms):
-            # Réinitialiser les nombres à chaque tri
-            self.numbers = original_numbers.copy()
-            self.measure_performance(algorithm, self.algorithm_names[i], False)
-            
-            # Petit délai entre chaque algorithme
-            time.sleep(0.1)
+        # Les trois passes (temps, mémoire, comptage) de chaque algorithme sont
+        # des travaux indépendants, répartis sur le pool de processus
+        jobs = []
+        for name in self.algorithm_names:
+            jobs += [(TIME, name, "current", 0, 0), (MEMORY, name, "current", 0, 0), (COUNT, name, "current", 0, 0)]
+        partial = {name: {} for name in self.algorithm_names}
+        
+        # Le pool est piloté depuis un fil secondaire ; chaque résultat revient par la file
+        def run_all(task):
+            finished = 0
+            for job in run_jobs(jobs, {"current": self.numbers}, self.parallel_workers, self.pin_workers,
+                                task.keep_going):
+                finished += 1
+                task.report("progress", (finished, len(jobs)))
+                task.report("job", job)
+            task.checkpoint()
+        
+        def on_event(kind, job):
+            if kind != "job":
+                return
+            name = job["algorithm"]
+            partial[name].update(job)
+            if not {"time_ns", "memory", "counts"} <= partial[name].keys():
+                return
+            result = partial[name]
+            execution_time = result["time_ns"] / 1e9
+            self.current_results[name] = dict(
+                result["counts"],
+                time=execution_time,
+                memory=result["memory"]["auxiliary"] / 1024,
+            )
+            self.record_performance(name, self.element_count, [result["time_ns"]], self.distribution)
+            print(f"{name} - Temps: {execution_time:.6f}s | Mémoire auxiliaire: {self.current_results[name]['memory']:.2f} KB"
+                  f" | Comparaisons: {result['counts']['comparisons']} | Échanges: {result['counts']['swaps']}")
+        
+        # En cas d'annulation, seuls les algorithmes terminés sont classés
+        self.run_task(BackgroundTask(run_all), f"Tris en cours sur {self.parallel_workers} processus", on_event)
         
         # Afficher les résultats
         self.display_results()
 
     def display_results(self):
-        running = True
+        # Sans fenêtre, rien à afficher ni à attendre
+        running = not self.headless
         
         # Trier les résultats par temps d'exécution et utilisation mémoire
         time_ranking = sorted(self.current_results.items(), key=lambda x: x[1]["time"])
@@ -345,89 +484,212 @@ class SortVisualizer:
                         
             self.clock.tick(60)
 
-    def generate_performance_graph(self):
-        # Création de la figure matplotlib
-        fig = Figure(figsize=(8, 5))
-        canvas = FigureCanvasAgg(fig)
-        ax = fig.add_subplot(111)
-
-        ax.set_title("Temps d'exécution des algorithmes de tri selon la taille des données")
-        ax.set_xlabel("Nombre de données (échelle log)")
-        ax.set_ylabel("Temps d'exécution (s) (échelle log)")
-        ax.grid(True)
-    
-        # Configurer les échelles logarithmiques
-        ax.set_xscale('log')
-        ax.set_yscale('log')
-
-        colors = ['b', 'orange', 'g', 'r', 'c', 'purple', 'pink']
-
-        # Garder une trace des algorithmes avec des données
-        has_data = False
-
-        for i, (algo_name, data) in enumerate(self.performance_data.items()):
-            if data['sizes'] and data['times']:
-                print(f"{algo_name}: sizes = {data['sizes']}, times = {data['times']}")
-            
-                # Trier les données par taille pour le tracé
-                sorted_pairs = sorted(zip(data['sizes'], data['times']))
-                sizes, times = zip(*sorted_pairs) if sorted_pairs else ([], [])
-            
-                if sizes and times:
-                    has_data = True
-                    # Tracer la ligne et les points
-                    ax.plot(sizes, times, 
-                           label=self.translate_algo_name(algo_name),
-                           marker='o', 
-                           color=colors[i % len(colors)],
-                           linewidth=2,
-                           markersize=8)  # Augmenter la taille des points
-                
-                     # Annoter chaque point avec la taille
-                    for x, y in zip(sizes, times):
-                        # Seulement ajouter des annotations si le nombre de points est limité
-                        if len(sizes) <= 10:
-                            ax.annotate(f"{x}", 
-                                        xy=(x, y), 
-                                       xytext=(5, 5),
-                                       textcoords='offset points', 
-                                       fontsize=8,
-                                       bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8))
-
-        # Si aucune donnée n'est disponible, ajouter un message
-        if not has_data:
-            ax.text(0.5, 0.5, "Aucune donnée disponible.\nLancez d'abord des benchmarks!", 
-                   ha='center', va='center', transform=ax.transAxes, fontsize=14)
-        
-        ax.legend(loc='upper left')
-        fig.tight_layout()
+    def performance_figure(self):
+        """Figure des courbes (et ses axes), créée au premier graphique puis réutilisée"""
+        if self.graph_figure is None:
+            # matplotlib n'est chargé qu'au premier graphique (démarrage plus rapide)
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            fig = Figure(figsize=(8, 5))
+            canvas = FigureCanvasAgg(fig)
+            ax = fig.add_subplot(111)
+
+            ax.set_title("Temps d'exécution des algorithmes de tri selon la taille des données")
+            ax.set_xlabel("Nombre de données (échelle log)")
+            ax.set_ylabel("Temps d'exécution (s) (échelle log)")
+            ax.grid(True)
+
+            # Configurer les échelles logarithmiques
+            ax.set_xscale('log')
+            ax.set_yscale('log')
+
+            # Message affiché tant qu'aucune série n'a de données
+            empty_text = ax.text(0.5, 0.5, "Aucune donnée disponible.\nLancez d'abord des benchmarks!",
+                                 ha='center', va='center', transform=ax.transAxes, fontsize=14)
+            self.graph_figure = (fig, canvas, ax, empty_text)
+            self.graph_series = {}
+        return self.graph_figure
 
+    def generate_performance_graph(self):
+        """Met à jour le graphique des courbes et sa surface Pygame.
+
+        La figure et la ligne de chaque algorithme sont conservées d'un appel
+        à l'autre : seules les séries dont les points ont changé sont
+        retracées, les autres gardent leurs artistes matplotlib.
+        """
+        fig, canvas, ax, empty_text = self.performance_figure()
+        colors = ['b', 'orange', 'g', 'r', 'c', 'purple', 'pink', 'brown', 'olive', 'gray', 'navy', 'teal', 'gold', 'crimson', 'black', 'lime', 'indigo']
+
+        # Médiane et intervalle de confiance de toutes les sessions, triés par taille
+        all_points = {name: self.results_store.series(name) for name in self.algorithm_names}
+        largest_size = max((points[-1][0] for points in all_points.values() if points), default=0)
+
+        changed = False
+        for i, algo_name in enumerate(self.algorithm_names):
+            points = all_points[algo_name]
+            # L'extrapolation dépend aussi de la plus grande taille tous algorithmes confondus
+            key = (points, largest_size)
+            series = self.graph_series.get(algo_name)
+            if series is not None and series["key"] == key:
+                continue
+            changed = True
+            if series is not None:
+                for artist in series["artists"]:
+                    artist.remove()
+                series["artists"] = []
+            if not points:
+                if series is not None:
+                    series["line"].set_visible(False)
+                    series["extrapolation"].set_visible(False)
+                    series["key"] = key
+                continue
+
+            sizes, times, lows, highs = zip(*points)
+            print(f"{algo_name}: sizes = {list(sizes)}, medians = {list(times)}")
+            color = colors[i % len(colors)]
+            label = self.translate_algo_name(algo_name)
+
+            # Pente empirique de croissance (log-log) sur les plus grandes tailles
+            fit = None
+            if len(sizes) >= 2:
+                fit = fit_power_law(sizes[-FIT_POINTS:], times[-FIT_POINTS:])
+                label += f" (n^{fit[0]:.2f})"
+
+            # La ligne et les points sont créés une fois, puis seulement mis à jour
+            if series is None:
+                line, = ax.plot([], [], marker='o', color=color, linewidth=2,
+                                markersize=8)  # Augmenter la taille des points
+                extrapolation, = ax.plot([], [], linestyle='--', color=color, linewidth=1)
+                series = self.graph_series[algo_name] = {"line": line, "extrapolation": extrapolation,
+                                                         "artists": []}
+            series["key"] = key
+            series["line"].set_data(sizes, times)
+            series["line"].set_label(label)
+            series["line"].set_visible(True)
+            series["limits"] = list(zip(sizes, lows)) + list(zip(sizes, highs))
+            artists = series["artists"]
+
+            # Bande de confiance (~95 %) autour de la médiane
+            artists.append(ax.fill_between(sizes, lows, highs, color=color, alpha=0.2))
+
+            # Extrapolation (pointillés) jusqu'à la plus grande taille mesurée tous algorithmes confondus
+            extrapolate = bool(fit) and sizes[-1] < largest_size
+            series["extrapolation"].set_visible(extrapolate)
+            if extrapolate:
+                exponent, coefficient = fit
+                steps = 8
+                ratio = (largest_size / sizes[-1]) ** (1 / steps)
+                extra_sizes = [sizes[-1] * ratio ** k for k in range(steps + 1)]
+                extra_times = [coefficient * size ** exponent for size in extra_sizes]
+                series["extrapolation"].set_data(extra_sizes, extra_times)
+                artists.append(ax.annotate(f"≈{extra_times[-1]:.3g}s", xy=(extra_sizes[-1], extra_times[-1]),
+                                           xytext=(5, 0), textcoords='offset points', fontsize=7, color=color))
+
+            # Annoter chaque point avec la taille, seulement si le nombre de points est limité
+            if len(sizes) <= 10:
+                for x, y in zip(sizes, times):
+                    artists.append(ax.annotate(f"{x}",
+                                               xy=(x, y),
+                                               xytext=(5, 5),
+                                               textcoords='offset points',
+                                               fontsize=8,
+                                               bbox=dict(boxstyle="round,pad=0.3", fc="white", ec="gray", alpha=0.8)))
+
+        if changed or self.graph_surface is None:
+            visible = [series for series in self.graph_series.values() if series["line"].get_visible()]
+            empty_text.set_visible(not visible)
+            # Limites des axes recalculées à partir des lignes et des bandes de confiance
+            ax.relim(visible_only=True)
+            for series in visible:
+                ax.update_datalim(series["limits"])
+            ax.autoscale_view()
+            if visible:
+                ax.legend(handles=[series["line"] for series in visible], loc='upper left')
+            elif ax.get_legend() is not None:
+                ax.get_legend().remove()
+            fig.tight_layout()
+            self.graph_image = self.figure_to_surface(fig, canvas)
+        self.graph_surface = self.graph_image
+
+    def figure_to_surface(self, fig, canvas):
+        """Dessine la figure matplotlib et la convertit en surface Pygame à la taille de l'écran"""
         # Dessine la figure
         canvas.draw()
 
-    # Obtenir les données d'image RGBA
-        raw_data = canvas.buffer_rgba()
+        # Le tampon RGBA de Agg est lu directement, sans transposition ni copie NumPy
         size = canvas.get_width_height()
+        surface = pygame.image.frombuffer(canvas.buffer_rgba(), size, "RGBA")
 
-    # Conversion en tableau numpy
-        image_array = np.frombuffer(raw_data, dtype=np.uint8).reshape((size[1], size[0], 4))
-        image_array = image_array[:, :, :3]  # Supprimer le canal alpha
-
-    # Transposer et convertir en surface Pygame
-        self.graph_surface = pygame.surfarray.make_surface(np.transpose(image_array, (1, 0, 2)))
-
-    # Redimensionner pour s'adapter à l'écran si nécessaire
+        # Redimensionner pour s'adapter à l'écran si nécessaire
         max_width = WIDTH - 40
         max_height = HEIGHT - 100
-        ratio = min(max_width / self.graph_surface.get_width(), max_height / self.graph_surface.get_height())
-    
+        ratio = min(max_width / surface.get_width(), max_height / surface.get_height())
+
+        # La surface renvoyée ne doit pas dépendre du tampon, réutilisé au prochain dessin
         if ratio < 1:
-            new_size = (int(self.graph_surface.get_width() * ratio), 
-                        int(self.graph_surface.get_height() * ratio))
-            self.graph_surface = pygame.transform.scale(self.graph_surface, new_size)
+            new_size = (int(surface.get_width() * ratio),
+                        int(surface.get_height() * ratio))
+            return pygame.transform.scale(surface, new_size)
+        return surface.copy()
 
-    # Enregistrement en image
-        fig.savefig("tri_performance.png")
+    def export_graphs(self):
+        """Enregistre les graphiques en PNG (uniquement sur demande, jamais à chaque rendu)"""
+        if self.graph_surface is None:
+            self.generate_performance_graph()
+        if self.heatmap_surface is None:
+            self.generate_heatmap()
+        self.graph_figure[0].savefig(PERFORMANCE_GRAPH_PATH)
+        self.heatmap_figure.savefig(HEATMAP_PATH)
+        print(f"Graphiques enregistrés : {PERFORMANCE_GRAPH_PATH}, {HEATMAP_PATH}")
+
+    def generate_heatmap(self):
+        """Carte de chaleur algorithme × distribution.
+
+        Chaque case compare le temps médian sur une distribution au temps
+        médian sur des données aléatoires, pour la plus grande taille mesurée
+        sur toutes les distributions par cet algorithme.
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 5))
+        canvas = FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.set_title("Temps relatif selon la distribution des données (référence : aléatoire)")
+
+        distributions = list(DISTRIBUTIONS)
+        rows = []
+        row_labels = []
+        for algo_name in self.algorithm_names:
+            by_distribution = [self.results_store.times_by_size(algo_name, d) for d in distributions]
+            common_sizes = set.intersection(*(set(times) for times in by_distribution))
+            if not common_sizes:
+                continue
+            size = max(common_sizes)
+            medians = np.array([np.median(times[size]) for times in by_distribution])
+            rows.append(medians / medians[distributions.index("uniform")])
+            row_labels.append(f"{self.translate_algo_name(algo_name)} (n={size})")
+
+        if rows:
+            ratios = np.array(rows)
+            log_ratios = np.log2(ratios)
+            limit = max(1.0, np.abs(log_ratios).max())
+            image = ax.imshow(log_ratios, cmap="RdYlGn_r", vmin=-limit, vmax=limit, aspect="auto")
+            fig.colorbar(image, ax=ax, label="log2(temps / temps aléatoire)")
+            for row, column in np.ndindex(ratios.shape):
+                ax.text(column, row, f"×{ratios[row, column]:.2g}", ha="center", va="center", fontsize=7)
+            ax.set_xticks(range(len(distributions)))
+            ax.set_xticklabels([LABELS[d] for d in distributions], rotation=30, ha="right", fontsize=8)
+            ax.set_yticks(range(len(row_labels)))
+            ax.set_yticklabels(row_labels, fontsize=8)
+        else:
+            ax.set_axis_off()
+            ax.text(0.5, 0.5, "Aucune donnée disponible.\nLancez d'abord des benchmarks!",
+                    ha='center', va='center', transform=ax.transAxes, fontsize=14)
+        fig.tight_layout()
+        self.heatmap_surface = self.figure_to_surface(fig, canvas)
+        self.heatmap_figure = fig
 
     def translate_algo_name(self, name):
         """Traduit les noms d'algorithmes en français pour le graphique"""
@@ -436,53 +698,59 @@ class SortVisualizer:
             "Bubble Sort": "Tri à bulles",
             "Insertion Sort": "Tri par insertion",
             "Merge Sort": "Tri par fusion",
+            "Bottom-Up Merge Sort": "Tri par fusion ascendant",
             "Quick Sort": "Tri rapide",
             "Heap Sort": "Tri par tas",
-            "Comb Sort": "Tri à peigne"
+            "Comb Sort": "Tri à peigne",
+            "Radix Sort": "Tri par base",
+            "Counting Sort": "Tri par dénombrement",
+            "External Merge Sort": "Tri externe",
+            "Parallel Merge Sort": "Tri par fusion parallèle",
+            "Sample Sort": "Tri par échantillonnage",
+            "Natural Merge Sort": "Tri par fusion naturelle",
+            "Auto": "Auto (choix adaptatif)",
+            "Odd-Even Sort": "Tri pair-impair (réseau)",
+            "Bitonic Sort": "Tri bitonique (réseau)"
         }
         return translations.get(name, name)
 
     def run_benchmark_tests(self):
-        """Exécute des tests de performance sur différentes tailles d'entrée"""
-        test_sizes = [30, 100, 300, 500, 1000]  # Différentes tailles à tester
-        
-        # Sauvegarde de la valeur actuelle
-        original_count = self.element_count
-        original_numbers = self.numbers.copy()
-        
-        # Message de démarrage des benchmarks
-        self.screen.fill(BG_COLOR)
-        running_text = self.font.render("Exécution des benchmarks en cours...", True, TEXT_COLOR)
-        self.screen.blit(running_text, (WIDTH // 2 - running_text.get_width() // 2, HEIGHT // 2))
-        pygame.display.flip()
+        """Exécute des tests de performance sur différentes tailles d'entrée.
+
+        Pour chaque algorithme et chaque distribution, la taille double tant
+        que son budget de temps le permet : les tris quadratiques s'arrêtent
+        tôt, les autres montent beaucoup plus haut. Les points en cache
+        (même code, taille, distribution et graine) ne sont pas remesurés.
+        """
+        total = len(self.algorithm_names) * len(DISTRIBUTIONS)
         
-        # Exécuter les tests pour chaque taille
-        for size in test_sizes:
-            self.element_count = size
-            self.generate_numbers()
+        def run_sweeps(task):
+            finished = 0
             
-            test_numbers = self.numbers.copy()
+            def on_result(sweep):
+                nonlocal finished
+                finished += 1
+                task.report("progress", (finished, total))
+                task.report("sweep", sweep)
             
-            # Exécuter chaque algorithme
-            for i, algorithm in enumerate(self.algorithms):
-                # Afficher la progression
-                self.screen.fill(BG_COLOR)
-                progress_text = self.font.render(f"Test: {self.algorithm_names[i]} - Taille: {size}", True, TEXT_COLOR)
-                self.screen.blit(progress_text, (WIDTH // 2 - progress_text.get_width() // 2, HEIGHT // 2))
-                pygame.display.flip()
-                
-                self.numbers = test_numbers.copy()
-                self.measure_performance(algorithm, self.algorithm_names[i], False)
-                
-                # Gérer les événements pour éviter que l'application ne semble bloquée
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        exit()
-        
-        # Restaurer la taille et les données originales
-        self.element_count = original_count
-        self.numbers = original_numbers
+            run_parallel_sweeps(self.algorithm_names, self.benchmark_budget, seed=self.benchmark_seed,
+                                workers=self.parallel_workers, pin=self.pin_workers,
+                                on_result=on_result, idle=task.keep_going, distributions=list(DISTRIBUTIONS),
+                                cache=self.benchmark_cache)
+            task.checkpoint()
+        
+        # Chaque balayage terminé est ajouté aux données des graphiques. Un point repris du cache
+        # n'y est ajouté que s'il manque (cache rempli par main_benchmark.py sans --store, par exemple)
+        def on_event(kind, sweep):
+            if kind == "sweep":
+                for point in sweep["points"]:
+                    if point.get("cached") and point["size"] in self.results_store.times_by_size(
+                            sweep["algorithm"], sweep["distribution"]):
+                        continue
+                    self.record_performance(sweep["algorithm"], point["size"], point["times_ns"],
+                                            sweep["distribution"])
+        
+        self.run_task(BackgroundTask(run_sweeps), f"Benchmarks sur {self.parallel_workers} processus", on_event)
         
         # Régénérer le graphique avec les nouvelles données
         self.graph_surface = None
@@ -492,8 +760,13 @@ class SortVisualizer:
         self.display_graph()
     def reset_performance_data(self):
         """Réinitialise toutes les données de performance pour le graphique"""
-        self.performance_data = {name: {'sizes': [], 'times': []} for name in self.algorithm_names}
-        self.graph_surface = None  # Forcer la régénération du graphique
+        # Le fichier de résultats est archivé (renommé), pas effacé
+        self.results_store.archive()
+        # Sans cache, le prochain benchmark remesure tout et repeuple les graphiques
+        self.benchmark_cache.clear()
+        self.graph_surface = None  # Forcer la régénération des graphiques
+        self.heatmap_surface = None
+        self.graph_figure = None  # Les courbes repartent d'une figure vide
     
         # Afficher un message de confirmation
         self.screen.fill(BG_COLOR)
@@ -503,24 +776,46 @@ class SortVisualizer:
         pygame.time.delay(1000)  # Afficher le message pendant 1 seconde
 
     def display_graph(self):
+        if self.headless:
+            # Sans fenêtre : les graphiques sont seulement générés et enregistrés
+            self.export_graphs()
+            return
         running = True
         self.showing_graph = True
         
-        # Générer le graphique si ce n'est pas déjà fait
-        if self.graph_surface is None:
-            self.generate_performance_graph()
-        
         while running:
+            # Générer la vue affichée si ce n'est pas déjà fait
+            if self.showing_heatmap:
+                if self.heatmap_surface is None:
+                    self.generate_heatmap()
+                surface = self.heatmap_surface
+            else:
+                if self.graph_surface is None:
+                    self.generate_performance_graph()
+                surface = self.graph_surface
+            
             self.screen.fill(BG_COLOR)
             
             # Calculer la position pour centrer le graphique
-            graph_rect = self.graph_surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
+            graph_rect = surface.get_rect(center=(WIDTH // 2, HEIGHT // 2 - 30))
             
             # Afficher le graphique
-            self.screen.blit(self.graph_surface, graph_rect)
+            self.screen.blit(surface, graph_rect)
             
-            # Bouton retour
+            # Bouton de bascule courbes / carte de chaleur
             mouse_pos = pygame.mouse.get_pos()
+            color = BUTTON_HOVER_COLOR if self.heatmap_button.collidepoint(mouse_pos) else BUTTON_COLOR
+            pygame.draw.rect(self.screen, color, self.heatmap_button)
+            text = self.font.render("Courbes" if self.showing_heatmap else "Carte de chaleur", True, TEXT_COLOR)
+            self.screen.blit(text, (self.heatmap_button.x + 25, self.heatmap_button.y + 10))
+            
+            # Bouton d'export PNG
+            color = BUTTON_HOVER_COLOR if self.export_button.collidepoint(mouse_pos) else BUTTON_COLOR
+            pygame.draw.rect(self.screen, color, self.export_button)
+            text = self.font.render("Exporter en PNG", True, TEXT_COLOR)
+            self.screen.blit(text, (self.export_button.x + 25, self.export_button.y + 10))
+            
+            # Bouton retour
             color = BUTTON_HOVER_COLOR if self.return_button.collidepoint(mouse_pos) else BUTTON_COLOR
             pygame.draw.rect(self.screen, color, self.return_button)
             text = self.font.render("Retour au menu", True, TEXT_COLOR)
@@ -536,6 +831,10 @@ class SortVisualizer:
                     if self.return_button.collidepoint(event.pos):
                         running = False
                         self.showing_graph = False
+                    elif self.heatmap_button.collidepoint(event.pos):
+                        self.showing_heatmap = not self.showing_heatmap
+                    elif self.export_button.collidepoint(event.pos):
+                        self.export_graphs()
                         
             self.clock.tick(60)
 
@@ -567,6 +866,12 @@ class SortVisualizer:
                         # Vérifier le bouton "Réinitialiser graphique"
                         elif self.reset_graph_button.collidepoint(event.pos):
                             self.reset_performance_data()    
+                        
+                        # Passer à la distribution suivante
+                        elif self.distribution_button.collidepoint(event.pos):
+                            names = list(DISTRIBUTIONS)
+                            self.distribution = names[(names.index(self.distribution) + 1) % len(names)]
+                            self.generate_numbers()
                         else:
                             if self.element_input_active:
                                 self.element_input_active = False
@@ -582,7 +887,8 @@ class SortVisualizer:
                                     self.algorithm_names[i], 
                                     True
                                 )
-                                show_menu = False
+                                # Mesure annulée : on reste sur le menu
+                                show_menu = execution_time is None
                                 break
                         
                         # Vérifier le bouton "Lancer tous les tris"